@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark aircraft.json decoding.
+
+Builds an aircraft.json of about --size-mb from synthetic traffic and times
+the full-dict decode the tracker used to do (json.loads, then per-field
+lookups and float conversion) against the selective decoder with each
+available JSON backend. Peak traced allocation per decode is reported too.
+
+Usage:
+    python3 benchmarks/bench_decoder.py --size-mb 2 --repeat 30
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import go_around_tracker as tracker  # noqa: E402
+from traffic import TrafficGenerator  # noqa: E402
+
+
+def to_float(value):
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def legacy_decode(raw: bytes) -> list:
+    """The pre-decoder path: parse everything, then pick fields out of each dict."""
+    data = json.loads(raw)
+    rows = []
+    for ac_data in data.get('aircraft', data.get('ac', [])):
+        if not ac_data.get('hex') or ac_data.get('lat') is None or ac_data.get('lon') is None:
+            continue
+        rows.append((
+            ac_data['hex'],
+            ac_data.get('flight', ac_data['hex']).strip(),
+            float(ac_data['lat']),
+            float(ac_data['lon']),
+            to_float(ac_data.get('alt_baro') or ac_data.get('alt_geom')),
+            to_float(ac_data.get('baro_rate') or ac_data.get('vert_rate')),
+            to_float(ac_data.get('gs')),
+            ac_data.get('t'),
+            ac_data.get('category'),
+            ac_data.get('seen_pos')
+        ))
+    return rows
+
+
+def build_payload(size_mb: float) -> bytes:
+    """An aircraft.json of roughly size_mb megabytes."""
+    per_aircraft = len(TrafficGenerator(50).snapshot_bytes()) / 50
+    count = max(1, int(size_mb * 1024 * 1024 / per_aircraft))
+    return TrafficGenerator(count).snapshot_bytes()
+
+
+def measure(decode, raw: bytes, repeat: int) -> dict:
+    """Timing and peak allocation of decode(raw)."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(raw)
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    decode(raw)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'mean_ms': round(statistics.fmean(samples), 2),
+        'best_ms': round(min(samples), 2),
+        'peak_alloc_kb': round(peak / 1024)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size-mb', type=float, default=2.0, help='Approximate aircraft.json size')
+    parser.add_argument('--repeat', type=int, default=30, help='Timed decodes per decoder')
+    args = parser.parse_args()
+
+    raw = build_payload(args.size_mb)
+    decoders = {
+        'legacy (json, full dicts)': legacy_decode,
+        'selective (json)': lambda payload: tracker.extract_snapshot(json.loads(payload)),
+    }
+    if tracker.orjson is not None:
+        decoders['selective (orjson)'] = lambda payload: tracker.extract_snapshot(tracker.orjson.loads(payload))
+
+    aircraft = len(tracker.JSONFeedDecoder().decode(raw).aircraft)
+    print(f"payload: {len(raw) / 1024 / 1024:.2f} MB, {aircraft} aircraft")
+    print(f"{'decoder':<28} {'mean ms':>9} {'best ms':>9} {'peak KB':>9}")
+    for name, decode in decoders.items():
+        result = measure(decode, raw, args.repeat)
+        print(f"{name:<28} {result['mean_ms']:>9.2f} {result['best_ms']:>9.2f} {result['peak_alloc_kb']:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Detection benchmark: scalar vs incremental vs batch detectors.
+
+Builds N aircraft with synthetic approach / go-around / cruise paths, checks
+that every detector agrees with the scalar reference, then times one poll's
+worth of detection for each implementation.
+
+Usage: python3 benchmarks/bench_detection.py [--sizes 100,1000,10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from go_around_tracker import (  # noqa: E402
+    Aircraft,
+    BatchGoAroundDetector,
+    GoAroundDetector,
+    IncrementalGoAroundDetector,
+)
+
+
+def build_fleet(count: int, detector: GoAroundDetector, seed: int = 42) -> list:
+    """Build aircraft with 120-point paths at a 5 s interval."""
+    rng = random.Random(seed)
+    fleet = []
+    for i in range(count):
+        aircraft = Aircraft(hex_id=f"{i:06x}", callsign=f"TST{i}")
+        profile = rng.choices(('cruise', 'approach', 'go_around'), weights=(60, 38, 2))[0]
+        altitude = rng.uniform(30000, 38000) if profile == 'cruise' else rng.uniform(3000, 5000)
+        go_around_at = rng.randint(80, 115)
+        for step in range(120):
+            if profile == 'cruise':
+                vert_rate = rng.uniform(-64, 64)
+            elif profile == 'go_around' and step >= go_around_at:
+                vert_rate = rng.uniform(1200, 2500)
+            else:
+                vert_rate = rng.uniform(-900, -600)
+            altitude = max(altitude + vert_rate / 12, 100)
+            aircraft.path.append(
+                lat=0.0, lon=0.0, timestamp=1000.0 + step * 5,
+                altitude=round(altitude / 25) * 25, speed=140.0, vert_rate=vert_rate
+            )
+            detector.observe(aircraft)
+        fleet.append(aircraft)
+    return fleet
+
+
+def time_call(func, repeat: int) -> float:
+    """Return the best wall time in milliseconds over several runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='100,1000,10000', help='Comma separated fleet sizes')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    scalar = GoAroundDetector()
+    incremental = IncrementalGoAroundDetector()
+    batch = BatchGoAroundDetector()
+
+    print(f"{'aircraft':>9} {'scalar ms':>10} {'incr ms':>10} {'batch ms':>10} {'go-arounds':>11}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        fleet = build_fleet(size, incremental)
+
+        # Cross-check against the scalar reference before timing anything
+        reference = scalar.detect_batch(fleet)
+        assert incremental.detect_batch(fleet) == reference, 'incremental detector disagrees with scalar'
+        assert batch.detect_batch(fleet) == reference, 'batch detector disagrees with scalar'
+
+        scalar_ms = time_call(lambda: scalar.detect_batch(fleet), args.repeat)
+        incremental_ms = time_call(lambda: incremental.detect_batch(fleet), args.repeat)
+        batch_ms = time_call(lambda: batch.detect_batch(fleet), args.repeat)
+        print(f"{size:>9} {scalar_ms:>10.2f} {incremental_ms:>10.2f} {batch_ms:>10.2f} {len(reference):>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare feed formats: aircraft.json vs binCraft.
+
+For each fleet size, encodes the same synthetic snapshot as aircraft.json
+(plain and gzip, as nginx serves it) and binCraft (plain and zstd), checks
+that every decoder yields the same records, then reports bytes on the wire
+and decode time.
+
+Usage:
+    python3 benchmarks/bench_feed_formats.py --aircraft 100,1000,5000
+"""
+
+import argparse
+import gzip
+import math
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import go_around_tracker as tracker  # noqa: E402
+from bincraft import encode_bincraft  # noqa: E402
+from traffic import TrafficGenerator  # noqa: E402
+
+
+def same_records(expected: list, actual: list) -> bool:
+    """Records match field for field; floats within binCraft's fixed-point resolution."""
+    if len(expected) != len(actual):
+        return False
+    for left, right in zip(expected, actual):
+        for a, b in zip(left, right):
+            if isinstance(a, float) and isinstance(b, float):
+                if not math.isclose(a, b, abs_tol=1e-6):
+                    return False
+            elif a != b:
+                return False
+    return True
+
+
+def best_ms(decode, raw: bytes, repeat: int) -> float:
+    """Fastest of ``repeat`` decodes, in milliseconds."""
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(raw)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--aircraft', default='100,1000,5000', help='Comma separated fleet sizes')
+    parser.add_argument('--repeat', type=int, default=20, help='Decodes per measurement (best is reported)')
+    args = parser.parse_args()
+
+    print(f"{'aircraft':>9} {'format':>14} {'bytes':>10} {'decode ms':>10}")
+    for count in (int(c) for c in args.aircraft.split(',')):
+        traffic = TrafficGenerator(count)
+        for _ in range(30):
+            traffic.step()
+        json_raw = traffic.snapshot_bytes()
+        data = tracker.json_loads(json_raw)
+        bincraft_raw = encode_bincraft(data)
+
+        payloads = {
+            'json': (json_raw, tracker.JSONFeedDecoder().decode),
+            'json+gzip': (gzip.compress(json_raw), lambda raw: tracker.JSONFeedDecoder().decode(gzip.decompress(raw))),
+            'bincraft': (bincraft_raw, tracker.BinCraftFeedDecoder().decode),
+        }
+        if tracker.zstandard is not None:
+            payloads['bincraft-zst'] = (
+                tracker.zstandard.ZstdCompressor(level=1).compress(bincraft_raw),
+                tracker.BinCraftFeedDecoder(compressed=True).decode
+            )
+
+        expected = payloads['json'][1](json_raw)
+        for name, (raw, decode) in payloads.items():
+            snapshot = decode(raw)
+            assert same_records(expected.aircraft, snapshot.aircraft), f"{name} decodes differently"
+            assert math.isclose(expected.now, snapshot.now, abs_tol=1e-3), f"{name} decodes 'now' differently"
+            print(f"{count:>9} {name:>14} {len(raw):>10} {best_ms(decode, raw, args.repeat):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Hot-path benchmark for the ingest and detection loop.
+
+Feeds synthetic traffic (benchmarks/traffic.py) through TAR1090Monitor and
+times each stage of a poll separately: decode, aircraft/track updates,
+go-around detection and stale-aircraft cleanup. Every fleet size runs in its
+own subprocess so peak RSS is per size. Results are written as JSON so runs
+can be compared across commits with --compare.
+
+Usage:
+    python3 benchmarks/bench_hot_path.py --aircraft 100,1000,5000 --output run.json
+    python3 benchmarks/bench_hot_path.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import go_around_tracker as tracker  # noqa: E402
+from traffic import TrafficGenerator  # noqa: E402
+
+STAGES = ('decode', 'ingest', 'detect', 'cleanup', 'total')
+
+
+def summarize(samples: list) -> dict:
+    """Mean / median / p95 / max of a list of millisecond timings."""
+    ordered = sorted(samples)
+    return {
+        'mean': round(statistics.fmean(ordered), 4),
+        'p50': round(ordered[len(ordered) // 2], 4),
+        'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        'max': round(ordered[-1], 4)
+    }
+
+
+def run_poll(monitor, clock, raw: bytes, now: float, timings: dict):
+    """Run one poll through the monitor stage by stage, recording milliseconds per stage."""
+    perf = time.perf_counter
+    t0 = perf()
+    snapshot = monitor.sources[0].decoder.decode(raw)
+    t1 = perf()
+    clock.now = now
+    monitor.total_requests += 1
+    updated = monitor.ingest_snapshot(snapshot, now)
+    t2 = perf()
+    monitor.detect_go_arounds(updated)
+    t3 = perf()
+    monitor.cleanup_aircraft(now)
+    t4 = perf()
+    if timings is not None:
+        timings['decode'].append((t1 - t0) * 1000)
+        timings['ingest'].append((t2 - t1) * 1000)
+        timings['detect'].append((t3 - t2) * 1000)
+        timings['cleanup'].append((t4 - t3) * 1000)
+        timings['total'].append((t4 - t0) * 1000)
+
+
+def bench_size(count: int, warmup: int, snapshots: int, alloc_snapshots: int, detector: str, seed: int) -> dict:
+    """Benchmark one fleet size in this process."""
+    traffic = TrafficGenerator(count, seed=seed)
+    clock = tracker.ReplayClock(traffic.now)
+    with tempfile.TemporaryDirectory() as data_dir:
+        monitor = tracker.TAR1090Monitor(
+            'http://benchmark', detector=tracker.DETECTOR_MODES[detector](),
+            data_dir=data_dir, clock=clock
+        )
+
+        # Fill tracks so detection sees realistic window sizes
+        for _ in range(warmup):
+            raw = traffic.snapshot_bytes()
+            run_poll(monitor, clock, raw, traffic.now, None)
+
+        timings = {stage: [] for stage in STAGES}
+        sizes = []
+        for _ in range(snapshots):
+            raw = traffic.snapshot_bytes()
+            sizes.append(len(raw))
+            run_poll(monitor, clock, raw, traffic.now, timings)
+
+        # Allocation profile on a few more polls (tracemalloc slows everything down)
+        peaks = []
+        net_blocks = []
+        tracemalloc.start()
+        for _ in range(alloc_snapshots):
+            raw = traffic.snapshot_bytes()
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+            base_blocks = sys.getallocatedblocks()
+            run_poll(monitor, clock, raw, traffic.now, None)
+            net_blocks.append(sys.getallocatedblocks() - base_blocks)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base_memory)
+        tracemalloc.stop()
+
+        return {
+            'aircraft': count,
+            'snapshot_bytes': int(statistics.fmean(sizes)),
+            'stages_ms': {stage: summarize(samples) for stage, samples in timings.items()},
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'poll_peak_alloc_kb': round(max(peaks) / 1024, 1) if peaks else None,
+            'net_blocks_per_poll': round(statistics.fmean(net_blocks), 1) if net_blocks else None,
+            'tracked_aircraft': len(monitor.aircraft),
+            'go_arounds_detected': monitor.go_arounds_detected_total
+        }
+
+
+def git_commit() -> str:
+    """Current commit of the repository, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(before_path: str, after_path: str):
+    """Print per-stage mean timings of two result files side by side."""
+    with open(before_path) as f:
+        before = {r['aircraft']: r for r in json.load(f)['results']}
+    with open(after_path) as f:
+        after = {r['aircraft']: r for r in json.load(f)['results']}
+
+    print(f"{'aircraft':>9} {'stage':>8} {'before ms':>10} {'after ms':>10} {'change':>8}")
+    for count in sorted(set(before) & set(after)):
+        for stage in STAGES:
+            if stage not in before[count]['stages_ms'] or stage not in after[count]['stages_ms']:
+                continue
+            old = before[count]['stages_ms'][stage]['mean']
+            new = after[count]['stages_ms'][stage]['mean']
+            change = f"{(new - old) / old * 100:+.1f}%" if old else 'n/a'
+            print(f"{count:>9} {stage:>8} {old:>10.3f} {new:>10.3f} {change:>8}")
+        old_rss = before[count]['peak_rss_kb']
+        new_rss = after[count]['peak_rss_kb']
+        print(f"{count:>9} {'rss kb':>8} {old_rss:>10} {new_rss:>10} {(new_rss - old_rss) / old_rss * 100:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ingest and detection hot path')
+    parser.add_argument('--aircraft', default='100,1000,5000', help='Comma separated fleet sizes')
+    parser.add_argument('--warmup', type=int, default=130, help='Polls run before timing starts')
+    parser.add_argument('--snapshots', type=int, default=50, help='Timed polls per fleet size')
+    parser.add_argument('--alloc-snapshots', type=int, default=5, help='Polls profiled with tracemalloc')
+    parser.add_argument('--detector', default='batch', choices=sorted(tracker.DETECTOR_MODES))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write results JSON here instead of stdout')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='Compare two result files')
+    parser.add_argument('--single', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.single:
+        result = bench_size(args.single, args.warmup, args.snapshots, args.alloc_snapshots, args.detector, args.seed)
+        print(json.dumps(result))
+        return
+
+    results = []
+    for count in (int(c) for c in args.aircraft.split(',')):
+        # A fresh interpreter per size keeps peak RSS meaningful
+        child = subprocess.run(
+            [sys.executable, __file__, '--single', str(count), '--warmup', str(args.warmup),
+             '--snapshots', str(args.snapshots), '--alloc-snapshots', str(args.alloc_snapshots),
+             '--detector', args.detector, '--seed', str(args.seed)],
+            capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+        print(f"{count} aircraft: {results[-1]['stages_ms']['total']['mean']:.2f} ms/poll", file=sys.stderr)
+
+    report = {
+        'benchmark': 'hot_path',
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': tracker.np is not None,
+        'json_backend': tracker.JSON_BACKEND,
+        'detector': args.detector,
+        'warmup': args.warmup,
+        'snapshots': args.snapshots,
+        'seed': args.seed,
+        'results': results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
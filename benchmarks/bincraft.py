@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+binCraft encoder for benchmark and replay fixtures.
+
+Writes aircraft.json-shaped dicts (as produced by traffic.py) in readsb's
+binCraft layout: a header record holding ``now`` in milliseconds and the
+record stride, followed by one fixed-size record per aircraft. Only the
+fields go_around_tracker reads (plus seen and registration) are filled in.
+
+Usage:
+    python3 benchmarks/bincraft.py aircraft.json aircraft.binCraft
+"""
+
+import json
+import struct
+import sys
+
+STRIDE = 112
+
+
+def encode_record(ac: dict, stride: int = STRIDE) -> bytes:
+    """One aircraft as a binCraft record."""
+    record = bytearray(stride)
+    hex_id = ac['hex']
+    hex_word = int(hex_id.lstrip('~'), 16) | (1 << 24 if hex_id.startswith('~') else 0)
+    struct.pack_into('<i', record, 0, hex_word)
+
+    valid = 0
+    valid_rates = 0
+    if ac.get('lat') is not None and ac.get('lon') is not None:
+        valid |= 64
+        struct.pack_into('<Hxxii', record, 4, round(ac.get('seen_pos', 0) * 10),
+                         round(ac['lon'] * 1e6), round(ac['lat'] * 1e6))
+    struct.pack_into('<H', record, 6, round(ac.get('seen', 0) * 10))
+
+    if ac.get('baro_rate') is not None:
+        valid_rates |= 1
+        struct.pack_into('<h', record, 16, round(ac['baro_rate'] / 8))
+    if ac.get('geom_rate') is not None:
+        valid_rates |= 2
+        struct.pack_into('<h', record, 18, round(ac['geom_rate'] / 8))
+
+    on_ground = ac.get('alt_baro') == 'ground'
+    if ac.get('alt_baro') is not None and not on_ground:
+        valid |= 16
+        struct.pack_into('<h', record, 20, round(ac['alt_baro'] / 25))
+    if ac.get('alt_geom') is not None:
+        valid |= 32
+        struct.pack_into('<h', record, 22, round(ac['alt_geom'] / 25))
+    if ac.get('gs') is not None:
+        valid |= 128
+        struct.pack_into('<h', record, 34, round(ac['gs'] * 10))
+
+    if ac.get('category'):
+        record[64] = int(ac['category'], 16)
+    record[68] = 1 if on_ground else 2
+    if ac.get('flight') is not None:
+        valid |= 8
+        record[78:86] = ac['flight'].encode('ascii')[:8].ljust(8, b'\0')
+    record[88:92] = (ac.get('t') or '').encode('ascii')[:4].ljust(4, b'\0')
+    record[92:104] = (ac.get('r') or '').encode('ascii')[:12].ljust(12, b'\0')
+    record[73] = valid
+    record[75] = valid_rates
+    return bytes(record)
+
+
+def encode_bincraft(data: dict, stride: int = STRIDE) -> bytes:
+    """An aircraft.json dict as a binCraft payload."""
+    now_ms = round(data['now'] * 1000)
+    header = bytearray(stride)
+    struct.pack_into('<III', header, 0, now_ms & 0xFFFFFFFF, now_ms >> 32, stride)
+    aircraft = data.get('aircraft', data.get('ac', []))
+    return bytes(header) + b''.join(encode_record(ac, stride) for ac in aircraft)
+
+
+def main():
+    if len(sys.argv) != 3:
+        sys.exit(__doc__.strip().splitlines()[-1].strip())
+    with open(sys.argv[1], 'rb') as f:
+        data = json.load(f)
+    with open(sys.argv[2], 'wb') as f:
+        f.write(encode_bincraft(data))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic traffic for benchmarks.
+
+TrafficGenerator simulates N aircraft around one airport flying cruise,
+approach, landing and go-around profiles, and emits tar1090/readsb-shaped
+aircraft.json dicts (with the ~45 fields readsb sends per aircraft). The same
+seed always produces the same snapshots, so runs can be compared across
+commits.
+"""
+
+import json
+import math
+import random
+from typing import Iterator, List, Optional
+
+# Field elevation is taken as 0 ft MSL around this reference airport
+AIRPORT_LAT = 47.4490
+AIRPORT_LON = -122.3093
+
+PROFILES = ('cruise', 'approach', 'go_around')
+TYPES = ('B738', 'A320', 'A321', 'B39M', 'E75L', 'CRJ9', 'DH8D', 'B77W', 'A359', 'C172')
+AIRLINES = ('ASA', 'UAL', 'DAL', 'AAL', 'SWA', 'QXE', 'SKW', 'FFT', 'JBU', 'N')
+
+
+class SimAircraft:
+    """State of one simulated aircraft."""
+    __slots__ = (
+        'hex_id', 'callsign', 'type', 'profile', 'lat', 'lon', 'heading',
+        'altitude', 'vert_rate', 'speed', 'phase', 'decision_altitude', 'ticks_left', 'messages'
+    )
+
+
+class TrafficGenerator:
+    """Generate reproducible aircraft.json snapshots for ``count`` aircraft."""
+
+    def __init__(
+        self,
+        count: int,
+        seed: int = 1,
+        interval: float = 5.0,
+        start_time: float = 1_700_000_000.0,
+        weights: tuple = (60, 36, 4)
+    ):
+        self.rng = random.Random(seed)
+        self.interval = interval
+        self.now = start_time
+        self.weights = weights
+        self.next_hex = 0xA00000
+        self.aircraft: List[SimAircraft] = [self._spawn() for _ in range(count)]
+        self.messages = 0
+
+    def _spawn(self, profile: Optional[str] = None) -> SimAircraft:
+        rng = self.rng
+        ac = SimAircraft()
+        ac.hex_id = f"{self.next_hex:06x}"
+        self.next_hex += 1
+        airline = rng.choice(AIRLINES)
+        ac.callsign = f"{airline}{rng.randint(1, 9999)}" if airline != 'N' else f"N{rng.randint(100, 999)}AB"
+        ac.type = rng.choice(TYPES)
+        ac.profile = profile or rng.choices(PROFILES, weights=self.weights)[0]
+        ac.messages = rng.randint(100, 5000)
+        ac.phase = 'airborne'
+        ac.decision_altitude = rng.uniform(200, 900)
+        ac.ticks_left = rng.randint(60, 400)
+
+        if ac.profile == 'cruise':
+            # Anywhere within ~250 nm, level at a flight level
+            distance = rng.uniform(5, 250) / 60
+            bearing = rng.uniform(0, 2 * math.pi)
+            ac.lat = AIRPORT_LAT + distance * math.cos(bearing)
+            ac.lon = AIRPORT_LON + distance * math.sin(bearing) / math.cos(math.radians(AIRPORT_LAT))
+            ac.heading = rng.uniform(0, 360)
+            ac.altitude = rng.randrange(28000, 41000, 1000)
+            ac.vert_rate = 0.0
+            ac.speed = rng.uniform(420, 500)
+        else:
+            # Established on a 3-degree final, 10-18 nm out, heading for the airport
+            distance_nm = rng.uniform(10, 18)
+            bearing = rng.uniform(0, 2 * math.pi)
+            ac.lat = AIRPORT_LAT + distance_nm / 60 * math.cos(bearing)
+            ac.lon = AIRPORT_LON + distance_nm / 60 * math.sin(bearing) / math.cos(math.radians(AIRPORT_LAT))
+            ac.heading = (math.degrees(bearing) + 180) % 360
+            ac.altitude = distance_nm * 318
+            ac.vert_rate = -rng.uniform(650, 850)
+            ac.speed = rng.uniform(135, 160)
+        return ac
+
+    def _advance(self, ac: SimAircraft) -> bool:
+        """Move one aircraft forward by one interval; False once it should be replaced."""
+        dt = self.interval
+        rng = self.rng
+
+        if ac.profile == 'cruise':
+            ac.vert_rate = rng.choice((0.0, 0.0, 0.0, 64.0, -64.0))
+            ac.ticks_left -= 1
+        elif ac.phase == 'airborne':
+            if ac.profile == 'go_around' and ac.altitude <= ac.decision_altitude:
+                ac.phase = 'go_around'
+                ac.vert_rate = rng.uniform(1800, 2800)
+                ac.speed += 10
+            elif ac.altitude <= 0:
+                ac.phase = 'ground'
+                ac.altitude = 0
+                ac.vert_rate = 0.0
+                ac.ticks_left = rng.randint(6, 24)
+            else:
+                ac.vert_rate = -rng.uniform(650, 850)
+        elif ac.phase == 'go_around':
+            if ac.altitude >= 3000:
+                ac.vert_rate = 0.0
+                ac.ticks_left -= 1
+        elif ac.phase == 'ground':
+            ac.speed = max(15.0, ac.speed - 30)
+            ac.ticks_left -= 1
+
+        ac.altitude = max(0.0, ac.altitude + ac.vert_rate * dt / 60)
+        distance_deg = ac.speed * dt / 3600 / 60
+        heading = math.radians(ac.heading)
+        ac.lat += distance_deg * math.cos(heading)
+        ac.lon += distance_deg * math.sin(heading) / math.cos(math.radians(ac.lat))
+        ac.messages += rng.randint(5, 40)
+        return ac.ticks_left > 0
+
+    def _record(self, ac: SimAircraft) -> dict:
+        """Render one aircraft the way readsb writes it into aircraft.json."""
+        rng = self.rng
+        on_ground = ac.phase == 'ground'
+        altitude = int(round(ac.altitude / 25) * 25)
+        vert_rate = int(round(ac.vert_rate / 64) * 64)
+        return {
+            'hex': ac.hex_id,
+            'type': 'adsb_icao',
+            'flight': f"{ac.callsign:<8}",
+            'r': f"N{int(ac.hex_id, 16) % 90000 + 10000}",
+            't': ac.type,
+            'alt_baro': 'ground' if on_ground else altitude,
+            'alt_geom': altitude + 150,
+            'gs': round(ac.speed, 1),
+            'ias': int(ac.speed * 0.9),
+            'tas': int(ac.speed * 1.05),
+            'mach': round(ac.speed / 660, 3),
+            'wd': 240,
+            'ws': 12,
+            'oat': 5,
+            'tat': 8,
+            'track': round(ac.heading, 2),
+            'track_rate': 0.0,
+            'roll': 0.0,
+            'mag_heading': round((ac.heading - 15) % 360, 2),
+            'true_heading': round(ac.heading, 2),
+            'baro_rate': vert_rate,
+            'geom_rate': vert_rate,
+            'squawk': f"{rng.randint(0, 7777):04d}",
+            'emergency': 'none',
+            'category': 'A1' if ac.type == 'C172' else 'A3',
+            'nav_qnh': 1013.2,
+            'nav_altitude_mcp': 3008 if ac.profile != 'cruise' else int(ac.altitude),
+            'nav_heading': round(ac.heading, 1),
+            'nav_modes': ['autopilot', 'tcas'],
+            'lat': round(ac.lat, 6),
+            'lon': round(ac.lon, 6),
+            'nic': 8,
+            'rc': 186,
+            'seen_pos': round(rng.uniform(0, 1.5), 1),
+            'version': 2,
+            'nic_baro': 1,
+            'nac_p': 9,
+            'nac_v': 1,
+            'sil': 3,
+            'sil_type': 'perhour',
+            'gva': 2,
+            'sda': 2,
+            'alert': 0,
+            'spi': 0,
+            'mlat': [],
+            'tisb': [],
+            'messages': ac.messages,
+            'seen': round(rng.uniform(0, 1.0), 1),
+            'rssi': round(rng.uniform(-30, -3), 1)
+        }
+
+    def step(self) -> dict:
+        """Advance the simulation by one interval and return an aircraft.json dict."""
+        self.now += self.interval
+        for index, ac in enumerate(self.aircraft):
+            if not self._advance(ac):
+                self.aircraft[index] = self._spawn()
+        records = [self._record(ac) for ac in self.aircraft]
+        self.messages += sum(r['messages'] for r in records[:10])
+        return {'now': round(self.now, 1), 'messages': self.messages, 'aircraft': records}
+
+    def snapshots(self, count: int) -> Iterator[dict]:
+        """Yield ``count`` consecutive snapshots."""
+        for _ in range(count):
+            yield self.step()
+
+    def snapshot_bytes(self) -> bytes:
+        """Advance one interval and return the snapshot serialized like tar1090 serves it."""
+        return json.dumps(self.step(), separators=(',', ':')).encode()
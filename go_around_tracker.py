@@ -246,112 +246,173 @@ MAP_HTML_TEMPLATE = '''
         function updateMap() {
             fetch(baseUrl + '/api/go_arounds')
                 .then(response => response.json())
-                .then(data => {
-                    // Update stats
-                    document.getElementById('total-aircraft').textContent = data.total_aircraft || 0;
-                    document.getElementById('active-go-arounds').textContent = data.active_go_arounds || 0;
-                    document.getElementById('potential-go-arounds').textContent = data.potential_go_arounds || 0;
-                    document.getElementById('detected-today').textContent = data.detected_today || 0;
+                .then(renderMap)
+                .catch(error => console.error('Error fetching data:', error));
+        }
+        
+        function renderMap(data) {
+            // Update stats
+            document.getElementById('total-aircraft').textContent = data.total_aircraft || 0;
+            document.getElementById('active-go-arounds').textContent = data.active_go_arounds || 0;
+            document.getElementById('potential-go-arounds').textContent = data.potential_go_arounds || 0;
+            document.getElementById('detected-today').textContent = data.detected_today || 0;
+            
+            // Track active aircraft
+            const activeHexIds = new Set();
+            
+            // Update go-around aircraft
+            if (data.go_arounds) {
+                data.go_arounds.forEach(goAround => {
+                    const hexId = goAround.hex_id;
+                    activeHexIds.add(hexId);
                     
-                    // Track active aircraft
-                    const activeHexIds = new Set();
+                    if (aircraftMarkers[hexId]) {
+                        // Update existing marker
+                        aircraftMarkers[hexId].setLatLng([goAround.current_lat, goAround.current_lon]);
+                        aircraftMarkers[hexId].setIcon(createAircraftIcon('go_around', goAround.heading || 0));
+                    } else {
+                        // Create new marker
+                        const marker = L.marker([goAround.current_lat, goAround.current_lon], {
+                            icon: createAircraftIcon('go_around', goAround.heading || 0)
+                        }).addTo(map);
+                        
+                        marker.bindPopup(`
+                            <div style="min-width: 200px;">
+                                <h4 style="margin: 5px 0;">
+                                    <span class="go-around-indicator">GO-AROUND</span> 
+                                    ${goAround.callsign || goAround.hex_id}
+                                </h4>
+                                <div><strong>Min Altitude:</strong> ${goAround.min_altitude?.toLocaleString() || 'N/A'} ft</div>
+                                <div><strong>Current Altitude:</strong> ${goAround.current_alt?.toLocaleString() || 'N/A'} ft</div>
+                                <div><strong>Max Climb Rate:</strong> ${goAround.max_climb_rate?.toFixed(0) || 'N/A'} ft/min</div>
+                                <div><strong>Duration:</strong> ${goAround.duration || 0} seconds</div>
+                                ${goAround.runway
+                                    ? `<div><strong>Runway:</strong> ${goAround.airport} ${goAround.runway}</div>`
+                                    : ''}
+                                ${goAround.tar1090_url ? `<div><a href="${goAround.tar1090_url}" target="_blank">View in TAR1090</a></div>` : ''}
+                            </div>
+                        `);
+                        
+                        aircraftMarkers[hexId] = marker;
+                    }
                     
-                    // Update go-around aircraft
-                    if (data.go_arounds) {
-                        data.go_arounds.forEach(goAround => {
-                            const hexId = goAround.hex_id;
-                            activeHexIds.add(hexId);
-                            
-                            if (aircraftMarkers[hexId]) {
-                                // Update existing marker
-                                aircraftMarkers[hexId].setLatLng([goAround.current_lat, goAround.current_lon]);
-                                aircraftMarkers[hexId].setIcon(createAircraftIcon('go_around', goAround.heading || 0));
-                            } else {
-                                // Create new marker
-                                const marker = L.marker([goAround.current_lat, goAround.current_lon], {
-                                    icon: createAircraftIcon('go_around', goAround.heading || 0)
-                                }).addTo(map);
-                                
-                                marker.bindPopup(`
-                                    <div style="min-width: 200px;">
-                                        <h4 style="margin: 5px 0;">
-                                            <span class="go-around-indicator">GO-AROUND</span> 
-                                            ${goAround.callsign || goAround.hex_id}
-                                        </h4>
-                                        <div><strong>Min Altitude:</strong> ${goAround.min_altitude?.toLocaleString() || 'N/A'} ft</div>
-                                        <div><strong>Current Altitude:</strong> ${goAround.current_alt?.toLocaleString() || 'N/A'} ft</div>
-                                        <div><strong>Max Climb Rate:</strong> ${goAround.max_climb_rate?.toFixed(0) || 'N/A'} ft/min</div>
-                                        <div><strong>Duration:</strong> ${goAround.duration || 0} seconds</div>
-                                        ${goAround.tar1090_url ? `<div><a href="${goAround.tar1090_url}" target="_blank">View in TAR1090</a></div>` : ''}
-                                    </div>
-                                `);
-                                
-                                aircraftMarkers[hexId] = marker;
-                            }
-                            
-                            // Update path
-                            if (goAround.recent_path && goAround.recent_path.length > 1) {
-                                if (aircraftPaths[hexId]) {
-                                    aircraftPaths[hexId].setLatLngs(goAround.recent_path.map(p => [p.lat, p.lon]));
-                                } else {
-                                    aircraftPaths[hexId] = L.polyline(
-                                        goAround.recent_path.map(p => [p.lat, p.lon]),
-                                        {color: '#ff4444', weight: 2, opacity: 0.7}
-                                    ).addTo(map);
-                                }
-                            }
-                        });
+                    // Update path
+                    if (goAround.recent_path && goAround.recent_path.length > 1) {
+                        if (aircraftPaths[hexId]) {
+                            aircraftPaths[hexId].setLatLngs(goAround.recent_path.map(p => [p.lat, p.lon]));
+                        } else {
+                            aircraftPaths[hexId] = L.polyline(
+                                goAround.recent_path.map(p => [p.lat, p.lon]),
+                                {color: '#ff4444', weight: 2, opacity: 0.7}
+                            ).addTo(map);
+                        }
                     }
+                });
+            }
+            
+            // Update potential go-around aircraft
+            if (data.potential_go_arounds_list) {
+                data.potential_go_arounds_list.forEach(aircraft => {
+                    const hexId = aircraft.hex_id;
+                    activeHexIds.add(hexId);
                     
-                    // Update potential go-around aircraft
-                    if (data.potential_go_arounds_list) {
-                        data.potential_go_arounds_list.forEach(aircraft => {
-                            const hexId = aircraft.hex_id;
-                            activeHexIds.add(hexId);
-                            
-                            if (aircraftMarkers[hexId]) {
-                                aircraftMarkers[hexId].setLatLng([aircraft.current_lat, aircraft.current_lon]);
-                                aircraftMarkers[hexId].setIcon(createAircraftIcon('potential', aircraft.heading || 0));
-                            } else {
-                                const marker = L.marker([aircraft.current_lat, aircraft.current_lon], {
-                                    icon: createAircraftIcon('potential', aircraft.heading || 0)
-                                }).addTo(map);
-                                
-                                marker.bindPopup(`
-                                    <div style="min-width: 200px;">
-                                        <h4 style="margin: 5px 0;">
-                                            <span class="potential-indicator">POTENTIAL</span>
-                                            ${aircraft.callsign || aircraft.hex_id}
-                                        </h4>
-                                        <div><strong>Altitude:</strong> ${aircraft.current_alt?.toLocaleString() || 'N/A'} ft</div>
-                                        <div><strong>Vertical Rate:</strong> ${aircraft.vert_rate?.toFixed(0) || 'N/A'} ft/min</div>
-                                    </div>
-                                `);
-                                
-                                aircraftMarkers[hexId] = marker;
-                            }
-                        });
+                    if (aircraftMarkers[hexId]) {
+                        aircraftMarkers[hexId].setLatLng([aircraft.current_lat, aircraft.current_lon]);
+                        aircraftMarkers[hexId].setIcon(createAircraftIcon('potential', aircraft.heading || 0));
+                    } else {
+                        const marker = L.marker([aircraft.current_lat, aircraft.current_lon], {
+                            icon: createAircraftIcon('potential', aircraft.heading || 0)
+                        }).addTo(map);
+                        
+                        marker.bindPopup(`
+                            <div style="min-width: 200px;">
+                                <h4 style="margin: 5px 0;">
+                                    <span class="potential-indicator">POTENTIAL</span>
+                                    ${aircraft.callsign || aircraft.hex_id}
+                                </h4>
+                                <div><strong>Altitude:</strong> ${aircraft.current_alt?.toLocaleString() || 'N/A'} ft</div>
+                                <div><strong>Vertical Rate:</strong> ${aircraft.vert_rate?.toFixed(0) || 'N/A'} ft/min</div>
+                            </div>
+                        `);
+                        
+                        aircraftMarkers[hexId] = marker;
                     }
+                });
+            }
+            
+            // Remove markers for aircraft no longer active
+            Object.keys(aircraftMarkers).forEach(hexId => {
+                if (!activeHexIds.has(hexId)) {
+                    map.removeLayer(aircraftMarkers[hexId]);
+                    delete aircraftMarkers[hexId];
                     
-                    // Remove markers for aircraft no longer active
-                    Object.keys(aircraftMarkers).forEach(hexId => {
-                        if (!activeHexIds.has(hexId)) {
-                            map.removeLayer(aircraftMarkers[hexId]);
-                            delete aircraftMarkers[hexId];
-                            
-                            if (aircraftPaths[hexId]) {
-                                map.removeLayer(aircraftPaths[hexId]);
-                                delete aircraftPaths[hexId];
-                            }
-                        }
-                    });
-                })
-                .catch(error => console.error('Error fetching data:', error));
+                    if (aircraftPaths[hexId]) {
+                        map.removeLayer(aircraftPaths[hexId]);
+                        delete aircraftPaths[hexId];
+                    }
+                }
+            });
+        }
+        
+        // Live updates: /api/stream sends a full snapshot, then one delta per poll.
+        // Falls back to polling when the browser or a proxy can't do server-sent events.
+        const live = {status: {}, goArounds: new Map(), potential: new Map()};
+        let pollTimer = null;
+        
+        function liveData() {
+            return {
+                ...live.status,
+                go_arounds: [...live.goArounds.values()],
+                potential_go_arounds_list: [...live.potential.values()]
+            };
+        }
+        
+        function applyChanges(entries, changes) {
+            changes.removed.forEach(hexId => entries.delete(hexId));
+            changes.updated.forEach(entry => entries.set(entry.hex_id, entry));
+        }
+        
+        function startPolling() {
+            if (pollTimer) return;
+            updateMap();
+            pollTimer = setInterval(updateMap, 5000);
+        }
+        
+        function startStream() {
+            if (!window.EventSource) {
+                startPolling();
+                return;
+            }
+            const source = new EventSource(baseUrl + '/api/stream');
+            let received = false;
+            
+            source.addEventListener('snapshot', event => {
+                received = true;
+                const {go_arounds, potential_go_arounds_list, ...status} = JSON.parse(event.data);
+                live.status = status;
+                live.goArounds = new Map(go_arounds.map(entry => [entry.hex_id, entry]));
+                live.potential = new Map(potential_go_arounds_list.map(entry => [entry.hex_id, entry]));
+                renderMap(liveData());
+            });
+            
+            source.addEventListener('delta', event => {
+                const {go_arounds, potential_go_arounds_list, ...status} = JSON.parse(event.data);
+                live.status = status;
+                applyChanges(live.goArounds, go_arounds);
+                applyChanges(live.potential, potential_go_arounds_list);
+                renderMap(liveData());
+            });
+            
+            source.onerror = () => {
+                // EventSource reconnects by itself; only give up if the stream never worked
+                if (!received) {
+                    source.close();
+                    startPolling();
+                }
+            };
         }
         
-        // Update map every 5 seconds
-        updateMap();
-        setInterval(updateMap, 5000);
+        startStream();
     </script>
 </body>
 </html>
@@ -500,6 +561,11 @@ HISTORY_HTML_TEMPLATE = '''
             padding: 40px;
             color: #666;
         }
+        .load-more {
+            text-align: center;
+            padding: 15px;
+            color: #666;
+        }
         .stats-summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
@@ -531,6 +597,7 @@ HISTORY_HTML_TEMPLATE = '''
         <div class="nav-links">
             <a href="./">Live Map</a>
             <a href="history" class="active">History</a>
+            <a href="api/go_around_history.csv">Export CSV</a>
         </div>
     </div>
     
@@ -561,6 +628,22 @@ HISTORY_HTML_TEMPLATE = '''
                     <label>Callsign</label>
                     <input type="text" id="filter-callsign" placeholder="e.g., UAL123">
                 </div>
+                <div class="filter-group">
+                    <label>Hex ID</label>
+                    <input type="text" id="filter-hex" placeholder="e.g., a1b2c3">
+                </div>
+                <div class="filter-group">
+                    <label>Type</label>
+                    <input type="text" id="filter-type" placeholder="e.g., B738">
+                </div>
+                <div class="filter-group">
+                    <label>Airport</label>
+                    <input type="text" id="filter-airport" placeholder="e.g., KSEA">
+                </div>
+                <div class="filter-group">
+                    <label>Runway</label>
+                    <input type="text" id="filter-runway" placeholder="e.g., 16L">
+                </div>
                 <div class="filter-group">
                     <label>Date From</label>
                     <input type="datetime-local" id="filter-date-from">
@@ -573,6 +656,17 @@ HISTORY_HTML_TEMPLATE = '''
                     <label>Min Altitude Below (ft)</label>
                     <input type="number" id="filter-altitude" placeholder="e.g., 1000">
                 </div>
+                <div class="filter-group">
+                    <label>Min Confidence</label>
+                    <input type="number" id="filter-confidence" placeholder="e.g., 0.8" min="0" max="1" step="0.05">
+                </div>
+                <div class="filter-group">
+                    <label>Sort</label>
+                    <select id="filter-sort">
+                        <option value="newest">Newest first</option>
+                        <option value="oldest">Oldest first</option>
+                    </select>
+                </div>
                 <div class="filter-group">
                     <label>&nbsp;</label>
                     <button onclick="applyFilters()">Apply Filters</button>
@@ -590,7 +684,9 @@ HISTORY_HTML_TEMPLATE = '''
                     <tr>
                         <th>Timestamp</th>
                         <th>Callsign</th>
+                        <th>Type</th>
                         <th>Hex ID</th>
+                        <th>Runway</th>
                         <th>Min Altitude</th>
                         <th>Max Climb Rate</th>
                         <th>Duration</th>
@@ -601,10 +697,11 @@ HISTORY_HTML_TEMPLATE = '''
                 </thead>
                 <tbody id="events-tbody">
                     <tr>
-                        <td colspan="9" class="no-data">Loading go-around events...</td>
+                        <td colspan="11" class="no-data">Loading go-around events...</td>
                     </tr>
                 </tbody>
             </table>
+            <div class="load-more" id="load-more"></div>
         </div>
     </div>
     
@@ -615,7 +712,11 @@ HISTORY_HTML_TEMPLATE = '''
                        pathname.endsWith('/') ? pathname.slice(0, -1) : 
                        pathname;
         
-        let allEvents = [];
+        const PAGE_SIZE = 100;
+        let filterParams = new URLSearchParams();
+        let nextCursor = null;
+        let pagesLoaded = 0;
+        let loading = false;
         
         function formatDate(dateStr) {
             const date = new Date(dateStr);
@@ -628,48 +729,72 @@ HISTORY_HTML_TEMPLATE = '''
             return 'low';
         }
         
+        // Filtering, sorting and paging happen on the server; each page carries a cursor to the next
+        function fetchPage(cursor) {
+            const params = new URLSearchParams(filterParams);
+            params.set('limit', PAGE_SIZE);
+            if (cursor) params.set('cursor', cursor);
+            return fetch(baseUrl + '/api/go_around_history?' + params.toString())
+                .then(response => {
+                    if (!response.ok) throw new Error('HTTP ' + response.status);
+                    return response.json();
+                });
+        }
+        
         function loadHistory() {
-            fetch(baseUrl + '/api/go_around_history')
-                .then(response => response.json())
+            loading = true;
+            fetchPage(null)
                 .then(data => {
-                    allEvents = data.events || [];
-                    updateStats();
-                    renderTable(allEvents);
+                    pagesLoaded = 1;
+                    nextCursor = data.next_cursor;
+                    updateStats(data.summary);
+                    renderTable(data.events || [], false);
                 })
                 .catch(error => {
                     console.error('Error loading history:', error);
                     document.getElementById('events-tbody').innerHTML = 
-                        '<tr><td colspan="9" class="no-data">Error loading history</td></tr>';
-                });
+                        '<tr><td colspan="11" class="no-data">Error loading history</td></tr>';
+                })
+                .finally(() => { loading = false; updateLoadMore(); });
         }
         
-        function updateStats() {
-            const now = new Date();
-            const last24h = new Date(now - 24 * 60 * 60 * 1000);
-            const last7d = new Date(now - 7 * 24 * 60 * 60 * 1000);
-            
-            const events24h = allEvents.filter(e => new Date(e.timestamp) > last24h);
-            const events7d = allEvents.filter(e => new Date(e.timestamp) > last7d);
-            
-            document.getElementById('total-events').textContent = allEvents.length;
-            document.getElementById('last-24h').textContent = events24h.length;
-            document.getElementById('last-7d').textContent = events7d.length;
-            
-            if (allEvents.length > 0) {
-                const avgAlt = allEvents.reduce((sum, e) => sum + (e.min_altitude || 0), 0) / allEvents.length;
-                document.getElementById('avg-altitude').textContent = avgAlt.toFixed(0) + ' ft';
-            }
+        function loadMore() {
+            if (loading || !nextCursor) return;
+            loading = true;
+            updateLoadMore();
+            fetchPage(nextCursor)
+                .then(data => {
+                    pagesLoaded += 1;
+                    nextCursor = data.next_cursor;
+                    renderTable(data.events || [], true);
+                })
+                .catch(error => console.error('Error loading history:', error))
+                .finally(() => { loading = false; updateLoadMore(); });
+        }
+        
+        function updateLoadMore() {
+            document.getElementById('load-more').textContent =
+                loading ? 'Loading...' : nextCursor ? 'Scroll for more' : '';
+        }
+        
+        function updateStats(summary) {
+            if (!summary) return;
+            document.getElementById('total-events').textContent = summary.total;
+            document.getElementById('last-24h').textContent = summary.last_24h;
+            document.getElementById('last-7d').textContent = summary.last_7d;
+            document.getElementById('avg-altitude').textContent =
+                summary.avg_min_altitude !== null ? summary.avg_min_altitude + ' ft' : 'N/A';
         }
         
-        function renderTable(events) {
+        function renderTable(events, append) {
             const tbody = document.getElementById('events-tbody');
             
-            if (events.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="9" class="no-data">No go-around events found</td></tr>';
+            if (events.length === 0 && !append) {
+                tbody.innerHTML = '<tr><td colspan="11" class="no-data">No go-around events found</td></tr>';
                 return;
             }
             
-            tbody.innerHTML = events.map(event => {
+            const rows = events.map(event => {
                 const severity = calculateSeverity(event.min_altitude, event.max_climb_rate);
                 const severityClass = 'severity-' + severity;
                 
@@ -677,7 +802,9 @@ HISTORY_HTML_TEMPLATE = '''
                     <tr>
                         <td>${formatDate(event.timestamp)}</td>
                         <td><strong>${event.callsign || 'Unknown'}</strong></td>
+                        <td>${event.type || ''}</td>
                         <td>${event.hex_id}</td>
+                        <td>${event.runway ? event.airport + ' ' + event.runway : ''}</td>
                         <td>${event.min_altitude?.toLocaleString() || 'N/A'} ft</td>
                         <td>${event.max_climb_rate?.toFixed(0) || 'N/A'} ft/min</td>
                         <td>${event.duration || 0} sec</td>
@@ -691,73 +818,108 @@ HISTORY_HTML_TEMPLATE = '''
                     </tr>
                 `;
             }).join('');
+            
+            if (append) {
+                tbody.insertAdjacentHTML('beforeend', rows);
+            } else {
+                tbody.innerHTML = rows;
+            }
         }
         
         function applyFilters() {
-            const callsign = document.getElementById('filter-callsign').value.toLowerCase();
-            const dateFrom = document.getElementById('filter-date-from').value;
-            const dateTo = document.getElementById('filter-date-to').value;
-            const maxAltitude = document.getElementById('filter-altitude').value;
-            
-            let filtered = allEvents;
-            
-            if (callsign) {
-                filtered = filtered.filter(e => 
-                    (e.callsign || '').toLowerCase().includes(callsign)
-                );
-            }
-            
-            if (dateFrom) {
-                filtered = filtered.filter(e => new Date(e.timestamp) >= new Date(dateFrom));
-            }
-            
-            if (dateTo) {
-                filtered = filtered.filter(e => new Date(e.timestamp) <= new Date(dateTo));
-            }
-            
-            if (maxAltitude) {
-                filtered = filtered.filter(e => (e.min_altitude || 0) <= parseFloat(maxAltitude));
-            }
-            
-            renderTable(filtered);
+            const value = id => document.getElementById(id).value.trim();
+            const params = new URLSearchParams();
+            if (value('filter-callsign')) params.set('callsign', value('filter-callsign'));
+            if (value('filter-hex')) params.set('hex', value('filter-hex'));
+            if (value('filter-type')) params.set('type', value('filter-type'));
+            if (value('filter-airport')) params.set('airport', value('filter-airport'));
+            if (value('filter-runway')) params.set('runway', value('filter-runway'));
+            // datetime-local is browser local time; send epoch seconds so the server's timezone doesn't matter
+            if (value('filter-date-from')) params.set('from', new Date(value('filter-date-from')).getTime() / 1000);
+            if (value('filter-date-to')) params.set('to', new Date(value('filter-date-to')).getTime() / 1000);
+            if (value('filter-altitude')) params.set('max_altitude', value('filter-altitude'));
+            if (value('filter-confidence')) params.set('min_confidence', value('filter-confidence'));
+            params.set('sort', value('filter-sort'));
+            filterParams = params;
+            loadHistory();
         }
         
         function resetFilters() {
-            document.getElementById('filter-callsign').value = '';
-            document.getElementById('filter-date-from').value = '';
-            document.getElementById('filter-date-to').value = '';
-            document.getElementById('filter-altitude').value = '';
-            renderTable(allEvents);
+            ['filter-callsign', 'filter-hex', 'filter-type', 'filter-airport', 'filter-runway',
+             'filter-date-from', 'filter-date-to',
+             'filter-altitude', 'filter-confidence'].forEach(id => document.getElementById(id).value = '');
+            document.getElementById('filter-sort').value = 'newest';
+            filterParams = new URLSearchParams();
+            loadHistory();
         }
         
+        // Fetch the next page when the bottom of the table scrolls into view
+        new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) loadMore();
+        }).observe(document.getElementById('load-more'));
+        
         // Load history on page load
         loadHistory();
         
-        // Refresh every 30 seconds
-        setInterval(loadHistory, 30000);
+        // Refresh every 30 seconds, unless older pages have been loaded (that would lose the scroll position)
+        setInterval(() => { if (pagesLoaded <= 1 && !loading) loadHistory(); }, 30000);
     </script>
 </body>
 </html>
 '''
 
 import argparse
+import base64
+import cProfile
 import csv
+import gzip
+import hashlib
+import hmac
+import io
 import json
 import logging
 import math
 import os
+import pstats
+import queue
+import re
+import signal
+import sqlite3
+import struct
 import sys
+import tarfile
+import threading
 import time
-from collections import deque
-from dataclasses import dataclass, asdict, field
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Deque
+from itertools import chain, islice
+from typing import Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 import requests
-from flask import Flask, Response, jsonify, request
+from flask import Flask, Response, jsonify, request, send_from_directory
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+try:
+    import numpy as np
+except ImportError:  # Optional: batch detection falls back to the per-aircraft loop
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional: aircraft.json is parsed with the stdlib json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for zstd-compressed binCraft feeds
+    zstandard = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -774,12 +936,191 @@ class Position:
     speed: Optional[float] = None
     vert_rate: Optional[float] = None  # Vertical rate in ft/min
 
+
+# Columns kept for every tracked position; missing values are stored as NaN
+TRACK_COLUMNS = ('lat', 'lon', 'timestamp', 'altitude', 'speed', 'vert_rate')
+TRACK_CAPACITY = 120  # Default ring size; the monitor sizes tracks from the retention time instead
+TRACK_MIN_CAPACITY = 10
+TRACK_RETENTION_MARGIN = 30  # Seconds kept beyond the detector window
+TRACK_POINT_BUDGET = 500_000  # Track slots (6 doubles each) allocated across all aircraft
+TRACK_EVICTION_SCAN = 32  # Least recently seen aircraft considered when the budget is reached
+NAN = float('nan')
+
+
+def optional_float(value: float) -> Optional[float]:
+    """Convert a NaN track value back to None."""
+    return None if value != value else value
+
+
+class TrackView(NamedTuple):
+    """Chronological copy of the newest part of a track, one array per column."""
+    lat: array
+    lon: array
+    timestamp: array
+    altitude: array
+    speed: array
+    vert_rate: array
+
+
+class Track:
+    """
+    Fixed-capacity ring buffer of positions stored column-wise.
+    
+    Each column is a preallocated ``array('d')``, so a track holds plain
+    doubles instead of one Position object per fix. Missing altitude, speed
+    or vertical rate is stored as NaN; the accessors return None for it.
+    """
+    __slots__ = ('capacity', 'start', 'length') + TRACK_COLUMNS
+    
+    def __init__(self, capacity: int = TRACK_CAPACITY):
+        self.capacity = capacity
+        self.start = 0
+        self.length = 0
+        blank = array('d', [NAN]) * capacity
+        for name in TRACK_COLUMNS:
+            setattr(self, name, array('d', blank))
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, index: int) -> Position:
+        """Build a Position for one fix (convenience for cold paths)."""
+        slot = self.slot(index)
+        return Position(
+            lat=self.lat[slot],
+            lon=self.lon[slot],
+            timestamp=self.timestamp[slot],
+            altitude=optional_float(self.altitude[slot]),
+            speed=optional_float(self.speed[slot]),
+            vert_rate=optional_float(self.vert_rate[slot])
+        )
+    
+    def __iter__(self) -> Iterator[Position]:
+        for index in range(self.length):
+            yield self[index]
+    
+    def slot(self, index: int) -> int:
+        """Translate a chronological index (negative counts from the newest) to a buffer slot."""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('track index out of range')
+        slot = self.start + index
+        return slot - self.capacity if slot >= self.capacity else slot
+    
+    def append(
+        self,
+        lat: float,
+        lon: float,
+        timestamp: float,
+        altitude: Optional[float] = None,
+        speed: Optional[float] = None,
+        vert_rate: Optional[float] = None
+    ):
+        """Add a fix, overwriting the oldest one when the buffer is full."""
+        if self.length < self.capacity:
+            slot = self.start + self.length
+            if slot >= self.capacity:
+                slot -= self.capacity
+            self.length += 1
+        else:
+            slot = self.start
+            self.start = slot + 1 if slot + 1 < self.capacity else 0
+        
+        self.lat[slot] = lat
+        self.lon[slot] = lon
+        self.timestamp[slot] = timestamp
+        self.altitude[slot] = NAN if altitude is None else altitude
+        self.speed[slot] = NAN if speed is None else speed
+        self.vert_rate[slot] = NAN if vert_rate is None else vert_rate
+    
+    def clear(self):
+        """Drop all fixes; the preallocated columns are kept for reuse."""
+        self.start = 0
+        self.length = 0
+    
+    def get(self, column: str, index: int = -1) -> Optional[float]:
+        """Return one value of a column, or None when it is missing."""
+        return optional_float(getattr(self, column)[self.slot(index)])
+    
+    def last(self, column: str) -> Optional[float]:
+        """Return a column's value for the newest fix (None for an empty track)."""
+        if not self.length:
+            return None
+        return self.get(column)
+    
+    def column(self, name: str, last_n: Optional[int] = None) -> array:
+        """Return the newest ``last_n`` values (default: all) of a column, oldest first."""
+        data = getattr(self, name)
+        count = self.length if last_n is None else max(0, min(last_n, self.length))
+        first = self.start + self.length - count
+        if first >= self.capacity:
+            first -= self.capacity
+        end = first + count
+        if end <= self.capacity:
+            return data[first:end]
+        return data[first:] + data[:end - self.capacity]
+    
+    def view(self, last_n: Optional[int] = None) -> TrackView:
+        """Return the newest ``last_n`` fixes (default: all) as column arrays."""
+        return TrackView(*(self.column(name, last_n) for name in TRACK_COLUMNS))
+
+
+class TrackStore:
+    """
+    Hands out preallocated Track ring buffers and recycles them when aircraft expire.
+    
+    Tracks preallocate all their slots, so ``point_budget`` caps the slots in
+    use (tracks x capacity); the monitor evicts an aircraft before acquiring a
+    track when the store is full.
+    """
+    
+    def __init__(self, capacity: int = TRACK_CAPACITY, max_free: int = 256, point_budget: int = TRACK_POINT_BUDGET):
+        self.capacity = capacity
+        self.max_free = max_free
+        self.point_budget = point_budget
+        self.free: List[Track] = []
+        self.in_use = 0
+    
+    @property
+    def full(self) -> bool:
+        """True if one more track would exceed the point budget."""
+        return (self.in_use + 1) * self.capacity > self.point_budget
+    
+    def acquire(self) -> Track:
+        """Get an empty track, reusing a released one when possible."""
+        self.in_use += 1
+        if self.free:
+            return self.free.pop()
+        return Track(self.capacity)
+    
+    def release(self, track: Track):
+        """Return a track to the pool once its aircraft is dropped."""
+        self.in_use -= 1
+        if len(self.free) < self.max_free and track.capacity == self.capacity:
+            track.clear()
+            self.free.append(track)
+    
+    def stats(self) -> dict:
+        """Pool occupancy and preallocated column memory."""
+        track_bytes = len(TRACK_COLUMNS) * self.capacity * array('d').itemsize
+        return {
+            'tracks_in_use': self.in_use,
+            'tracks_free': len(self.free),
+            'track_capacity': self.capacity,
+            'points_allocated': self.in_use * self.capacity,
+            'point_budget': self.point_budget,
+            'allocated_bytes': (self.in_use + len(self.free)) * track_bytes
+        }
+
+
 @dataclass
 class Aircraft:
     hex_id: str
     callsign: str
-    path: Deque[Position] = field(default_factory=lambda: deque(maxlen=120))  # Keep last 10 minutes at 5s intervals
-    last_update: float = 0
+    path: Track = field(default_factory=Track)  # Columnar ring buffer of recent positions
+    last_update: float = 0  # Last time it was in the feed
+    last_fix: float = 0     # Last time it was in the feed with a new position
     type: Optional[str] = None
     category: Optional[str] = None
     
@@ -790,6 +1131,7 @@ class Aircraft:
     go_around_detected: bool = False
     go_around_start_time: Optional[float] = None
     max_climb_rate: Optional[float] = None       # Maximum climb rate during go-around
+    window: Optional['SlidingWindowState'] = None  # Rolling state for IncrementalGoAroundDetector
 
 @dataclass
 class GoAroundDetection:
@@ -813,6 +1155,9 @@ class GoAroundLog:
     duration: int  # seconds
     confidence: float
     tar1090_url: str
+    type: Optional[str] = None  # ICAO aircraft type code, when known
+    airport: Optional[str] = None  # Airport ident of the matched runway
+    runway: Optional[str] = None   # Runway end the aircraft was approaching, e.g. '16L'
 
 
 class GoAroundDetector:
@@ -822,13 +1167,27 @@ class GoAroundDetector:
         min_climb_rate: float = 1000,          # ft/min - minimum climb rate for go-around
         rapid_climb_rate: float = 1500,        # ft/min - rapid climb indicator
         altitude_recovery: float = 500,        # ft - must climb this much from minimum
-        time_window: int = 120                 # seconds - look back window
+        time_window: int = 120,                # seconds - look back window
+        confidence_threshold: float = 0.6      # score at which a go-around is reported
     ):
         self.low_altitude_threshold = low_altitude_threshold
         self.min_climb_rate = min_climb_rate
         self.rapid_climb_rate = rapid_climb_rate
         self.altitude_recovery = altitude_recovery
         self.time_window = time_window
+        self.confidence_threshold = confidence_threshold
+    
+    def observe(self, aircraft: Aircraft):
+        """Hook called after a new position is appended to an aircraft's track."""
+    
+    def detect_batch(self, aircraft_list: List[Aircraft]) -> Dict[str, GoAroundDetection]:
+        """Run detection for many aircraft, returning only those detected as go-arounds."""
+        detections = {}
+        for aircraft in aircraft_list:
+            detection = self.detect_go_around(aircraft)
+            if detection.is_go_around:
+                detections[aircraft.hex_id] = detection
+        return detections
     
     def detect_go_around(self, aircraft: Aircraft) -> GoAroundDetection:
         """
@@ -840,36 +1199,66 @@ class GoAroundDetector:
         3. Altitude recovery from a recent minimum
         """
         
-        if len(aircraft.path) < 3:
+        track = aircraft.path
+        if len(track) < 3:
             return GoAroundDetection(False, 0.0, 0, 0, 0, "Insufficient data")
         
-        current_pos = aircraft.path[-1]
-        current_time = current_pos.timestamp
+        timestamps = track.column('timestamp')
+        altitudes = track.column('altitude')
+        vert_rates = track.column('vert_rate')
+        current_time = timestamps[-1]
+        current_alt = altitudes[-1]
+        current_vert_rate = vert_rates[-1]
         
         # Need altitude and vertical rate data
-        if current_pos.altitude is None or current_pos.vert_rate is None:
+        if current_alt != current_alt or current_vert_rate != current_vert_rate:
             return GoAroundDetection(False, 0.0, 0, 0, 0, "No altitude/vert_rate data")
         
-        # Find minimum altitude in recent history
-        min_alt = current_pos.altitude
+        # Find minimum altitude in recent history (NaN never compares lower)
+        min_alt = current_alt
         min_alt_time = current_time
-        positions_in_window = []
+        window = []
         
-        for pos in aircraft.path:
-            if current_time - pos.timestamp <= self.time_window:
-                positions_in_window.append(pos)
-                if pos.altitude is not None and pos.altitude < min_alt:
-                    min_alt = pos.altitude
-                    min_alt_time = pos.timestamp
+        for index, timestamp in enumerate(timestamps):
+            if current_time - timestamp <= self.time_window:
+                window.append(index)
+                if altitudes[index] < min_alt:
+                    min_alt = altitudes[index]
+                    min_alt_time = timestamp
+        
+        # Additional check: rapid change from descent to climb
+        has_transition = False
+        if len(window) >= 5:
+            # Check if aircraft was descending before the minimum
+            for i in range(len(window) - 2):
+                if is_descent_to_climb(vert_rates[window[i]], vert_rates[window[i + 1]]):
+                    has_transition = True
+                    break
         
-        if len(positions_in_window) < 3:
+        return self.evaluate(
+            current_alt, current_vert_rate, current_time,
+            min_alt, min_alt_time, len(window), has_transition
+        )
+    
+    def evaluate(
+        self,
+        altitude: float,
+        vert_rate: float,
+        timestamp: float,
+        min_alt: float,
+        min_alt_time: float,
+        window_size: int,
+        has_transition: bool
+    ) -> GoAroundDetection:
+        """Score the go-around triggers for the newest position against its window."""
+        if window_size < 3:
             return GoAroundDetection(False, 0.0, 0, 0, 0, "Insufficient recent data")
         
         # Calculate altitude recovery
-        altitude_recovery = current_pos.altitude - min_alt
+        altitude_recovery = altitude - min_alt
         
         # Time since minimum altitude
-        time_since_min = current_time - min_alt_time
+        time_since_min = timestamp - min_alt_time
         
         # Detect go-around conditions
         confidence = 0.0
@@ -881,378 +1270,3321 @@ class GoAroundDetector:
             reasons.append(f"Low altitude: {min_alt:.0f}ft")
         
         # Check for significant climb rate
-        if current_pos.vert_rate >= self.rapid_climb_rate:
+        if vert_rate >= self.rapid_climb_rate:
             confidence += 0.4
-            reasons.append(f"Rapid climb: {current_pos.vert_rate:.0f}ft/min")
-        elif current_pos.vert_rate >= self.min_climb_rate:
+            reasons.append(f"Rapid climb: {vert_rate:.0f}ft/min")
+        elif vert_rate >= self.min_climb_rate:
             confidence += 0.2
-            reasons.append(f"Climbing: {current_pos.vert_rate:.0f}ft/min")
+            reasons.append(f"Climbing: {vert_rate:.0f}ft/min")
         
         # Check for altitude recovery
         if altitude_recovery >= self.altitude_recovery and time_since_min < 60:
             confidence += 0.3
             reasons.append(f"Altitude recovery: {altitude_recovery:.0f}ft in {time_since_min:.0f}s")
         
-        # Additional check: rapid change from descent to climb
-        if len(positions_in_window) >= 5:
-            # Check if aircraft was descending before the minimum
-            for i in range(len(positions_in_window) - 2):
-                if positions_in_window[i].vert_rate is not None and positions_in_window[i+1].vert_rate is not None:
-                    vert_rate_change = positions_in_window[i+1].vert_rate - positions_in_window[i].vert_rate
-                    if positions_in_window[i].vert_rate < -500 and vert_rate_change > 1000:
-                        confidence += 0.2
-                        reasons.append("Rapid transition from descent to climb")
-                        break
+        # Rapid change from descent to climb somewhere in the window (needs 5+ points)
+        if window_size >= 5 and has_transition:
+            confidence += 0.2
+            reasons.append("Rapid transition from descent to climb")
         
         # Determine if it's a go-around based on confidence
-        is_go_around = confidence >= 0.6
+        is_go_around = confidence >= self.confidence_threshold
         
         return GoAroundDetection(
             is_go_around=is_go_around,
             confidence=min(confidence, 1.0),
             min_altitude=min_alt,
-            current_altitude=current_pos.altitude,
-            climb_rate=current_pos.vert_rate,
+            current_altitude=altitude,
+            climb_rate=vert_rate,
             trigger_reason="; ".join(reasons) if reasons else "No triggers"
         )
 
 
-class TAR1090Monitor:
-    def __init__(self, server_url: str, update_interval: int = 5, public_url: str = None):
-        self.server_url = server_url.rstrip('/')
-        self.public_url = (public_url.rstrip('/') if public_url else server_url.rstrip('/'))
-        self.update_interval = update_interval
-        self.aircraft: Dict[str, Aircraft] = {}
-        self.detector = GoAroundDetector()
-        self.running = False
-        self.session = requests.Session()
-        self.session.timeout = 10
-        
-        # Statistics
-        self.total_requests = 0
-        self.failed_requests = 0
-        self.last_update = None
-        self.go_arounds_detected_today = 0
-        self.last_detection_date = datetime.now().date()
-        
-        # Active go-arounds
-        self.active_go_arounds: Dict[str, dict] = {}
-        
-        # CSV logging
-        self.data_dir = Path("/app/data")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.csv_file = self.data_dir / "go_around_detections.csv"
-        self.init_csv_file()
+def is_descent_to_climb(prev_vert_rate: float, next_vert_rate: float) -> bool:
+    """Check whether two consecutive vertical rates show a rapid descent-to-climb transition."""
+    # Missing rates are NaN, which fails both comparisons
+    return prev_vert_rate < -500 and next_vert_rate - prev_vert_rate > 1000
+
+
+class SlidingWindowState:
+    """
+    Rolling detection window for one aircraft.
     
-    def init_csv_file(self):
-        """Initialize CSV file with headers if it doesn't exist."""
-        if not self.csv_file.exists():
-            with open(self.csv_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'hex_id', 'callsign', 'lat', 'lon',
-                    'min_altitude', 'max_climb_rate', 'duration', 'confidence', 'tar1090_url'
-                ])
+    Mirrors the fixes of ``Aircraft.path`` that fall inside the detector's
+    time window, assuming fixes are appended in timestamp order. Every fix
+    gets a sequence number; the window is the suffix of sequence numbers that
+    are both still in the track buffer and young enough.
+    """
+    __slots__ = (
+        'time_window', 'maxlen', 'next_seq', 'timestamps',
+        'min_altitudes', 'transitions', 'last_vert_rate'
+    )
     
-    def log_go_around(self, log_entry: GoAroundLog):
-        """Log a go-around event to CSV file."""
-        with open(self.csv_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                log_entry.timestamp.isoformat(),
-                log_entry.hex_id,
-                log_entry.callsign,
-                log_entry.lat,
-                log_entry.lon,
-                log_entry.min_altitude,
-                log_entry.max_climb_rate,
-                log_entry.duration,
-                log_entry.confidence,
-                log_entry.tar1090_url
-            ])
+    def __init__(self, time_window: float, maxlen: Optional[int]):
+        self.time_window = time_window
+        self.maxlen = maxlen
+        self.next_seq = 0
+        # Timestamps of the fixes inside the window, oldest first
+        self.timestamps: Deque[float] = deque()
+        # Monotonic deque of (seq, timestamp, altitude); altitudes never decrease
+        # from front to back and the front is the oldest window minimum
+        self.min_altitudes: Deque[Tuple[int, float, float]] = deque()
+        # Sequence numbers of fixes followed by a descent-to-climb transition
+        self.transitions: Deque[int] = deque()
+        self.last_vert_rate = NAN
     
-    def fetch_aircraft_data(self) -> bool:
-        """Fetch aircraft data from TAR1090 server."""
-        try:
-            url = f"{self.server_url}/data/aircraft.json"
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            self.total_requests += 1
-            self.last_update = datetime.now()
-            
-            # Reset daily counter if new day
-            if self.last_update.date() != self.last_detection_date:
-                self.go_arounds_detected_today = 0
-                self.last_detection_date = self.last_update.date()
-            
-            current_time = time.time()
-            
-            # Process aircraft data
-            aircraft_list = data.get('aircraft', data.get('ac', []))
-            active_hex_ids = set()
-            
-            for ac_data in aircraft_list:
-                if not ac_data.get('hex') or ac_data.get('lat') is None or ac_data.get('lon') is None:
-                    continue
-                
-                hex_id = ac_data['hex']
-                active_hex_ids.add(hex_id)
-                
-                # Create or update aircraft
-                if hex_id not in self.aircraft:
-                    self.aircraft[hex_id] = Aircraft(
-                        hex_id=hex_id,
-                        callsign=ac_data.get('flight', hex_id).strip()
-                    )
-                
-                aircraft = self.aircraft[hex_id]
-                aircraft.last_update = current_time
-                aircraft.callsign = ac_data.get('flight', aircraft.callsign).strip()
-                aircraft.type = ac_data.get('t')
-                aircraft.category = ac_data.get('category')
-                
-                # Get altitude and vertical rate
-                altitude = ac_data.get('alt_baro') or ac_data.get('alt_geom')
-                vert_rate = ac_data.get('baro_rate') or ac_data.get('vert_rate')
-                
-                # Convert to float if needed
-                if altitude is not None:
-                    try:
-                        altitude = float(altitude)
-                    except (ValueError, TypeError):
-                        altitude = None
-                
-                if vert_rate is not None:
-                    try:
-                        vert_rate = float(vert_rate)
-                    except (ValueError, TypeError):
-                        vert_rate = None
-                
-                speed = ac_data.get('gs')
-                if speed is not None:
-                    try:
-                        speed = float(speed)
-                    except (ValueError, TypeError):
-                        speed = None
-                
-                # Create new position
-                new_pos = Position(
-                    lat=float(ac_data['lat']),
-                    lon=float(ac_data['lon']),
-                    timestamp=current_time,
-                    altitude=altitude,
-                    speed=speed,
-                    vert_rate=vert_rate
-                )
-                
-                # Add to path
-                aircraft.path.append(new_pos)
-                
-                # Detect go-around
-                detection = self.detector.detect_go_around(aircraft)
-                
-                if detection.is_go_around:
-                    if hex_id not in self.active_go_arounds:
-                        # New go-around detected
-                        self.active_go_arounds[hex_id] = {
-                            'aircraft': aircraft,
-                            'detection': detection,
-                            'start_time': current_time,
-                            'min_altitude': detection.min_altitude,
-                            'max_climb_rate': detection.climb_rate
-                        }
-                        self.go_arounds_detected_today += 1
-                        
-                        logger.info(f"Go-around detected: {aircraft.callsign} ({hex_id}) - {detection.trigger_reason}")
-                    else:
-                        # Update existing go-around
-                        go_around_data = self.active_go_arounds[hex_id]
-                        go_around_data['detection'] = detection
-                        go_around_data['max_climb_rate'] = max(
-                            go_around_data['max_climb_rate'],
-                            detection.climb_rate
-                        )
-                else:
-                    # Check if go-around has ended
-                    if hex_id in self.active_go_arounds:
-                        go_around_data = self.active_go_arounds[hex_id]
-                        duration = int(current_time - go_around_data['start_time'])
-                        
-                        # Log the completed go-around
-                        if duration > 10:  # Only log if it lasted more than 10 seconds
-                            log_entry = GoAroundLog(
-                                timestamp=datetime.now(),
-                                hex_id=hex_id,
-                                callsign=aircraft.callsign,
-                                lat=new_pos.lat,
-                                lon=new_pos.lon,
-                                min_altitude=go_around_data['min_altitude'],
-                                max_climb_rate=go_around_data['max_climb_rate'],
-                                duration=duration,
-                                confidence=go_around_data['detection'].confidence,
-                                tar1090_url=f"{self.public_url}/?icao={hex_id}"
-                            )
-                            self.log_go_around(log_entry)
-                            logger.info(f"Go-around completed: {aircraft.callsign} ({hex_id}) - Duration: {duration}s")
-                        
-                        del self.active_go_arounds[hex_id]
-            
-            # Clean up old aircraft
-            for hex_id in list(self.aircraft.keys()):
-                if hex_id not in active_hex_ids:
-                    if current_time - self.aircraft[hex_id].last_update > 60:
-                        del self.aircraft[hex_id]
-                        if hex_id in self.active_go_arounds:
-                            del self.active_go_arounds[hex_id]
-            
-            return True
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch aircraft data: {e}")
-            self.failed_requests += 1
-            return False
+    @property
+    def window_start(self) -> int:
+        """Sequence number of the oldest fix inside the window."""
+        return self.next_seq - len(self.timestamps)
     
-    def run(self):
-        """Main monitoring loop."""
-        self.running = True
-        logger.info(f"Starting TAR1090 monitor for {self.server_url}")
+    def push(self, timestamp: float, altitude: float, vert_rate: float):
+        """Add a newly appended fix (NaN for missing values) and expire what left the window."""
+        seq = self.next_seq
+        self.next_seq += 1
         
-        while self.running:
-            try:
-                self.fetch_aircraft_data()
-                time.sleep(self.update_interval)
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                self.running = False
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                time.sleep(self.update_interval)
-    
-    def get_status(self) -> dict:
-        """Get current monitoring status."""
-        return {
-            'running': self.running,
-            'server_url': self.server_url,
-            'total_aircraft': len(self.aircraft),
-            'active_go_arounds': len(self.active_go_arounds),
-            'potential_go_arounds': sum(
-                1 for a in self.aircraft.values() 
-                if a.path and a.path[-1].altitude and a.path[-1].altitude < 2000
-            ),
-            'detected_today': self.go_arounds_detected_today,
-            'total_requests': self.total_requests,
-            'failed_requests': self.failed_requests,
-            'last_update': self.last_update.isoformat() if self.last_update else None
-        }
-    
-    def get_go_around_data(self) -> dict:
-        """Get current go-around data for API."""
-        go_arounds = []
-        potential_go_arounds = []
+        # Pairs are recorded against the earlier fix, like the scalar scan
+        if is_descent_to_climb(self.last_vert_rate, vert_rate):
+            self.transitions.append(seq - 1)
+        self.last_vert_rate = vert_rate
         
-        for hex_id, go_around_data in self.active_go_arounds.items():
-            aircraft = go_around_data['aircraft']
-            detection = go_around_data['detection']
-            current_pos = aircraft.path[-1] if aircraft.path else None
-            
-            if current_pos:
-                go_arounds.append({
-                    'hex_id': hex_id,
-                    'callsign': aircraft.callsign,
-                    'current_lat': current_pos.lat,
-                    'current_lon': current_pos.lon,
-                    'current_alt': current_pos.altitude,
-                    'vert_rate': current_pos.vert_rate,
-                    'speed': current_pos.speed,
-                    'min_altitude': detection.min_altitude,
-                    'max_climb_rate': go_around_data['max_climb_rate'],
-                    'confidence': detection.confidence,
-                    'duration': int(time.time() - go_around_data['start_time']),
-                    'trigger_reason': detection.trigger_reason,
-                    'tar1090_url': f"{self.public_url}/?icao={hex_id}",
-                    'recent_path': [{'lat': p.lat, 'lon': p.lon} for p in list(aircraft.path)[-20:]]
-                })
+        if altitude == altitude:
+            min_altitudes = self.min_altitudes
+            # Equal altitudes stay queued so the oldest minimum keeps winning
+            while min_altitudes and min_altitudes[-1][2] > altitude:
+                min_altitudes.pop()
+            min_altitudes.append((seq, timestamp, altitude))
         
-        # Find potential go-arounds (low altitude aircraft)
-        for hex_id, aircraft in self.aircraft.items():
-            if hex_id not in self.active_go_arounds and aircraft.path:
-                current_pos = aircraft.path[-1]
-                if current_pos.altitude and current_pos.altitude < 2000:
-                    potential_go_arounds.append({
-                        'hex_id': hex_id,
-                        'callsign': aircraft.callsign,
-                        'current_lat': current_pos.lat,
-                        'current_lon': current_pos.lon,
-                        'current_alt': current_pos.altitude,
-                        'vert_rate': current_pos.vert_rate,
-                        'speed': current_pos.speed
-                    })
+        timestamps = self.timestamps
+        timestamps.append(timestamp)
+        while ((self.maxlen is not None and len(timestamps) > self.maxlen)
+               or timestamp - timestamps[0] > self.time_window):
+            timestamps.popleft()
         
-        status = self.get_status()
-        return {
-            **status,
-            'go_arounds': go_arounds,
-            'potential_go_arounds_list': potential_go_arounds
-        }
+        start = self.window_start
+        while self.min_altitudes and self.min_altitudes[0][0] < start:
+            self.min_altitudes.popleft()
+        while self.transitions and self.transitions[0] < start:
+            self.transitions.popleft()
     
-    def get_history(self) -> dict:
-        """Get historical go-around data from CSV."""
-        events = []
-        
-        if self.csv_file.exists():
-            with open(self.csv_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    events.append({
-                        'timestamp': row['timestamp'],
-                        'hex_id': row['hex_id'],
-                        'callsign': row['callsign'],
-                        'lat': float(row['lat']),
-                        'lon': float(row['lon']),
-                        'min_altitude': float(row['min_altitude']) if row['min_altitude'] else None,
-                        'max_climb_rate': float(row['max_climb_rate']) if row['max_climb_rate'] else None,
-                        'duration': int(row['duration']) if row['duration'] else 0,
-                        'confidence': float(row['confidence']) if row['confidence'] else 0,
-                        'tar1090_url': row['tar1090_url']
-                    })
-        
-        # Sort by timestamp (newest first)
-        events.sort(key=lambda x: x['timestamp'], reverse=True)
-        
-        return {'events': events}
+    def window_minimum(self, altitude: float, timestamp: float) -> Tuple[float, float]:
+        """Return (min altitude, time of min) the way the scalar detector computes it."""
+        if self.min_altitudes:
+            _, min_time, min_alt = self.min_altitudes[0]
+            if min_alt < altitude:
+                return min_alt, min_time
+        return altitude, timestamp
+    
+    def has_transition(self) -> bool:
+        """Whether a descent-to-climb pair exists, excluding the pair ending at the newest fix."""
+        return bool(self.transitions) and self.transitions[0] <= self.next_seq - 3
 
 
-def create_flask_app(monitor: TAR1090Monitor) -> Flask:
-    """Create Flask application for web interface."""
-    app = Flask(__name__)
-    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
+class IncrementalGoAroundDetector(GoAroundDetector):
+    """
+    Go-around detector that keeps per-aircraft rolling window state.
     
-    @app.route('/')
-    def index():
-        """Main map view."""
-        return Response(MAP_HTML_TEMPLATE, content_type='text/html')
+    Produces the same results as ``GoAroundDetector`` but updates the window
+    minimum and descent-to-climb flag as each position arrives instead of
+    rescanning the whole track on every poll.
+    """
     
-    @app.route('/history')
-    def history():
+    def observe(self, aircraft: Aircraft):
+        """Update the aircraft's rolling window with its newest fix."""
+        track = aircraft.path
+        if aircraft.window is None:
+            aircraft.window = SlidingWindowState(self.time_window, track.capacity)
+        slot = track.slot(-1)
+        aircraft.window.push(track.timestamp[slot], track.altitude[slot], track.vert_rate[slot])
+    
+    def detect_go_around(self, aircraft: Aircraft) -> GoAroundDetection:
+        """Detect a go-around from the aircraft's rolling window state."""
+        window = aircraft.window
+        if window is None:
+            # Track was filled without going through observe(); fall back to a rescan
+            return super().detect_go_around(aircraft)
+        
+        track = aircraft.path
+        if len(track) < 3:
+            return GoAroundDetection(False, 0.0, 0, 0, 0, "Insufficient data")
+        
+        slot = track.slot(-1)
+        altitude = track.altitude[slot]
+        vert_rate = track.vert_rate[slot]
+        if altitude != altitude or vert_rate != vert_rate:
+            return GoAroundDetection(False, 0.0, 0, 0, 0, "No altitude/vert_rate data")
+        
+        timestamp = track.timestamp[slot]
+        min_alt, min_alt_time = window.window_minimum(altitude, timestamp)
+        window_size = len(window.timestamps)
+        return self.evaluate(
+            altitude, vert_rate, timestamp, min_alt, min_alt_time, window_size,
+            window_size >= 5 and window.has_transition()
+        )
+
+
+class BatchGoAroundDetector(IncrementalGoAroundDetector):
+    """
+    Vectorized go-around detector scoring a whole snapshot at once.
+    
+    Per-aircraft window state comes from IncrementalGoAroundDetector; the
+    confidence score is computed with NumPy for every aircraft in one pass and
+    GoAroundDetection objects are only built for aircraft crossing the
+    threshold. Falls back to the per-aircraft loop when NumPy is unavailable.
+    """
+    
+    def score_batch(
+        self,
+        altitude: 'np.ndarray',
+        vert_rate: 'np.ndarray',
+        min_altitude: 'np.ndarray',
+        min_altitude_time: 'np.ndarray',
+        timestamp: 'np.ndarray',
+        window_size: 'np.ndarray',
+        has_transition: 'np.ndarray'
+    ) -> 'np.ndarray':
+        """Return the confidence score for each row, adding terms in the same order as evaluate()."""
+        confidence = np.zeros(len(altitude))
+        confidence += np.where(min_altitude < self.low_altitude_threshold, 0.3, 0.0)
+        confidence += np.where(
+            vert_rate >= self.rapid_climb_rate, 0.4,
+            np.where(vert_rate >= self.min_climb_rate, 0.2, 0.0)
+        )
+        recovered = ((altitude - min_altitude >= self.altitude_recovery)
+                     & (timestamp - min_altitude_time < 60))
+        confidence += np.where(recovered, 0.3, 0.0)
+        confidence += np.where((window_size >= 5) & has_transition, 0.2, 0.0)
+        return confidence
+    
+    def detect_batch(self, aircraft_list: List[Aircraft]) -> Dict[str, GoAroundDetection]:
+        """Score all aircraft with window state at once; only threshold crossers get a detection."""
+        if np is None:
+            return super().detect_batch(aircraft_list)
+        
+        candidates = []
+        rows = []
+        for aircraft in aircraft_list:
+            window = aircraft.window
+            track = aircraft.path
+            if window is None or track.length < 3:
+                continue
+            slot = track.slot(-1)
+            altitude = track.altitude[slot]
+            vert_rate = track.vert_rate[slot]
+            if altitude != altitude or vert_rate != vert_rate:
+                continue
+            window_size = len(window.timestamps)
+            if window_size < 3:
+                continue
+            timestamp = track.timestamp[slot]
+            min_alt, min_alt_time = window.window_minimum(altitude, timestamp)
+            candidates.append(aircraft)
+            # Same column order as evaluate()'s arguments
+            rows.append((
+                altitude, vert_rate, timestamp, min_alt, min_alt_time, window_size,
+                window_size >= 5 and window.has_transition()
+            ))
+        
+        if not rows:
+            return {}
+        
+        table = np.array(rows, dtype=np.float64)
+        confidence = self.score_batch(
+            altitude=table[:, 0],
+            vert_rate=table[:, 1],
+            min_altitude=table[:, 3],
+            min_altitude_time=table[:, 4],
+            timestamp=table[:, 2],
+            window_size=table[:, 5],
+            has_transition=table[:, 6] != 0
+        )
+        
+        # Build full detections (with trigger reasons) only for threshold crossers
+        detections = {}
+        for index in np.flatnonzero(confidence >= self.confidence_threshold):
+            detections[candidates[index].hex_id] = self.evaluate(*rows[index])
+        return detections
+
+
+# Where go-around logs are written unless --data-dir / DATA_DIR says otherwise
+DEFAULT_DATA_DIR = Path("/app/data")
+
+# Detector implementations selectable with --detector / DETECTOR_MODE
+DETECTOR_MODES = {
+    'scalar': GoAroundDetector,
+    'incremental': IncrementalGoAroundDetector,
+    'batch': BatchGoAroundDetector,
+}
+
+
+class AircraftRecord(NamedTuple):
+    """The fields of one aircraft.json entry the tracker uses; everything else is dropped at decode time."""
+    hex_id: str
+    callsign: Optional[str]
+    lat: float
+    lon: float
+    altitude: Optional[float]
+    vert_rate: Optional[float]
+    speed: Optional[float]
+    type: Optional[str]
+    category: Optional[str]
+    seen_pos: Optional[float]
+
+
+class Snapshot(NamedTuple):
+    """One decoded feed snapshot: the feed's ``now`` and the aircraft with a position."""
+    now: Optional[float]
+    aircraft: List[AircraftRecord]
+
+
+# readsb reports alt_baro as the string "ground" for aircraft on the ground
+GROUND = 'ground'
+
+# Fastest available JSON parser for feed payloads, and serializer for API snapshots
+json_loads = orjson.loads if orjson is not None else json.loads
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def json_dumps(obj) -> bytes:
+    """Compact JSON bytes; NumPy scalars from the batch detector are serialized as numbers."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':'), default=float).encode()
+
+
+def json_number(value) -> Optional[float]:
+    """A JSON number as float; None when missing, "ground" or not numeric."""
+    cls = value.__class__
+    if cls is float:
+        return value
+    if cls is int:
+        return float(value)
+    if value is None or value == GROUND:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def extract_snapshot(data: dict) -> Snapshot:
+    """
+    Reduce a parsed aircraft.json dict to a Snapshot.
+    
+    Aircraft without hex or position are dropped. Altitude is ``alt_baro``
+    falling back to ``alt_geom`` only when alt_baro is missing or zero; an
+    aircraft reporting "ground" has no altitude, as before.
+    """
+    records = []
+    append = records.append
+    new = tuple.__new__  # Skips NamedTuple's keyword-handling __new__ and _make's length check
+    record = AircraftRecord
+    for ac_data in data.get('aircraft', data.get('ac', [])):
+        get = ac_data.get
+        hex_id = get('hex')
+        lat = get('lat')
+        lon = get('lon')
+        if not hex_id or lat is None or lon is None:
+            continue
+        flight = get('flight')
+        seen_pos = get('seen_pos')
+        # readsb writes altitudes and rates as ints, positions and speeds as floats; anything
+        # else goes through json_number's checks
+        altitude = get('alt_baro') or get('alt_geom')
+        vert_rate = get('baro_rate') or get('vert_rate')
+        speed = get('gs')
+        append(new(record, (
+            hex_id,
+            flight.strip() if flight is not None else None,
+            lat if lat.__class__ is float else float(lat),
+            lon if lon.__class__ is float else float(lon),
+            float(altitude) if altitude.__class__ is int else json_number(altitude),
+            float(vert_rate) if vert_rate.__class__ is int else json_number(vert_rate),
+            speed if speed.__class__ is float else json_number(speed),
+            get('t'),
+            get('category'),
+            seen_pos if seen_pos.__class__ is float or seen_pos is None else float(seen_pos)
+        )))
+    now = data.get('now')
+    return Snapshot(float(now) if now is not None else None, records)
+
+
+class JSONFeedDecoder:
+    """Decoder for tar1090/readsb ``aircraft.json``."""
+    
+    name = 'json'
+    path = '/data/aircraft.json'
+    
+    def decode(self, raw: bytes) -> Snapshot:
+        """Parse a raw payload and keep only the fields the tracker uses."""
+        return extract_snapshot(json_loads(raw))
+
+
+# binCraft record fields the tracker reads, at their fixed offsets (readsb toBinCraft / tar1090 wqi):
+# hex word, seen_pos, lon, lat, baro_rate, alt_baro, alt_geom, gs, category,
+# airground, validity bytes 73 and 75, callsign and type code
+BINCRAFT_RECORD = '<iHxxiihxxhh10xh28xB3xB4xBxB2x8s2x4s'
+BINCRAFT_HEADER = struct.Struct('<III')
+BINCRAFT_GROUND = 1  # readsb AG_GROUND
+BINCRAFT_MIN_STRIDE = struct.calcsize(BINCRAFT_RECORD)
+
+
+class BinCraftFeedDecoder:
+    """
+    Decoder for readsb's binary ``aircraft.binCraft`` (optionally zstd-compressed).
+    
+    Records are fixed-stride structs unpacked straight from a memoryview into
+    AircraftRecords; no per-aircraft dicts are built. Corrupt or truncated
+    payloads raise ValueError, like unparseable aircraft.json.
+    """
+    
+    name = 'bincraft'
+    path = '/data/aircraft.binCraft'
+    
+    def __init__(self, compressed: bool = False):
+        if compressed:
+            if zstandard is None:
+                raise RuntimeError('zstd-compressed binCraft needs the zstandard package')
+            self.name = 'bincraft-zst'
+            self.path = '/data/aircraft.binCraft.zst'
+        self.compressed = compressed
+        self.record_structs: Dict[int, struct.Struct] = {}
+    
+    def record_struct(self, stride: int) -> struct.Struct:
+        """The record layout padded out to the stride this readsb version writes."""
+        record = self.record_structs.get(stride)
+        if record is None:
+            record = self.record_structs[stride] = struct.Struct(
+                BINCRAFT_RECORD + f"{stride - BINCRAFT_MIN_STRIDE}x"
+            )
+        return record
+    
+    def decode(self, raw: bytes) -> Snapshot:
+        """Unpack a binCraft payload, keeping aircraft with a valid position."""
+        if self.compressed:
+            # readsb writes frames without a content size, so stream-decompress
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            try:
+                raw = decompressor.decompress(raw)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"corrupt zstd binCraft payload: {e}") from None
+            if not decompressor.eof:
+                raise ValueError('truncated zstd binCraft payload')
+        if len(raw) < BINCRAFT_HEADER.size:
+            raise ValueError('binCraft payload too short')
+        now_low, now_high, stride = BINCRAFT_HEADER.unpack_from(raw)
+        if stride < BINCRAFT_MIN_STRIDE or stride % 4:
+            raise ValueError(f"unsupported binCraft stride {stride}")
+        if len(raw) % stride:
+            raise ValueError(f"truncated binCraft payload: {len(raw)} bytes is not a whole number of records")
+        count = len(raw) // stride - 1
+        body = memoryview(raw)[stride:stride + count * stride]
+        
+        records = []
+        append = records.append
+        make = AircraftRecord._make
+        for (hex_word, seen_pos, lon, lat, baro_rate, alt_baro, alt_geom, gs,
+             category, airground, valid, valid_rates, flight, ac_type) in self.record_struct(stride).iter_unpack(body):
+            if not valid & 64:
+                continue
+            hex_id = f"{hex_word & 0xFFFFFF:06x}"
+            if hex_word & 0x1000000:
+                hex_id = '~' + hex_id
+            
+            # Same semantics as the JSON decoder: alt_baro or alt_geom, ground has no altitude.
+            # Byte 68 packs airground (low nibble) with nav_altitude_src (high nibble).
+            if airground & 0x0F == BINCRAFT_GROUND:
+                altitude = None
+            elif valid & 16 and alt_baro:
+                altitude = alt_baro * 25.0
+            elif valid & 32:
+                altitude = alt_geom * 25.0
+            else:
+                altitude = None
+            
+            append(make((
+                hex_id,
+                flight.split(b'\0', 1)[0].decode('ascii', 'replace').strip() if valid & 8 else None,
+                lat / 1e6,
+                lon / 1e6,
+                altitude,
+                baro_rate * 8.0 if valid_rates & 1 and baro_rate else None,
+                gs / 10 if valid & 128 else None,
+                ac_type.split(b'\0', 1)[0].decode('ascii', 'replace') or None,
+                f"{category:X}" if category else None,
+                seen_pos / 10
+            )))
+        return Snapshot(now_low / 1000 + now_high * 4294967.296, records)
+
+
+# Feed payload decoders selectable with --feed-format / FEED_FORMAT; each knows its path on the tar1090 server
+FEED_DECODERS = {
+    'json': JSONFeedDecoder,
+    'bincraft': BinCraftFeedDecoder,
+    'bincraft-zst': lambda: BinCraftFeedDecoder(compressed=True),
+}
+
+
+# Returned by FeedSource.fetch when the source has no newer snapshot than last time
+NOT_MODIFIED = object()
+
+# What a decoder may raise on a corrupt payload (a JSON document of the wrong shape, a short binCraft record)
+FEED_DECODE_ERRORS = (ValueError, TypeError, KeyError, AttributeError, struct.error)
+
+# Most seconds a failing source is left alone; the wait doubles from 1 s with each consecutive failure
+FEED_BACKOFF_MAX = 60
+
+
+class FeedSource:
+    """One tar1090/readsb endpoint polled by the monitor, with its own latency and failure counters."""
+    
+    def __init__(self, url: str, timeout: float = 10, decoder=None):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+        self.decoder = decoder if decoder is not None else JSONFeedDecoder()
+        self.session = requests.Session()
+        
+        # Change detection state
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.last_now: Optional[float] = None
+        
+        # Statistics
+        self.requests = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.deadline_misses = 0
+        self.busy_skips = 0  # Polls skipped because the previous fetch was still running
+        self.backoff_skips = 0  # Polls skipped while backing off after failures
+        self.consecutive_failures = 0
+        self.retry_at = 0.0  # time.monotonic() before which the source is not polled
+        self.last_latency: Optional[float] = None
+        self.last_decode_time: Optional[float] = None
+        self.total_latency = 0.0
+        self.last_error: Optional[str] = None
+        self.last_success: Optional[datetime] = None
+    
+    def fetch(self):
+        """
+        Fetch and decode the current snapshot from this source.
+        
+        Returns a Snapshot, NOT_MODIFIED when the server has nothing
+        newer (304 to a conditional GET, or an unchanged ``now``), or None on
+        failure. HTTP errors and undecodable payloads both count as failures
+        and back the source off (see backing_off()).
+        """
+        started = time.perf_counter()
+        self.requests += 1
+        self.last_decode_time = None
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        try:
+            response = self.session.get(
+                f"{self.url}{self.decoder.path}", timeout=self.timeout, headers=headers, stream=True
+            )
+            if response.status_code == 304:
+                response.close()
+                self.not_modified += 1
+                self.last_success = datetime.now()
+                return NOT_MODIFIED
+            response.raise_for_status()
+            content = self.read_body(response, started)
+            decode_started = time.perf_counter()
+            snapshot = self.decoder.decode(content)
+            self.last_decode_time = time.perf_counter() - decode_started
+        except (requests.exceptions.RequestException,) + FEED_DECODE_ERRORS as e:
+            logger.error(f"Failed to fetch aircraft data from {self.url}: {e}")
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.retry_at = time.monotonic() + min(2 ** (self.consecutive_failures - 1), FEED_BACKOFF_MAX)
+            self.last_error = str(e)
+            return None
+        finally:
+            self.last_latency = time.perf_counter() - started
+            self.total_latency += self.last_latency
+        
+        self.consecutive_failures = 0
+        self.last_success = datetime.now()
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        
+        # tar1090 rewrites aircraft.json about once a second; same 'now' means same data
+        now = snapshot.now
+        if now is not None and self.last_now is not None and now <= self.last_now:
+            self.not_modified += 1
+            return NOT_MODIFIED
+        self.last_now = now
+        return snapshot
+    
+    def backing_off(self) -> bool:
+        """True (and counted) while the source waits out its backoff after failed fetches."""
+        if self.consecutive_failures and time.monotonic() < self.retry_at:
+            self.backoff_skips += 1
+            return True
+        return False
+    
+    def read_body(self, response: requests.Response, started: float) -> bytes:
+        """
+        Read the response body, failing once the whole request has taken longer than ``timeout``.
+        
+        requests' timeout only bounds each socket operation, so a server
+        trickling bytes could otherwise hold the fetch open indefinitely.
+        """
+        raw = response.raw
+        # read1 returns whatever one socket read yields; read() would wait to fill the chunk
+        read = raw.read1 if hasattr(raw, 'read1') else raw.read
+        chunks = []
+        try:
+            while True:
+                chunk = read(65536, decode_content=True)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if time.perf_counter() - started > self.timeout:
+                    raise requests.exceptions.Timeout(f"no complete response within {self.timeout:g}s")
+        finally:
+            response.close()
+        return b''.join(chunks)
+    
+    def get_status(self) -> dict:
+        """Per-source counters for the status API."""
+        return {
+            'url': self.url,
+            'format': self.decoder.name,
+            'requests': self.requests,
+            'failures': self.failures,
+            'not_modified': self.not_modified,
+            'deadline_misses': self.deadline_misses,
+            'busy_skips': self.busy_skips,
+            'backoff_skips': self.backoff_skips,
+            'last_latency_ms': round(self.last_latency * 1000, 1) if self.last_latency is not None else None,
+            'avg_latency_ms': round(self.total_latency / self.requests * 1000, 1) if self.requests else None,
+            'last_error': self.last_error,
+            'last_success': self.last_success.isoformat() if self.last_success else None
+        }
+
+
+def merge_snapshots(snapshots: List[Snapshot]) -> Snapshot:
+    """
+    Merge snapshots from several receivers into one.
+    
+    For each hex the record with the newest position (snapshot ``now`` minus
+    ``seen_pos``) wins, and its ``seen_pos`` is rebased onto the merged ``now``.
+    """
+    now = max((s.now or 0) for s in snapshots) or time.time()
+    merged: Dict[str, AircraftRecord] = {}
+    newest_fix: Dict[str, float] = {}
+    
+    for snapshot in snapshots:
+        snapshot_now = snapshot.now or now
+        for record in snapshot.aircraft:
+            hex_id = record.hex_id
+            seen_pos = record.seen_pos
+            fix_time = snapshot_now - seen_pos if seen_pos is not None else -math.inf
+            if hex_id not in merged or fix_time > newest_fix[hex_id]:
+                if seen_pos is not None and snapshot_now != now:
+                    record = record._replace(seen_pos=now - fix_time)
+                merged[hex_id] = record
+                newest_fix[hex_id] = fix_time
+    
+    return Snapshot(now, list(merged.values()))
+
+
+# Runway lookup: grid cell size (degrees) and how close a go-around must start to a runway end
+RUNWAY_GRID_DEG = 0.25
+RUNWAY_APPROACH_NM = 8          # Furthest before the threshold a go-around is matched
+RUNWAY_MAX_OFFSET_NM = 1.0      # Furthest from the extended centreline
+RUNWAY_MAX_COURSE_DIFF = 30     # Degrees between aircraft course and runway heading
+NM_PER_DEGREE = 60.0
+
+
+class RunwayEnd(NamedTuple):
+    """One landing direction of a runway: threshold position and true heading."""
+    airport: str
+    runway: str
+    lat: float
+    lon: float
+    heading: float
+    length_nm: float
+
+
+def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial true bearing in degrees from one position to another."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dlon = math.radians(lon2 - lon1)
+    x = math.sin(dlon) * math.cos(phi2)
+    y = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(dlon)
+    return math.degrees(math.atan2(x, y)) % 360
+
+
+def track_course(track: Track, last_n: int = 4) -> Optional[float]:
+    """Course over ground across the newest ``last_n`` fixes, or None if the aircraft barely moved."""
+    if len(track) < 2:
+        return None
+    first = -min(last_n, len(track))
+    lat1, lon1 = track.get('lat', first), track.get('lon', first)
+    lat2, lon2 = track.get('lat'), track.get('lon')
+    moved = math.hypot(lat2 - lat1, (lon2 - lon1) * math.cos(math.radians(lat2))) * NM_PER_DEGREE
+    return bearing(lat1, lon1, lat2, lon2) if moved >= 0.05 else None
+
+
+class RunwayIndex:
+    """
+    Runway ends bucketed on a uniform lat/lon grid.
+    
+    A lookup only visits the grid cells within RUNWAY_APPROACH_NM of the
+    position, so matching costs the same however many runways are loaded.
+    """
+    
+    def __init__(self, ends: List[RunwayEnd], cell: float = RUNWAY_GRID_DEG):
+        self.cell = cell
+        self.grid: Dict[Tuple[int, int], List[RunwayEnd]] = {}
+        for end in ends:
+            self.grid.setdefault(self.cell_of(end.lat, end.lon), []).append(end)
+        self.size = len(ends)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def cell_of(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self.cell)), int(math.floor(lon / self.cell))
+    
+    @classmethod
+    def from_csv(cls, path: Path) -> 'RunwayIndex':
+        """Load an OurAirports runways.csv; closed runways and ends without a position are skipped."""
+        ends = []
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('closed') == '1':
+                    continue
+                try:
+                    length_nm = float(row['length_ft']) / 6076.12 if row.get('length_ft') else 0.0
+                    points = {}
+                    for side in ('le', 'he'):
+                        if row.get(f'{side}_latitude_deg') and row.get(f'{side}_longitude_deg'):
+                            points[side] = (float(row[f'{side}_latitude_deg']), float(row[f'{side}_longitude_deg']))
+                except (KeyError, ValueError):
+                    continue
+                for side, other in (('le', 'he'), ('he', 'le')):
+                    if side not in points or not row.get(f'{side}_ident'):
+                        continue
+                    if row.get(f'{side}_heading_degT'):
+                        try:
+                            heading = float(row[f'{side}_heading_degT']) % 360
+                        except ValueError:
+                            continue
+                    elif other in points:
+                        heading = bearing(*points[side], *points[other])
+                    else:
+                        continue
+                    ends.append(RunwayEnd(
+                        row['airport_ident'], row[f'{side}_ident'], *points[side], heading, length_nm
+                    ))
+        return cls(ends)
+    
+    def match(self, lat: float, lon: float, course: Optional[float] = None) -> Optional[RunwayEnd]:
+        """
+        The runway end whose approach (or runway) the position lies on.
+        
+        Candidates must be within RUNWAY_APPROACH_NM before the threshold (or
+        over the runway) and RUNWAY_MAX_OFFSET_NM of the centreline; when the
+        course is known it must also be within RUNWAY_MAX_COURSE_DIFF of the
+        runway heading. The end with the smallest centreline offset wins.
+        """
+        cos_lat = max(math.cos(math.radians(lat)), 0.01)
+        lat_cells = math.ceil(RUNWAY_APPROACH_NM / NM_PER_DEGREE / self.cell)
+        lon_cells = math.ceil(RUNWAY_APPROACH_NM / NM_PER_DEGREE / cos_lat / self.cell)
+        row, col = self.cell_of(lat, lon)
+        
+        best = None
+        best_offset = RUNWAY_MAX_OFFSET_NM
+        for r in range(row - lat_cells, row + lat_cells + 1):
+            for c in range(col - lon_cells, col + lon_cells + 1):
+                for end in self.grid.get((r, c), ()):
+                    if course is not None and abs((course - end.heading + 180) % 360 - 180) > RUNWAY_MAX_COURSE_DIFF:
+                        continue
+                    # Local flat-earth offsets (nm) from the threshold, split along and across the runway
+                    north = (lat - end.lat) * NM_PER_DEGREE
+                    east = (lon - end.lon) * NM_PER_DEGREE * cos_lat
+                    heading = math.radians(end.heading)
+                    along = north * math.cos(heading) + east * math.sin(heading)
+                    offset = abs(east * math.cos(heading) - north * math.sin(heading))
+                    if -RUNWAY_APPROACH_NM <= along <= end.length_nm + 1 and offset <= best_offset:
+                        best, best_offset = end, offset
+        return best
+
+
+# Ceiling (ft) for geofences configured without one
+DEFAULT_FENCE_CEILING = 10000
+
+
+class Geofence(NamedTuple):
+    """A cylinder around an airport inside which aircraft are fully tracked."""
+    name: str
+    lat: float
+    lon: float
+    radius_nm: float
+    ceiling: float
+
+
+class Geofences:
+    """
+    The configured geofences and a cheap inside test for the ingest pre-filter.
+    
+    Fences are given as ``NAME:LAT,LON,RADIUS_NM[,CEILING_FT]`` separated by
+    semicolons. Aircraft with unknown altitude (including on the ground) count
+    as below every ceiling.
+    """
+    
+    def __init__(self, fences: List[Geofence]):
+        self.fences = fences
+        self.ceiling = max(fence.ceiling for fence in fences)
+        # Per fence: centre, squared radius in degrees of latitude and the longitude scale at the centre
+        self.bounds = [
+            (fence.lat, fence.lon, (fence.radius_nm / NM_PER_DEGREE) ** 2,
+             math.cos(math.radians(fence.lat)), fence.ceiling)
+            for fence in fences
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.fences)
+    
+    @classmethod
+    def parse(cls, spec: str) -> 'Geofences':
+        """Fences from a GEOFENCES string; ValueError on a malformed entry."""
+        fences = []
+        for entry in filter(None, (part.strip() for part in spec.split(';'))):
+            name, sep, values = entry.partition(':')
+            numbers = values.split(',')
+            if not sep or not name.strip() or len(numbers) not in (3, 4):
+                raise ValueError(f"geofence {entry!r} is not NAME:LAT,LON,RADIUS_NM[,CEILING_FT]")
+            lat, lon, radius = (float(number) for number in numbers[:3])
+            ceiling = float(numbers[3] if len(numbers) == 4 else DEFAULT_FENCE_CEILING)
+            fences.append(Geofence(name.strip(), lat, lon, radius, ceiling))
+        if not fences:
+            raise ValueError('no geofences given')
+        return cls(fences)
+    
+    def contains(self, lat: float, lon: float, altitude: Optional[float]) -> bool:
+        """True if the position is inside a fence and below that fence's ceiling."""
+        if altitude is not None and altitude > self.ceiling:
+            return False
+        for fence_lat, fence_lon, radius_sq, lon_scale, ceiling in self.bounds:
+            dlat = lat - fence_lat
+            dlon = (lon - fence_lon) * lon_scale
+            if dlat * dlat + dlon * dlon <= radius_sq and (altitude is None or altitude <= ceiling):
+                return True
+        return False
+
+
+# Event fields in API, CSV import and CSV export order
+EVENT_COLUMNS = (
+    'timestamp', 'hex_id', 'callsign', 'lat', 'lon',
+    'min_altitude', 'max_climb_rate', 'duration', 'confidence', 'tar1090_url', 'type',
+    'airport', 'runway'
+)
+
+# Events per /api/go_around_history page by default, and the most a page may hold
+HISTORY_PAGE_SIZE = 100
+HISTORY_LIMIT = 1000
+
+# Seconds a history summary is reused while no new events arrive
+SUMMARY_TTL = 60
+
+# Schema migrations, applied in order; PRAGMA user_version records how many have run
+EVENT_SCHEMA = (
+    """
+    CREATE TABLE go_arounds (
+        id INTEGER PRIMARY KEY,
+        ts REAL NOT NULL,
+        hex_id TEXT NOT NULL,
+        callsign TEXT,
+        lat REAL,
+        lon REAL,
+        min_altitude REAL,
+        max_climb_rate REAL,
+        duration INTEGER,
+        confidence REAL,
+        tar1090_url TEXT
+    );
+    CREATE INDEX go_arounds_ts ON go_arounds (ts);
+    CREATE INDEX go_arounds_hex_ts ON go_arounds (hex_id, ts);
+    CREATE INDEX go_arounds_callsign_ts ON go_arounds (callsign, ts);
+    """,
+    """
+    ALTER TABLE go_arounds ADD COLUMN type TEXT;
+    CREATE INDEX go_arounds_type_ts ON go_arounds (type, ts);
+    """,
+    """
+    ALTER TABLE go_arounds ADD COLUMN airport TEXT;
+    ALTER TABLE go_arounds ADD COLUMN runway TEXT;
+    CREATE INDEX go_arounds_airport_runway_ts ON go_arounds (airport, runway, ts);
+    """,
+)
+# Rows come back in EVENT_COLUMNS order followed by the id used for cursors
+EVENT_SELECT = (
+    'SELECT ts, hex_id, callsign, lat, lon, min_altitude, max_climb_rate, duration, confidence, tar1090_url,'
+    ' type, airport, runway, id FROM go_arounds'
+)
+EVENT_INSERT = (
+    'INSERT INTO go_arounds (ts, hex_id, callsign, lat, lon, min_altitude, max_climb_rate,'
+    ' duration, confidence, tar1090_url, type, airport, runway) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+)
+
+
+def parse_time(value: str) -> float:
+    """
+    Epoch seconds from a query parameter given as epoch seconds or a local ISO date/time.
+    
+    Raises ValueError for anything datetime can't represent (inf, nan, 1e20),
+    so callers can turn every bad value into a 400.
+    """
+    try:
+        ts = float(value)
+    except ValueError:
+        ts = datetime.fromisoformat(value).timestamp()
+    try:
+        datetime.fromtimestamp(ts)
+    except (OverflowError, OSError, ValueError):
+        raise ValueError(f"time out of range: {value}") from None
+    return ts
+
+
+def encode_cursor(newest_first: bool, ts: float, event_id: int) -> str:
+    """Opaque keyset cursor pointing just past the event (ts, id)."""
+    raw = json.dumps(['desc' if newest_first else 'asc', ts, event_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[bool, float, int]:
+    """(newest_first, ts, id) from a cursor; ValueError if it was not made by encode_cursor."""
+    try:
+        order, ts, event_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if order not in ('asc', 'desc'):
+            raise ValueError(order)
+        return order == 'desc', float(ts), int(event_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {e}") from None
+
+
+@dataclass
+class HistoryQuery:
+    """Filters, order and page of a go-around history request."""
+    start: Optional[float] = None
+    end: Optional[float] = None
+    callsign: Optional[str] = None  # Prefix match
+    hex_id: Optional[str] = None
+    type: Optional[str] = None
+    airport: Optional[str] = None
+    runway: Optional[str] = None
+    min_confidence: Optional[float] = None
+    max_altitude: Optional[float] = None  # Upper bound on the event's minimum altitude
+    newest_first: bool = True
+    limit: int = HISTORY_PAGE_SIZE
+    after: Optional[Tuple[float, int]] = None  # (ts, id) of the last event on the previous page
+    
+    @classmethod
+    def from_args(cls, args) -> 'HistoryQuery':
+        """Build a query from request arguments; raises ValueError on bad input."""
+        query = cls(
+            start=parse_time(args['from']) if args.get('from') else None,
+            end=parse_time(args['to']) if args.get('to') else None,
+            callsign=args.get('callsign', '').strip().upper() or None,
+            hex_id=args.get('hex', '').strip().lower() or None,
+            type=args.get('type', '').strip().upper() or None,
+            airport=args.get('airport', '').strip().upper() or None,
+            runway=args.get('runway', '').strip().upper() or None,
+            min_confidence=float(args['min_confidence']) if args.get('min_confidence') else None,
+            max_altitude=float(args['max_altitude']) if args.get('max_altitude') else None,
+            limit=min(max(int(args.get('limit', HISTORY_PAGE_SIZE)), 1), HISTORY_LIMIT)
+        )
+        sort = args.get('sort', 'newest')
+        if sort not in ('newest', 'oldest'):
+            raise ValueError(f"sort must be newest or oldest, not {sort!r}")
+        query.newest_first = sort == 'newest'
+        if args.get('cursor'):
+            newest_first, ts, event_id = decode_cursor(args['cursor'])
+            if newest_first != query.newest_first:
+                raise ValueError('cursor belongs to a different sort order')
+            query.after = (ts, event_id)
+        return query
+    
+    def where(self) -> Tuple[str, list]:
+        """SQL WHERE clause (without the cursor) and its parameters."""
+        clauses = []
+        params = []
+        if self.start is not None:
+            clauses.append('ts >= ?')
+            params.append(self.start)
+        if self.end is not None:
+            clauses.append('ts <= ?')
+            params.append(self.end)
+        if self.callsign:
+            # GLOB is case sensitive, so the (callsign, ts) index serves the prefix
+            clauses.append('callsign GLOB ?')
+            params.append(re.sub(r'[*?\[\]]', '', self.callsign) + '*')
+        if self.hex_id:
+            clauses.append('hex_id = ?')
+            params.append(self.hex_id)
+        if self.type:
+            clauses.append('type = ?')
+            params.append(self.type)
+        if self.airport:
+            clauses.append('airport = ?')
+            params.append(self.airport)
+        if self.runway:
+            clauses.append('runway = ?')
+            params.append(self.runway)
+        if self.min_confidence is not None:
+            clauses.append('confidence >= ?')
+            params.append(self.min_confidence)
+        if self.max_altitude is not None:
+            clauses.append('min_altitude <= ?')
+            params.append(self.max_altitude)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+    
+    @property
+    def time_only(self) -> bool:
+        """True if nothing but the time range filters events."""
+        return (self.callsign, self.hex_id, self.type, self.airport, self.runway,
+                self.min_confidence, self.max_altitude) == (None,) * 7
+    
+    def matches(self, row: tuple) -> bool:
+        """Same test as where() (without the cursor) on a row in EVENT_SELECT order, for archived events."""
+        ts, hex_id, callsign, _, _, min_altitude, _, _, confidence, _, aircraft_type, airport, runway, _ = row
+        if self.start is not None and ts < self.start:
+            return False
+        if self.end is not None and ts > self.end:
+            return False
+        if self.callsign and not (callsign or '').startswith(re.sub(r'[*?\[\]]', '', self.callsign)):
+            return False
+        if (self.hex_id and hex_id != self.hex_id) or (self.type and aircraft_type != self.type):
+            return False
+        if (self.airport and airport != self.airport) or (self.runway and runway != self.runway):
+            return False
+        if self.min_confidence is not None and (confidence is None or confidence < self.min_confidence):
+            return False
+        if self.max_altitude is not None and (min_altitude is None or min_altitude > self.max_altitude):
+            return False
+        return True
+
+
+# Months of events kept in the SQLite database (counting the current one) before they are moved
+# to the archive, seconds between archive checks, and decoded partitions cached for paging
+ARCHIVE_MONTHS = 3
+ARCHIVE_CHECK_INTERVAL = 3600
+ARCHIVE_CACHE_SIZE = 4
+
+
+def month_start(ts: float, months_back: int = 0) -> float:
+    """Epoch seconds of local midnight on the first of ts's month, months_back months earlier."""
+    moment = datetime.fromtimestamp(ts)
+    month = moment.year * 12 + moment.month - 1 - months_back
+    return datetime(month // 12, month % 12 + 1, 1).timestamp()
+
+
+def rollup_groups(rows: List[tuple]) -> List[list]:
+    """Rows in EVENT_SELECT order grouped like EventStore.rollup_rows()."""
+    groups: Dict[tuple, list] = {}
+    for row in rows:
+        moment = datetime.fromtimestamp(row[0])
+        key = (moment.strftime('%Y-%m-%d'), moment.hour, (row[2] or '')[:4], row[10])
+        climb = row[6]
+        HistoryRollups.merge(groups, key, 1, 0 if climb is None else 1, climb or 0, climb)
+    return [list(key) + cell for key, cell in groups.items()]
+
+
+def sync_directory(directory: Path):
+    """fsync a directory so a rename inside it survives a power cut."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ArchivePartition(NamedTuple):
+    """Manifest entry of one archived month."""
+    month: str  # YYYY-MM, local time
+    file: str
+    min_ts: float
+    max_ts: float
+    rows: int
+    bytes: int
+    altitude_sum: float  # Sum and count of min_altitude, for history summaries
+    altitude_count: int
+    rollups: List[list]  # rollup_groups() of the partition
+
+
+class EventArchive:
+    """
+    Events of closed months as gzip-compressed JSON lines, one file per month.
+    
+    manifest.json lists each partition's time range, row count and rollups, so
+    history queries only decompress partitions overlapping the requested range
+    and startup rollups never open them. ``until`` is the end of the archived
+    range; the live database only answers for events at or after it.
+    """
+    
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / 'manifest.json'
+        self.lock = threading.Lock()  # One writer at a time
+        self.partitions: Dict[str, ArchivePartition] = {}
+        self.until: Optional[float] = None
+        self.cache: 'OrderedDict[str, List[tuple]]' = OrderedDict()
+        self.cache_lock = threading.Lock()
+        self.totals_cache: Dict[str, Dict[tuple, tuple]] = {}  # File -> filters -> totals()
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'rb') as f:
+                manifest = json_loads(f.read())
+            self.until = manifest['until']
+            self.partitions = {
+                entry['month']: ArchivePartition(**entry) for entry in manifest['partitions']
+            }
+    
+    def save(self):
+        """Write the manifest atomically and durably."""
+        manifest = {
+            'until': self.until,
+            'partitions': [partition._asdict() for _, partition in sorted(self.partitions.items())]
+        }
+        temp = self.manifest_path.with_suffix('.tmp')
+        with open(temp, 'wb') as f:
+            f.write(json_dumps(manifest))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.manifest_path)
+        sync_directory(self.directory)
+    
+    def overlapping(self, start: Optional[float], end: Optional[float], newest_first: bool = False
+                    ) -> List[ArchivePartition]:
+        """Partitions holding events between start and end, in time order (newest first if asked)."""
+        return [
+            partition for _, partition in sorted(self.partitions.items(), reverse=newest_first)
+            if (start is None or partition.max_ts >= start) and (end is None or partition.min_ts <= end)
+        ]
+    
+    def read(self, partition: ArchivePartition, cache: bool = True) -> List[tuple]:
+        """Every event of a partition in (ts, id) order, as rows in EVENT_SELECT order."""
+        with self.cache_lock:
+            rows = self.cache.get(partition.file)
+            if rows is not None:
+                self.cache.move_to_end(partition.file)
+                return rows
+        with gzip.open(self.directory / partition.file, 'rb') as f:
+            rows = [tuple(json_loads(line)) for line in f]
+        if cache:
+            with self.cache_lock:
+                self.cache[partition.file] = rows
+                while len(self.cache) > ARCHIVE_CACHE_SIZE:
+                    self.cache.popitem(last=False)
+        return rows
+    
+    def totals(self, partition: ArchivePartition, query: HistoryQuery) -> Tuple[int, float, int, List[float]]:
+        """
+        Count, min_altitude sum and count of the partition's events matching the query,
+        plus the matching timestamps of its last week (enough for last_24h/last_7d later).
+        
+        A partition only changes through write_month(), so results are kept per filter
+        set until then instead of rescanning on every database write.
+        """
+        if ((query.start is None or partition.min_ts >= query.start)
+                and (query.end is None or partition.max_ts <= query.end)):
+            query = replace(query, start=None, end=None)  # Whole partition in range: same totals for any range
+        where, params = query.where()
+        key = (where, tuple(params))
+        with self.cache_lock:
+            cached = self.totals_cache.get(partition.file, {}).get(key)
+        if cached is not None:
+            return cached
+        
+        count = altitude_count = 0
+        altitude_sum = 0.0
+        recent = []
+        week_start = partition.max_ts - 7 * 86400
+        for row in self.read(partition):
+            if query.matches(row):
+                count += 1
+                if row[5] is not None:
+                    altitude_sum += row[5]
+                    altitude_count += 1
+                if row[0] >= week_start:
+                    recent.append(row[0])
+        totals = (count, altitude_sum, altitude_count, recent)
+        with self.cache_lock:
+            cached = self.totals_cache.setdefault(partition.file, {})
+            if len(cached) >= 256:
+                cached.clear()
+            cached[key] = totals
+        return totals
+    
+    def write_month(self, month: str, rows: List[tuple]):
+        """
+        Replace a month's partition with these rows, dropping repeats of an event (same ts and id).
+        Caller holds the lock.
+        """
+        rows = sorted({(row[0], row[-1]): row for row in rows}.values(), key=lambda row: (row[0], row[-1]))
+        name = f"{month}.jsonl.gz"
+        temp = self.directory / (name + '.tmp')
+        with open(temp, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                for row in rows:
+                    f.write(json_dumps(row) + b'\n')
+            raw.flush()
+            os.fsync(raw.fileno())
+        # On disk before the rename, and the rename on disk before the manifest points at it
+        os.replace(temp, self.directory / name)
+        sync_directory(self.directory)
+        altitudes = [row[5] for row in rows if row[5] is not None]
+        self.partitions[month] = ArchivePartition(
+            month, name, rows[0][0], rows[-1][0], len(rows), (self.directory / name).stat().st_size,
+            sum(altitudes), len(altitudes), rollup_groups(rows)
+        )
+        with self.cache_lock:
+            self.cache.pop(name, None)
+            self.totals_cache.pop(name, None)
+    
+    def add(self, month: str, rows: List[tuple], until: float):
+        """Merge rows into a month's partition and move ``until`` forward. Caller holds the lock."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = self.partitions.get(month)
+        if existing is not None:
+            rows = self.read(existing, cache=False) + rows
+        self.write_month(month, rows)
+        self.until = max(until, self.until or until)
+        self.save()
+    
+    def repartition(self) -> int:
+        """Rewrite every partition by month, merging duplicates and misfiled events; returns rows kept."""
+        with self.lock:
+            by_month: Dict[str, List[tuple]] = {}
+            for partition in list(self.partitions.values()):
+                for row in self.read(partition, cache=False):
+                    by_month.setdefault(datetime.fromtimestamp(row[0]).strftime('%Y-%m'), []).append(row)
+            old_files = {partition.file for partition in self.partitions.values()}
+            self.partitions = {}
+            for month, rows in by_month.items():
+                self.write_month(month, rows)
+            self.save()
+            for name in old_files - {partition.file for partition in self.partitions.values()}:
+                (self.directory / name).unlink()
+            return sum(partition.rows for partition in self.partitions.values())
+    
+    def rollup_rows(self) -> Iterator[list]:
+        for partition in list(self.partitions.values()):
+            yield from partition.rollups
+    
+    def get_status(self) -> dict:
+        partitions = list(self.partitions.values())
+        return {
+            'partitions': len(partitions),
+            'rows': sum(partition.rows for partition in partitions),
+            'bytes': sum(partition.bytes for partition in partitions),
+            'until': datetime.fromtimestamp(self.until).isoformat() if self.until is not None else None
+        }
+
+
+class EventStore:
+    """
+    Go-around events in SQLite (WAL mode), indexed by time, hex and callsign.
+    
+    Each thread gets its own connection, so the monitor loop can write while
+    Flask request threads read. With an archive, rotate() moves closed months
+    out of the database and reads cover both.
+    """
+    
+    def __init__(self, path: Path, synchronous: str = 'normal', archive: Optional[EventArchive] = None):
+        self.path = Path(path)
+        self.synchronous = synchronous  # PRAGMA synchronous for every connection
+        self.archive = archive
+        self.local = threading.local()
+        self.revision = 0  # Bumped on every write; invalidates cached summaries
+        self.summary_cache: Dict[tuple, Tuple[int, float, dict]] = {}
+        self.migrate()
+    
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(f'PRAGMA synchronous={self.synchronous.upper()}')
+            self.local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+    
+    def migrate(self):
+        """Bring the schema up to date."""
+        conn = self.connection()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for number, script in enumerate(EVENT_SCHEMA[version:], start=version + 1):
+            # executescript commits first, so the version bump goes in the same script
+            conn.executescript(f"BEGIN; {script} PRAGMA user_version = {number}; COMMIT;")
+            logger.info(f"Event store {self.path} migrated to schema version {number}")
+    
+    @staticmethod
+    def row_values(log_entry: GoAroundLog) -> tuple:
+        return (
+            log_entry.timestamp.timestamp(), log_entry.hex_id, log_entry.callsign,
+            log_entry.lat, log_entry.lon, log_entry.min_altitude, log_entry.max_climb_rate,
+            log_entry.duration, log_entry.confidence, log_entry.tar1090_url, log_entry.type,
+            log_entry.airport, log_entry.runway
+        )
+    
+    def add(self, log_entry: GoAroundLog):
+        """Store one event."""
+        self.add_many([log_entry])
+    
+    def add_many(self, log_entries: List[GoAroundLog]):
+        """Store several events in one transaction."""
+        conn = self.connection()
+        with conn:
+            conn.executemany(EVENT_INSERT, [self.row_values(log_entry) for log_entry in log_entries])
+        self.revision += 1
+    
+    def live(self, where: str, params: list) -> Tuple[str, list]:
+        """Restrict a WHERE clause to events not yet archived (leftovers of an interrupted rotate() are ignored)."""
+        until = self.archive.until if self.archive is not None else None
+        if until is None:
+            return where, params
+        return where + (' AND ' if where else ' WHERE ') + 'ts >= ?', params + [until]
+    
+    def count(self) -> int:
+        where, params = self.live('', [])
+        live = self.connection().execute(f"SELECT COUNT(*) FROM go_arounds{where}", params).fetchone()[0]
+        return live + (self.archive.get_status()['rows'] if self.archive is not None else 0)
+    
+    def query(self, query: HistoryQuery) -> Tuple[List[dict], Optional[str]]:
+        """One page of matching events and the cursor for the next page (None on the last page)."""
+        where, params = self.live(*query.where())
+        if query.after is not None:
+            # Keyset pagination: continue strictly after the last (ts, id) served
+            where += (' AND ' if where else ' WHERE ') + ('(ts, id) < (?, ?)' if query.newest_first else '(ts, id) > (?, ?)')
+            params.extend(query.after)
+        direction = 'DESC' if query.newest_first else 'ASC'
+        rows = self.connection().execute(
+            f"{EVENT_SELECT}{where} ORDER BY ts {direction}, id {direction} LIMIT ?",
+            params + [query.limit + 1]
+        ).fetchall()
+        if self.archive is not None:
+            rows = self.query_archive(query, rows)
+        
+        next_cursor = None
+        if len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = encode_cursor(query.newest_first, rows[-1][0], rows[-1][-1])
+        return [self.event(row) for row in rows], next_cursor
+    
+    def query_archive(self, query: HistoryQuery, rows: List[tuple]) -> List[tuple]:
+        """Merge archived events into a page, opening partitions only until they can no longer make the page."""
+        def key(row):
+            return row[0], row[-1]
+        
+        start, end = query.start, query.end
+        if query.after is not None:
+            if query.newest_first:
+                end = query.after[0] if end is None else min(end, query.after[0])
+            else:
+                start = query.after[0] if start is None else max(start, query.after[0])
+        for partition in self.archive.overlapping(start, end, query.newest_first):
+            if len(rows) > query.limit:
+                # Full page: stop once a partition lies wholly behind its last row
+                last = rows[query.limit][0]
+                if (partition.max_ts < last) if query.newest_first else (partition.min_ts > last):
+                    break
+            matched = [
+                row for row in self.archive.read(partition) if query.matches(row) and (
+                    query.after is None
+                    or ((key(row) < query.after) if query.newest_first else (key(row) > query.after))
+                )
+            ]
+            rows = sorted(list(rows) + matched, key=key, reverse=query.newest_first)[:query.limit + 1]
+        return rows
+    
+    def summary(self, query: HistoryQuery, now: float) -> dict:
+        """
+        Totals over every event matching the query's filters.
+        
+        This is a full scan of the matching live rows, so results are cached per
+        filter set until an event is written or SUMMARY_TTL passes; archived
+        partitions keep their own totals (EventArchive.totals()).
+        """
+        where, params = self.live(*query.where())
+        key = (where, tuple(params))
+        cached = self.summary_cache.get(key)
+        if cached is not None and cached[0] == self.revision and now - cached[1] < SUMMARY_TTL:
+            return cached[2]
+        
+        total, last_24h, last_7d, altitude_sum, altitude_count = self.connection().execute(
+            f"SELECT COUNT(*), SUM(ts >= ?), SUM(ts >= ?), SUM(min_altitude), COUNT(min_altitude)"
+            f" FROM go_arounds{where}",
+            [now - 86400, now - 7 * 86400] + params
+        ).fetchone()
+        last_24h = last_24h or 0
+        last_7d = last_7d or 0
+        altitude_sum = altitude_sum or 0
+        if self.archive is not None:
+            for partition in self.archive.overlapping(query.start, query.end):
+                inside = ((query.start is None or partition.min_ts >= query.start)
+                          and (query.end is None or partition.max_ts <= query.end))
+                if query.time_only and inside and partition.max_ts < now - 7 * 86400:
+                    # Whole partition counts and none of it is recent: the manifest has the totals
+                    total += partition.rows
+                    altitude_sum += partition.altitude_sum
+                    altitude_count += partition.altitude_count
+                    continue
+                count, partition_sum, partition_count, recent = self.archive.totals(partition, query)
+                total += count
+                altitude_sum += partition_sum
+                altitude_count += partition_count
+                last_24h += len(recent) - bisect_left(recent, now - 86400)
+                last_7d += len(recent) - bisect_left(recent, now - 7 * 86400)
+        summary = {
+            'total': total,
+            'last_24h': last_24h,
+            'last_7d': last_7d,
+            'avg_min_altitude': round(altitude_sum / altitude_count) if altitude_count else None
+        }
+        if len(self.summary_cache) >= 256:
+            self.summary_cache.clear()
+        self.summary_cache[key] = (self.revision, now, summary)
+        return summary
+    
+    @staticmethod
+    def event(row: tuple) -> dict:
+        """An event row as the API dict; timestamps are local ISO time like the old CSV."""
+        event = dict(zip(EVENT_COLUMNS, row))  # Drops the trailing id
+        event['timestamp'] = datetime.fromtimestamp(event['timestamp']).isoformat()
+        event['duration'] = event['duration'] or 0
+        event['confidence'] = event['confidence'] or 0
+        return event
+    
+    def import_csv(self, csv_path: Path) -> int:
+        """Load a legacy go_around_detections.csv in one transaction; returns rows imported."""
+        def number(value: str, kind=float):
+            return kind(value) if value not in (None, '') else None
+        
+        entries = []
+        with open(csv_path, 'r', newline='') as f:
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    entries.append((
+                        datetime.fromisoformat(row['timestamp']).timestamp(), row['hex_id'], row['callsign'],
+                        number(row['lat']), number(row['lon']), number(row['min_altitude']),
+                        number(row['max_climb_rate']), number(row['duration'], int) or 0,
+                        number(row['confidence']) or 0, row['tar1090_url'], row.get('type') or None,
+                        row.get('airport') or None, row.get('runway') or None
+                    ))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Skipping unreadable row {line} of {csv_path}: {e}")
+        
+        conn = self.connection()
+        with conn:
+            conn.executemany(EVENT_INSERT, entries)
+        self.revision += 1
+        return len(entries)
+    
+    def rollup_rows(self) -> Iterator[tuple]:
+        """
+        Events grouped by local hour, callsign head and type, for HistoryRollups.rebuild().
+        
+        Rows are (day, hour, callsign head, type, count, climb count, climb sum, climb max);
+        the first four callsign characters are enough to tell an airline prefix. Archived
+        months come from the archive manifest.
+        """
+        where, params = self.live('', [])
+        rows = self.connection().execute(
+            "SELECT strftime('%Y-%m-%d', ts, 'unixepoch', 'localtime') AS day,"
+            " CAST(strftime('%H', ts, 'unixepoch', 'localtime') AS INTEGER) AS hour,"
+            " substr(callsign, 1, 4) AS head, type, COUNT(*), COUNT(max_climb_rate), SUM(max_climb_rate),"
+            f" MAX(max_climb_rate) FROM go_arounds{where} GROUP BY day, hour, head, type", params
+        )
+        if self.archive is None:
+            return rows
+        return chain(self.archive.rollup_rows(), rows)
+    
+    def iter_csv(self) -> Iterator[str]:
+        """Stream every event as CSV text, oldest first, in the old CSV layout."""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(EVENT_COLUMNS)
+        # Own connection: the response generator may be resumed from another thread
+        conn = sqlite3.connect(self.path, timeout=10)
+        where, params = self.live('', [])
+        archived = self.archive.overlapping(None, None) if self.archive is not None else []
+        try:
+            rows = chain.from_iterable(self.archive.read(partition, cache=False) for partition in archived)
+            for row in chain(rows, conn.execute(f"{EVENT_SELECT}{where} ORDER BY ts", params)):
+                event = self.event(row)
+                writer.writerow([event[column] for column in EVENT_COLUMNS])
+                if out.tell() > 65536:
+                    yield out.getvalue()
+                    out.seek(0)
+                    out.truncate()
+            yield out.getvalue()
+        finally:
+            conn.close()
+    
+    def rotate(self, before: float) -> int:
+        """Move events older than ``before`` into the archive, a month at a time; returns events moved."""
+        moved = 0
+        conn = self.connection()
+        with self.archive.lock:
+            oldest = conn.execute('SELECT MIN(ts) FROM go_arounds WHERE ts < ?', (before,)).fetchone()[0]
+            while oldest is not None:
+                month = datetime.fromtimestamp(oldest).strftime('%Y-%m')
+                end = min(month_start(month_start(oldest) + 32 * 86400), before)
+                rows = conn.execute(f"{EVENT_SELECT} WHERE ts < ? ORDER BY ts, id", (end,)).fetchall()
+                # Manifest first: once it moves ``until`` past these rows, reads ignore them in the database.
+                # add() has fsynced the partition, the manifest and their directory before rows are deleted
+                self.archive.add(month, rows, end)
+                with conn:
+                    conn.execute('DELETE FROM go_arounds WHERE ts < ?', (end,))
+                self.revision += 1
+                moved += len(rows)
+                logger.info(f"Archived {len(rows)} go-arounds from {month}")
+                oldest = conn.execute('SELECT MIN(ts) FROM go_arounds WHERE ts < ?', (before,)).fetchone()[0]
+        return moved
+
+
+# Background event writer: queued events before new ones are dropped, seconds a commit may
+# wait for more events, and SQLite synchronous levels (full fsyncs every commit)
+EVENT_QUEUE_SIZE = 1000
+EVENT_FLUSH_INTERVAL = 1.0
+EVENT_SYNC_MODES = ('off', 'normal', 'full')
+
+# Queued by EventWriter.close() behind the last event
+WRITER_STOP = object()
+
+
+class EventWriter:
+    """
+    Persists go-around events on a background thread so the poll loop never waits on disk.
+    
+    submit() only queues. The writer then waits up to flush_interval for more
+    events and commits everything queued in one transaction, so a burst costs
+    one commit (and one fsync with sync 'full'). If the queue is full, events
+    are dropped and counted instead of blocking detection. close() drains the
+    queue; events submitted after it are written directly. on_written is
+    called with each batch once it is committed.
+    """
+    
+    def __init__(self, store: EventStore, max_queue: int = EVENT_QUEUE_SIZE,
+                 flush_interval: float = EVENT_FLUSH_INTERVAL,
+                 on_written: Optional[Callable[[List[GoAroundLog]], None]] = None):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.on_written = on_written
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.wake = threading.Event()  # Cuts the batching wait short for flush() and close()
+        self.closed = False
+        
+        # Statistics
+        self.queued = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        self.high_water = 0
+        self.last_batch_ms: Optional[float] = None
+        
+        self.thread = threading.Thread(target=self.run, name='event-writer', daemon=True)
+        self.thread.start()
+    
+    def submit(self, log_entry: GoAroundLog) -> bool:
+        """Queue an event without blocking; False if it had to be dropped."""
+        if self.closed:
+            self.store.add(log_entry)
+            self.written += 1
+            if self.on_written is not None:
+                self.on_written([log_entry])
+            return True
+        try:
+            self.queue.put_nowait(log_entry)
+        except queue.Full:
+            self.dropped += 1
+            logger.error(f"Event queue full, dropped go-around of {log_entry.callsign} ({log_entry.hex_id})")
+            return False
+        self.queued += 1
+        self.high_water = max(self.high_water, self.queue.qsize())
+        return True
+    
+    def run(self):
+        """Writer thread: collect a batch, commit it, repeat until WRITER_STOP."""
+        stopping = False
+        while not stopping:
+            items = [self.queue.get()]
+            if items[0] is not WRITER_STOP and self.flush_interval > 0:
+                self.wake.wait(self.flush_interval)
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(item is WRITER_STOP for item in items)
+            batch = [item for item in items if item is not WRITER_STOP]
+            if batch:
+                self.write(batch)
+            for _ in items:
+                self.queue.task_done()
+    
+    def write(self, batch: List[GoAroundLog], attempts: int = 3):
+        """Commit a batch, retrying on database errors (e.g. a locked or full disk)."""
+        started = time.perf_counter()
+        for attempt in range(1, attempts + 1):
+            try:
+                self.store.add_many(batch)
+                break
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.error(f"Failed to write {len(batch)} go-arounds (attempt {attempt}/{attempts}): {e}")
+                if attempt == attempts:
+                    self.dropped += len(batch)
+                    return
+                time.sleep(1)
+        self.written += len(batch)
+        self.batches += 1
+        self.last_batch_ms = (time.perf_counter() - started) * 1000
+        if self.on_written is not None:
+            self.on_written(batch)
+    
+    def flush(self):
+        """Block until every queued event is written."""
+        self.wake.set()
+        self.queue.join()
+        self.wake.clear()
+    
+    def close(self, timeout: float = 10):
+        """Write out the queue and stop the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        self.wake.set()
+        try:
+            self.queue.put(WRITER_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error('Event queue did not drain before shutdown')
+            return
+        self.thread.join(timeout)
+        logger.info(f"Event writer stopped: {self.written} written, {self.dropped} dropped")
+    
+    def get_status(self) -> dict:
+        return {
+            'queued': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'high_water': self.high_water,
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'errors': self.errors,
+            'last_batch_ms': round(self.last_batch_ms, 2) if self.last_batch_ms is not None else None
+        }
+
+
+# Rollup tables kept per local day; 'airline' is the ICAO prefix of airline callsigns
+ROLLUP_DIMENSIONS = ('hour', 'airline', 'type')
+AIRLINE_CALLSIGN = re.compile(r'([A-Z]{3})\d')
+
+
+def airline_prefix(callsign: Optional[str]) -> Optional[str]:
+    """ICAO airline designator of a callsign like 'BAW123', or None for registrations."""
+    match = AIRLINE_CALLSIGN.match(callsign or '')
+    return match.group(1) if match else None
+
+
+class HistoryRollups:
+    """
+    Go-around counts and climb rates by day, hour of day, airline and type.
+    
+    Each table is kept per local day as key -> [count, climb count, climb sum,
+    climb max], updated as events are committed to the event store and rebuilt
+    from it at startup. Running [count, climb count, climb sum] totals over the
+    sorted days answer a date range's totals with two lookups; maxima can't be
+    subtracted, so they and the per-hour/airline/type tables still merge one
+    small table per day in the range. All-time tables are kept separately, so
+    requests never touch events.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.days: Dict[str, Dict[str, Dict[object, list]]] = {}
+        self.day_keys: List[str] = []  # Sorted keys of self.days
+        self.cumulative: List[list] = [[0, 0, 0]]  # [i] sums the days before day_keys[i]
+        self.totals: Dict[str, Dict[object, list]] = self.empty_tables()
+    
+    @staticmethod
+    def empty_tables() -> Dict[str, Dict[object, list]]:
+        return {dimension: {} for dimension in ('day',) + ROLLUP_DIMENSIONS}
+    
+    @staticmethod
+    def merge(table: Dict[object, list], key, count: int, climbs: int, climb_sum: float,
+              climb_max: Optional[float]):
+        cell = table.get(key)
+        if cell is None:
+            table[key] = [count, climbs, climb_sum, climb_max]
+            return
+        cell[0] += count
+        cell[1] += climbs
+        cell[2] += climb_sum
+        if climb_max is not None and (cell[3] is None or climb_max > cell[3]):
+            cell[3] = climb_max
+    
+    def add_group(self, day: str, hour: int, callsign: Optional[str], aircraft_type: Optional[str],
+                  count: int, climbs: int, climb_sum: float, climb_max: Optional[float]):
+        """
+        Count a group of events sharing day, hour, callsign prefix and type. Caller holds the
+        lock and updates self.cumulative (accumulate() or advance()).
+        """
+        tables = self.days.get(day)
+        if tables is None:
+            tables = self.days[day] = self.empty_tables()
+            insort(self.day_keys, day)
+        keys = {'day': day, 'hour': hour, 'airline': airline_prefix(callsign), 'type': aircraft_type}
+        for dimension, key in keys.items():
+            if key is None:
+                continue  # Registrations and unknown types only count towards the totals
+            self.merge(tables[dimension], key, count, climbs, climb_sum, climb_max)
+            self.merge(self.totals[dimension], key, count, climbs, climb_sum, climb_max)
+    
+    def accumulate(self):
+        """Recompute the running totals from the day tables. Caller holds the lock."""
+        self.cumulative = [[0, 0, 0]]
+        for day in self.day_keys:
+            count, climbs, climb_sum, _ = self.days[day]['day'][day]
+            last = self.cumulative[-1]
+            self.cumulative.append([last[0] + count, last[1] + climbs, last[2] + climb_sum])
+    
+    def advance(self, day: str, count: int, climbs: int, climb_sum: float):
+        """Add to the running totals after ``day``. Caller holds the lock and has counted the day."""
+        index = bisect_left(self.day_keys, day)
+        if len(self.cumulative) < len(self.day_keys) + 1:
+            # New day: it starts from the total of the days before it
+            self.cumulative.insert(index + 1, list(self.cumulative[index]))
+        for running in self.cumulative[index + 1:]:  # Only today's entry, unless a late event
+            running[0] += count
+            running[1] += climbs
+            running[2] += climb_sum
+    
+    def add_many(self, log_entries: List[GoAroundLog]):
+        """Count committed events (EventWriter's on_written)."""
+        with self.lock:
+            for log_entry in log_entries:
+                climb = log_entry.max_climb_rate
+                climbs = 0 if climb is None else 1
+                day = log_entry.timestamp.strftime('%Y-%m-%d')
+                self.add_group(day, log_entry.timestamp.hour, log_entry.callsign, log_entry.type,
+                               1, climbs, climb or 0, climb)
+                self.advance(day, 1, climbs, climb or 0)
+    
+    def rebuild(self, store: EventStore):
+        """Recount every stored event."""
+        started = time.perf_counter()
+        with self.lock:
+            self.days.clear()
+            self.day_keys.clear()
+            self.totals = self.empty_tables()
+            for day, hour, head, aircraft_type, count, climbs, climb_sum, climb_max in store.rollup_rows():
+                self.add_group(day, hour, head, aircraft_type, count, climbs, climb_sum or 0, climb_max)
+            self.accumulate()
+        logger.info(f"Rebuilt go-around rollups for {len(self.day_keys)} days in "
+                    f"{(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    def stats(self, first_day: Optional[str] = None, last_day: Optional[str] = None) -> dict:
+        """
+        Rollup tables for the days from first_day to last_day (inclusive, YYYY-MM-DD; None is open).
+        
+        The total takes two lookups in the running totals plus a max over the
+        days; the by_* tables cost one merge of a small table per day in range.
+        """
+        with self.lock:
+            low = bisect_left(self.day_keys, first_day) if first_day else 0
+            high = bisect_right(self.day_keys, last_day) if last_day else len(self.day_keys)
+            if first_day is None and last_day is None:
+                tables = self.totals
+            else:
+                tables = self.empty_tables()
+                for day in self.day_keys[low:high]:
+                    for dimension, table in self.days[day].items():
+                        for key, cell in table.items():
+                            self.merge(tables[dimension], key, *cell)
+            total = [after - before for after, before in zip(self.cumulative[high], self.cumulative[low])]
+            total.append(max((cell[3] for cell in tables['day'].values() if cell[3] is not None), default=None))
+            result = {dimension: self.rows(table) for dimension, table in tables.items()}
+        
+        result['day'].sort(key=lambda row: row['key'])
+        result['hour'].sort(key=lambda row: row['key'])
+        return {
+            'from': first_day,
+            'to': last_day,
+            'total': self.cell_stats(total),
+            **{f"by_{dimension}": rows for dimension, rows in result.items()}
+        }
+    
+    @staticmethod
+    def cell_stats(cell: list) -> dict:
+        count, climbs, climb_sum, climb_max = cell
+        return {
+            'count': count,
+            'mean_climb_rate': round(climb_sum / climbs) if climbs else None,
+            'max_climb_rate': round(climb_max) if climb_max is not None else None
+        }
+    
+    @classmethod
+    def rows(cls, table: Dict[object, list]) -> List[dict]:
+        """Table cells as API rows, most go-arounds first."""
+        rows = [{'key': key, **cls.cell_stats(cell)} for key, cell in table.items()]
+        rows.sort(key=lambda row: -row['count'])
+        return rows
+
+
+# Lists in the /api/go_arounds payload that deltas describe as updated/removed entries
+DELTA_LISTS = ('go_arounds', 'potential_go_arounds_list')
+
+# Polls of changes kept for /api/go_arounds?since=<seq> (10 minutes at the default interval)
+API_JOURNAL_SIZE = 120
+
+
+class ApiSnapshot(NamedTuple):
+    """
+    Immutable read model behind the HTTP API, built once per poll and shared by all requests.
+    
+    Nothing in it is mutated after publication except ``changes_cache``,
+    which request threads only add to.
+    """
+    seq: int
+    etag: str  # Strong validator: hash of body
+    body: bytes
+    status: dict  # Payload fields other than DELTA_LISTS
+    entries: Dict[str, Dict[str, dict]]  # DELTA_LISTS entries by hex, to diff against the next poll
+    journal: Tuple[Tuple[int, dict], ...]  # (seq, delta) of the last API_JOURNAL_SIZE polls, oldest first
+    changes_cache: Dict[int, bytes]  # Serialized ?since= responses against this snapshot
+
+
+def diff_entries(previous: Dict[str, dict], current: Dict[str, dict]) -> dict:
+    """Entries added or changed since ``previous``, and hex ids that are gone."""
+    return {
+        'updated': [entry for hex_id, entry in current.items() if previous.get(hex_id) != entry],
+        'removed': [hex_id for hex_id in previous if hex_id not in current]
+    }
+
+
+def merge_deltas(deltas: List[dict], name: str) -> dict:
+    """Fold consecutive deltas of one list into a single updated/removed change set."""
+    updated: Dict[str, dict] = {}
+    removed: Dict[str, None] = {}
+    for delta in deltas:
+        for hex_id in delta[name]['removed']:
+            updated.pop(hex_id, None)
+            removed[hex_id] = None
+        for entry in delta[name]['updated']:
+            removed.pop(entry['hex_id'], None)
+            updated[entry['hex_id']] = entry
+    return {'updated': list(updated.values()), 'removed': list(removed)}
+
+
+# Seconds between SSE comment lines that keep idle proxies from closing /api/stream
+SSE_HEARTBEAT = 15
+
+# Queued to a stream client that fell behind; it is sent a fresh full snapshot instead
+STREAM_RESYNC = object()
+
+
+def sse_frame(event: str, seq: int, data: bytes) -> bytes:
+    """One server-sent event; JSON from json_dumps never contains raw newlines."""
+    return b'id: %d\nevent: %s\ndata: %s\n\n' % (seq, event.encode(), data)
+
+
+class EventStream:
+    """Fans server-sent events out from the monitor loop to every connected /api/stream client."""
+    
+    def __init__(self, backlog: int = 16):
+        self.backlog = backlog
+        self.clients: set = set()
+        self.lock = threading.Lock()
+        self.resyncs = 0
+    
+    def subscribe(self) -> queue.Queue:
+        client = queue.Queue(maxsize=self.backlog)
+        with self.lock:
+            self.clients.add(client)
+        return client
+    
+    def unsubscribe(self, client: queue.Queue):
+        with self.lock:
+            self.clients.discard(client)
+    
+    def publish(self, seq: int, frame: bytes):
+        """Queue an already-encoded frame for every client without ever blocking the monitor loop."""
+        with self.lock:
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.put_nowait((seq, frame))
+            except queue.Full:
+                # Slow reader: drop its backlog and let it catch up from a full snapshot
+                with client.mutex:
+                    client.queue.clear()
+                client.put_nowait(STREAM_RESYNC)
+                self.resyncs += 1
+    
+    def get_status(self) -> dict:
+        return {'clients': len(self.clients), 'resyncs': self.resyncs}
+
+
+# Upper bounds (seconds) of the poll timing histogram buckets on /metrics
+METRIC_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Timed stages of a poll: HTTP fetch, feed decode, ingest loop, detection, stale cleanup, read model publish
+POLL_STAGES = ('fetch', 'decode', 'ingest', 'detect', 'cleanup', 'publish')
+
+
+class Histogram:
+    """Observation counts per METRIC_BUCKETS bucket (last one is +Inf), with their sum."""
+    __slots__ = ('counts', 'sum')
+    
+    def __init__(self):
+        self.counts = [0] * (len(METRIC_BUCKETS) + 1)
+        self.sum = 0.0
+    
+    def observe(self, value: float):
+        self.counts[bisect_left(METRIC_BUCKETS, value)] += 1
+        self.sum += value
+    
+    def render(self, name: str, labels: str = '') -> List[str]:
+        """Sample lines in Prometheus text format (cumulative buckets)."""
+        sep = ',' if labels else ''
+        lines = []
+        total = 0
+        for bound, count in zip(METRIC_BUCKETS + ('+Inf',), self.counts):
+            total += count
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound}"}} {total}')
+        suffix = f'{{{labels}}}' if labels else ''
+        lines.append(f'{name}_sum{suffix} {self.sum:.6f}')
+        lines.append(f'{name}_count{suffix} {total}')
+        return lines
+
+
+class PollMetrics:
+    """
+    Timing histograms for the monitor loop.
+    
+    Observing is a bisect and two additions per stage, cheap enough to leave
+    on. The lock only keeps a scrape from seeing half of a poll's samples.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = {stage: Histogram() for stage in POLL_STAGES}
+        self.poll = Histogram()
+    
+    def observe(self, **seconds: float):
+        """Record stage timings, e.g. observe(ingest=0.002, detect=0.001)."""
+        with self.lock:
+            for stage, value in seconds.items():
+                self.stages[stage].observe(value)
+    
+    def observe_poll(self, seconds: float):
+        with self.lock:
+            self.poll.observe(seconds)
+    
+    def render(self) -> List[str]:
+        with self.lock:
+            lines = [
+                '# HELP goaround_poll_stage_seconds Time spent in each stage of a poll.',
+                '# TYPE goaround_poll_stage_seconds histogram',
+            ]
+            for stage, histogram in self.stages.items():
+                lines += histogram.render('goaround_poll_stage_seconds', f'stage="{stage}"')
+            lines += [
+                '# HELP goaround_poll_duration_seconds Total time of one poll, fetch to publish.',
+                '# TYPE goaround_poll_duration_seconds histogram',
+            ]
+            lines += self.poll.render('goaround_poll_duration_seconds')
+        return lines
+
+
+def process_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (Linux), or None where /proc is unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Profilers selectable for POST /api/admin/profile and PROFILE_MODE
+PROFILE_MODES = ('cprofile', 'sample')
+
+# Seconds between stack samples in 'sample' mode, and the most polls one request may profile
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_MAX_POLLS = 1000
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a timer while ``sampling`` is set; counts folded stacks."""
+    
+    def __init__(self, thread_id: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.sampling = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.loop, name='profiler', daemon=True)
+        self.thread.start()
+    
+    def loop(self):
+        while not self.stopped.wait(self.interval):
+            if not self.sampling.is_set():
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+    
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+    
+    def report(self) -> str:
+        """Functions by samples spent in them (self) and under them (total)."""
+        total = sum(self.counts.values())
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.counts.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+        lines = [f"{total} samples every {self.interval * 1000:g} ms", '', 'self  total  function']
+        for name, count in own.most_common(40):
+            lines.append(f"{count / total:5.1%} {inclusive[name] / total:6.1%}  {name}")
+        return '\n'.join(lines) + '\n'
+
+
+class PollProfiler:
+    """
+    Profiles the next N polls of the monitor loop without stopping it.
+    
+    A request (from the admin endpoint or PROFILE_POLLS) is picked up by the
+    monitor thread at the start of its next poll. When the last profiled poll
+    ends, the reports are written to the profiles directory:
+    
+    - cprofile: ``<name>.pstats`` and a cumulative-time ``<name>.txt``
+    - sample: ``<name>.folded`` (flame graph input) and a per-function ``<name>.txt``
+    - with memory: ``<name>-alloc.txt``, the top allocations by line and the
+      growth over the profiled polls, from tracemalloc
+    """
+    
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.pending: Optional[Tuple[str, int, str, bool]] = None  # (name, polls, mode, memory)
+        self.name: Optional[str] = None  # Profile in progress
+        self.remaining = 0
+        self.mode = PROFILE_MODES[0]
+        self.memory = False
+        self.profile: Optional[cProfile.Profile] = None
+        self.sampler: Optional[StackSampler] = None
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.started_tracing = False
+        self.last_profile: Optional[str] = None
+    
+    def request(self, polls: int, mode: str = 'cprofile', memory: bool = True) -> str:
+        """Queue a profile of the next ``polls`` polls; RuntimeError if one is already queued or running."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(PROFILE_MODES)}")
+        if not 1 <= polls <= PROFILE_MAX_POLLS:
+            raise ValueError(f"polls must be between 1 and {PROFILE_MAX_POLLS}")
+        with self.lock:
+            if self.pending is not None or self.name is not None:
+                raise RuntimeError('a profile is already in progress')
+            name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{mode}"
+            self.pending = (name, polls, mode, memory)
+        logger.info(f"Profiling the next {polls} polls ({mode}{', tracemalloc' if memory else ''}) as {name}")
+        return name
+    
+    def before_poll(self):
+        """Start or resume profiling for this poll (monitor thread)."""
+        if self.name is None:
+            if self.pending is None:
+                return
+            with self.lock:
+                self.name, self.remaining, self.mode, self.memory = self.pending
+                self.pending = None
+            if self.memory:
+                self.started_tracing = not tracemalloc.is_tracing()
+                if self.started_tracing:
+                    tracemalloc.start()
+                self.baseline = tracemalloc.take_snapshot()
+            if self.mode == 'cprofile':
+                self.profile = cProfile.Profile()
+            else:
+                self.sampler = StackSampler(threading.get_ident())
+        
+        if self.profile is not None:
+            self.profile.enable()
+        else:
+            self.sampler.sampling.set()
+    
+    def after_poll(self):
+        """Pause profiling after a poll, and write the reports after the last one."""
+        if self.name is None:
+            return
+        if self.profile is not None:
+            self.profile.disable()
+        else:
+            self.sampler.sampling.clear()
+        self.remaining -= 1
+        if self.remaining <= 0:
+            try:
+                self.write_reports()
+            except OSError as e:
+                logger.error(f"Failed to write profile {self.name}: {e}")
+            finally:
+                self.finish()
+    
+    def write_reports(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        base = self.directory / self.name
+        if self.profile is not None:
+            self.profile.dump_stats(f"{base}.pstats")
+            out = io.StringIO()
+            pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(60)
+            Path(f"{base}.txt").write_text(out.getvalue())
+        else:
+            Path(f"{base}.folded").write_text(
+                ''.join(f"{stack} {count}\n" for stack, count in self.sampler.counts.items())
+            )
+            Path(f"{base}.txt").write_text(self.sampler.report())
+        
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            ))
+            lines = ['Top allocations by line:']
+            lines += [str(stat) for stat in snapshot.statistics('lineno')[:30]]
+            lines += ['', 'Growth over the profiled polls:']
+            lines += [str(stat) for stat in snapshot.compare_to(self.baseline, 'lineno')[:30]]
+            Path(f"{base}-alloc.txt").write_text('\n'.join(lines) + '\n')
+        logger.info(f"Profile {self.name} written to {self.directory}")
+    
+    def finish(self):
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.started_tracing:
+            tracemalloc.stop()
+        with self.lock:
+            self.last_profile = self.name
+            self.name = None
+        self.profile = self.sampler = self.baseline = None
+        self.started_tracing = False
+    
+    def files(self) -> List[dict]:
+        """Report files in the profiles directory, newest first."""
+        if not self.directory.is_dir():
+            return []
+        entries = sorted(
+            (path for path in self.directory.iterdir() if path.is_file()),
+            key=lambda path: path.stat().st_mtime, reverse=True
+        )
+        return [
+            {'name': path.name, 'bytes': path.stat().st_size,
+             'modified': datetime.fromtimestamp(path.stat().st_mtime).isoformat()}
+            for path in entries
+        ]
+    
+    def get_status(self) -> dict:
+        with self.lock:
+            return {
+                'pending': self.pending[0] if self.pending else None,
+                'running': self.name,
+                'remaining_polls': self.remaining if self.name else 0,
+                'last_profile': self.last_profile
+            }
+
+
+class PollScheduler:
+    """
+    Fixed-rate poll deadlines on the monotonic clock.
+    
+    Ticks are spaced by the interval from the previous tick, not from the end
+    of the poll, so fetch and processing time no longer stretch the period. A
+    poll that runs past the next tick is an overrun: the ticks it missed are
+    skipped and polling resumes at the next tick still ahead.
+    """
+    
+    def __init__(self, interval: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline: Optional[float] = None  # Tick the current poll started on
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.last_overrun: Optional[float] = None  # Seconds the last overrun ran past its tick
+        self.last_warning = -math.inf
+    
+    def start(self):
+        self.deadline = self.clock()
+    
+    def wait(self, interval: Optional[float] = None):
+        """Sleep until the tick ``interval`` (default: the base interval) after the current one."""
+        interval = interval or self.interval
+        now = self.clock()
+        if self.deadline is None or interval <= 0:
+            self.deadline = now
+            if interval <= 0:
+                return
+        next_tick = self.deadline + interval
+        if now > next_tick:
+            missed = int((now - self.deadline) // interval)
+            self.overruns += 1
+            self.skipped_ticks += missed
+            self.last_overrun = now - next_tick
+            next_tick = self.deadline + (missed + 1) * interval
+            if now - self.last_warning >= 60:
+                self.last_warning = now
+                logger.warning(
+                    f"Poll overran its {interval:g}s interval by {self.last_overrun:.2f}s "
+                    f"({self.overruns} overruns, {self.skipped_ticks} ticks skipped so far)"
+                )
+        self.deadline = next_tick
+        self.sleep(max(0.0, next_tick - now))
+    
+    def get_status(self) -> dict:
+        return {
+            'overruns': self.overruns,
+            'skipped_ticks': self.skipped_ticks,
+            'last_overrun_ms': round(self.last_overrun * 1000, 1) if self.last_overrun is not None else None
+        }
+
+
+# Seconds without a new position after which an aircraft is dropped (and its go-around finished)
+STALE_AIRCRAFT_AGE = 60
+
+# readsb rounds now and seen_pos to 0.1 s, so a repeated fix can appear up to ~0.1 s newer
+STALE_FIX_TOLERANCE = 0.15
+
+
+class TAR1090Monitor:
+    def __init__(
+        self,
+        server_url: str,
+        update_interval: int = 5,
+        public_url: str = None,
+        detector: Optional[GoAroundDetector] = None,
+        data_dir: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+        source_timeout: Optional[float] = None,
+        feed_format: str = 'json',
+        runways: Optional[RunwayIndex] = None,
+        geofences: Optional[Geofences] = None,
+        fast_interval: Optional[float] = None,
+        idle_interval: Optional[float] = None,
+        track_retention: Optional[float] = None,
+        track_point_budget: int = TRACK_POINT_BUDGET,
+        event_flush_interval: float = EVENT_FLUSH_INTERVAL,
+        event_queue_size: int = EVENT_QUEUE_SIZE,
+        event_sync: str = 'normal',
+        archive_months: int = ARCHIVE_MONTHS
+    ):
+        # server_url may list several receivers separated by commas. Fetches must fit the
+        # fastest interval the scheduler can pick, or every fast tick would overrun.
+        fastest_poll = min(interval for interval in (update_interval, fast_interval) if interval)
+        self.sources = [
+            FeedSource(
+                url.strip(), timeout=source_timeout or max(0.2, fastest_poll * 0.8),
+                decoder=FEED_DECODERS[feed_format]()
+            )
+            for url in server_url.split(',') if url.strip()
+        ]
+        self.server_url = self.sources[0].url
+        self.public_url = (public_url.split(',')[0].strip().rstrip('/') if public_url else self.server_url)
+        self.update_interval = update_interval
+        self.fast_interval = fast_interval  # Used while low aircraft (or a go-around) are being tracked
+        self.idle_interval = idle_interval  # Used while nothing is tracked
+        self.poll_interval = update_interval
+        self.low_aircraft = 0  # Tracked aircraft below the low-altitude threshold inside a geofence
+        self.scheduler = PollScheduler(update_interval)
+        # Headroom beyond one worker per source, so a hung fetch never delays the others' threads
+        self.executor = (
+            ThreadPoolExecutor(max_workers=2 * len(self.sources), thread_name_prefix='feed')
+            if len(self.sources) > 1 else None
+        )
+        self.pending_fetches: Dict[FeedSource, Future] = {}  # Latest fetch submitted per source
+        # Ordered by last fix and last sighting (oldest first), so stale entries are found at the front
+        self.aircraft: 'OrderedDict[str, Aircraft]' = OrderedDict()
+        self.detector = detector if detector is not None else BatchGoAroundDetector()
+        # Tracks hold the detector window plus a margin at the fastest poll rate (one fix per poll at most)
+        self.track_retention = track_retention or self.detector.time_window + TRACK_RETENTION_MARGIN
+        fastest = max(1.0, min(update_interval or 1.0, fast_interval or update_interval or 1.0))
+        self.tracks = TrackStore(
+            max(TRACK_MIN_CAPACITY, math.ceil(self.track_retention / fastest) + 1),
+            point_budget=track_point_budget
+        )
+        self.track_evictions = 0   # Aircraft dropped to stay within the point budget
+        self.track_rejections = 0  # New aircraft left untracked because the budget is used up
+        self.metrics = PollMetrics()
+        self.runways = runways
+        self.geofences = geofences
+        self.untracked: 'OrderedDict[str, float]' = OrderedDict()  # Outside every geofence: hex -> last seen
+        self.clock = clock
+        self.running = False
+        
+        # Statistics
+        self.total_requests = 0
+        self.failed_requests = 0
+        self.unchanged_polls = 0
+        self.stale_positions_skipped = 0
+        self.last_poll_latency: Optional[float] = None
+        self.last_update = None
+        self.receiver_time: Optional[float] = None  # Newest snapshot time on the receiver clock
+        self.go_arounds_detected_today = 0
+        self.go_arounds_detected_total = 0
+        self.last_detection_date = datetime.fromtimestamp(self.clock()).date()
+        self.events_logged = 0
+        self.geofence_skipped = 0          # Aircraft skipped by the pre-filter in the last poll
+        self.geofence_skipped_total = 0
+        self.geofence_filter_time = 0.0    # Seconds the pre-filter took in the last poll
+        self.tracked_cost: Optional[float] = None  # Seconds of ingest + detection per tracked fix (moving average)
+        self.geofence_saved: Optional[float] = None  # Estimated seconds saved in the last poll
+        self.geofence_saved_total = 0.0
+        
+        # Active go-arounds
+        self.active_go_arounds: Dict[str, dict] = {}
+        
+        # Event storage
+        self.data_dir = Path(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.events = EventStore(
+            self.data_dir / "go_arounds.db", synchronous=event_sync, archive=EventArchive(self.data_dir / "archive")
+        )
+        self.archive_months = archive_months  # 0 keeps every event in the database
+        self.next_archive_check = 0.0
+        self.archiver: Optional[threading.Thread] = None
+        self.csv_file = self.data_dir / "go_around_detections.csv"
+        self.import_legacy_csv()
+        self.rollups = HistoryRollups()
+        self.rollups.rebuild(self.events)
+        self.event_writer = EventWriter(self.events, max_queue=event_queue_size, flush_interval=event_flush_interval,
+                                        on_written=self.rollups.add_many)
+        self.profiler = PollProfiler(self.data_dir / "profiles")
+        
+        # Read model for HTTP handlers: rebuilt by the monitor thread once per poll and swapped in
+        # with one reference assignment, so readers never see tracker state mid-update.
+        # Sequence numbers start at wall-clock milliseconds so they keep increasing across restarts.
+        self.api_seq = int(time.time() * 1000)
+        self.stream = EventStream()
+        self.api_snapshot: Optional[ApiSnapshot] = None
+        self.publish_api_snapshot()
+    
+    def import_legacy_csv(self):
+        """Move events from the CSV log used by earlier versions into the event store, once."""
+        if not self.csv_file.exists():
+            return
+        imported = self.events.import_csv(self.csv_file)
+        self.csv_file.rename(self.csv_file.with_name(self.csv_file.name + '.imported'))
+        logger.info(f"Imported {imported} go-arounds from {self.csv_file}")
+    
+    def log_go_around(self, log_entry: GoAroundLog):
+        """Queue a completed go-around event for the background writer."""
+        if self.event_writer.submit(log_entry):
+            self.events_logged += 1  # Rollups count it once the writer commits it
+    
+    def archive_events(self) -> int:
+        """Move months older than archive_months out of the event database; returns events moved."""
+        try:
+            return self.events.rotate(month_start(self.clock(), self.archive_months - 1))
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Archiving go-arounds failed: {e}")
+            return 0
+    
+    def maybe_archive(self):
+        """Start archiving on a background thread at most once per ARCHIVE_CHECK_INTERVAL."""
+        now = self.clock()
+        if not self.archive_months or now < self.next_archive_check:
+            return
+        self.next_archive_check = now + ARCHIVE_CHECK_INTERVAL
+        if self.archiver is None or not self.archiver.is_alive():
+            self.archiver = threading.Thread(target=self.archive_events, name='event-archiver', daemon=True)
+            self.archiver.start()
+    
+    def stop(self):
+        """Stop polling and write out queued events."""
+        self.running = False
+        self.event_writer.close()
+    
+    def fetch_aircraft_data(self) -> bool:
+        """Fetch aircraft data from all TAR1090 sources and process the merged snapshot."""
+        started = time.perf_counter()
+        
+        if self.executor is None:
+            if self.sources[0].backing_off():
+                self.failed_requests += 1
+                return False
+            results = [self.sources[0].fetch()]
+            polled = self.sources[:1]
+        else:
+            # Poll every receiver concurrently; sources missing the deadline are skipped this poll.
+            # A source whose last fetch is still running is not polled again: FeedSource isn't
+            # safe to use from two threads, and a stuck source shouldn't pile up requests.
+            futures = {}
+            for source in self.sources:
+                previous = self.pending_fetches.get(source)
+                if previous is not None and not previous.done():
+                    source.busy_skips += 1
+                    continue
+                if source.backing_off():
+                    continue
+                future = self.pending_fetches[source] = self.executor.submit(source.fetch)
+                futures[future] = source
+            done, late = wait(futures, timeout=max(source.timeout for source in self.sources))
+            for future in late:
+                futures[future].deadline_misses += 1
+            results = [future.result() for future in done]
+            polled = [futures[future] for future in done]
+        
+        self.last_poll_latency = time.perf_counter() - started
+        for source in polled:
+            decode = source.last_decode_time
+            if decode is None:
+                self.metrics.observe(fetch=source.last_latency)
+            else:
+                self.metrics.observe(fetch=source.last_latency - decode, decode=decode)
+        snapshots = [result for result in results if result is not None and result is not NOT_MODIFIED]
+        
+        if not snapshots:
+            if NOT_MODIFIED in results:
+                # Nothing new anywhere; don't append duplicate positions
+                self.unchanged_polls += 1
+                return True
+            self.failed_requests += 1
+            return False
+        
+        self.process_snapshot(snapshots[0] if len(snapshots) == 1 else merge_snapshots(snapshots))
+        return True
+    
+    def process_snapshot(self, snapshot: Snapshot):
+        """Ingest one decoded snapshot and run go-around detection on it."""
+        self.total_requests += 1
+        current_time = self.clock()
+        self.last_update = datetime.fromtimestamp(current_time)
+        
+        # Reset daily counter if new day
+        if self.last_update.date() != self.last_detection_date:
+            self.go_arounds_detected_today = 0
+            self.last_detection_date = self.last_update.date()
+        
+        perf = time.perf_counter
+        t0 = perf()
+        updated_aircraft = self.ingest_snapshot(snapshot, current_time)
+        t1 = perf()
+        self.detect_go_arounds(updated_aircraft)
+        t2 = perf()
+        if self.geofences is not None:
+            self.record_geofence_savings(t2 - t0, len(updated_aircraft))
+        self.cleanup_aircraft(current_time)
+        self.metrics.observe(ingest=t1 - t0, detect=t2 - t1, cleanup=perf() - t2)
+        
+        self.low_aircraft = self.count_low_aircraft()
+    
+    def count_low_aircraft(self) -> int:
+        """
+        Tracked aircraft whose last fix is below the low-altitude threshold inside a geofence.
+        
+        Counted over every tracked aircraft, not just those with a fix this poll,
+        so a skipped update doesn't drop the scheduler back to the slow interval.
+        Always 0 without geofences: fast polling is for traffic at watched airports.
+        """
+        if self.geofences is None:
+            return 0
+        threshold = self.detector.low_altitude_threshold
+        contains = self.geofences.contains
+        count = 0
+        for aircraft in self.aircraft.values():
+            track = aircraft.path
+            if not track.length:
+                continue
+            altitude = track.get('altitude')
+            if altitude is not None and altitude < threshold and contains(track.get('lat'), track.get('lon'), altitude):
+                count += 1
+        return count
+    
+    def record_geofence_savings(self, elapsed: float, tracked: int):
+        """
+        Estimate the CPU time the geofence pre-filter saved this poll.
+        
+        Skipped aircraft would each have cost about as much as a tracked fix
+        (ingest + detection, averaged over recent polls); the filter's own time
+        is subtracted.
+        """
+        if tracked:
+            cost = (elapsed - self.geofence_filter_time) / tracked
+            self.tracked_cost = cost if self.tracked_cost is None else 0.9 * self.tracked_cost + 0.1 * cost
+        if self.tracked_cost is not None:
+            self.geofence_saved = self.geofence_skipped * self.tracked_cost - self.geofence_filter_time
+            self.geofence_saved_total += self.geofence_saved
+    
+    def ingest_snapshot(self, snapshot: Snapshot, current_time: float) -> List[Aircraft]:
+        """Update aircraft and tracks from a snapshot; returns the aircraft with a new fix."""
+        snapshot_time = snapshot.now or current_time
+        self.receiver_time = snapshot_time
+        updated_aircraft = []
+        records = snapshot.aircraft
+        if self.geofences is not None:
+            records = self.prefilter(records, current_time)
+        
+        known = self.aircraft
+        for record in records:
+            hex_id = record.hex_id
+            
+            # Create or update aircraft; it moves to the recent end once it has a new fix
+            seen_pos = record.seen_pos
+            aircraft = known.get(hex_id)
+            if aircraft is None:
+                if seen_pos is not None and seen_pos > STALE_AIRCRAFT_AGE:
+                    # In the feed, but its position is too old to start a track with
+                    self.untracked[hex_id] = current_time
+                    self.untracked.move_to_end(hex_id)
+                    continue
+                if self.tracks.full and not self.make_track_room(record.altitude, current_time):
+                    # Over the point budget with nothing evictable: only note it as seen
+                    self.track_rejections += 1
+                    self.untracked[hex_id] = current_time
+                    self.untracked.move_to_end(hex_id)
+                    continue
+                self.untracked.pop(hex_id, None)
+                aircraft = known[hex_id] = Aircraft(
+                    hex_id=hex_id,
+                    callsign=record.callsign if record.callsign is not None else hex_id,
+                    path=self.tracks.acquire()
+                )
+            
+            aircraft.last_update = current_time
+            if record.callsign is not None:
+                aircraft.callsign = record.callsign
+            aircraft.type = record.type
+            aircraft.category = record.category
+            
+            # Stamp the fix with its real age and skip it if it is the last one seen again
+            # (not newer beyond readsb's rounding, or at the same position)
+            fix_time = snapshot_time - seen_pos if seen_pos is not None else snapshot_time
+            track = aircraft.path
+            if track.length:
+                slot = track.slot(-1)
+                if (fix_time <= track.timestamp[slot] + STALE_FIX_TOLERANCE
+                        or (record.lat == track.lat[slot] and record.lon == track.lon[slot])):
+                    self.stale_positions_skipped += 1
+                    continue
+            
+            # Add to track
+            track.append(record.lat, record.lon, fix_time, record.altitude, record.speed, record.vert_rate)
+            aircraft.last_fix = current_time
+            known.move_to_end(hex_id)
+            self.detector.observe(aircraft)
+            updated_aircraft.append(aircraft)
+        
+        return updated_aircraft
+    
+    def make_track_room(self, altitude: Optional[float], current_time: float) -> bool:
+        """
+        Evict one aircraft so a new one at ``altitude`` can be tracked; False if it should not be.
+        
+        Aircraft above the geofence ceiling (DEFAULT_FENCE_CEILING without
+        fences) are the least relevant: a new one that high is not tracked at
+        all, and among the TRACK_EVICTION_SCAN aircraft with the oldest fixes the
+        first one that high is evicted, else the one with the oldest fix. Aircraft
+        in a go-around, or with a fix this poll, are never evicted.
+        """
+        ceiling = self.geofences.ceiling if self.geofences is not None else DEFAULT_FENCE_CEILING
+        if altitude is not None and altitude > ceiling:
+            return False
+        victim = None
+        for hex_id, aircraft in islice(self.aircraft.items(), TRACK_EVICTION_SCAN):
+            if aircraft.last_fix >= current_time:
+                break  # Fixed this poll, and so is everything after it
+            if hex_id in self.active_go_arounds:
+                continue
+            altitude = aircraft.path.last('altitude')
+            if altitude is not None and altitude > ceiling:
+                victim = aircraft
+                break
+            if victim is None:
+                victim = aircraft
+        if victim is None:
+            return False
+        del self.aircraft[victim.hex_id]
+        self.tracks.release(victim.path)
+        self.track_evictions += 1
+        # Still seen, like aircraft outside the fences, until it leaves the feed
+        self.untracked[victim.hex_id] = victim.last_update
+        self.untracked.move_to_end(victim.hex_id)
+        return True
+    
+    def prefilter(self, records: List[AircraftRecord], current_time: float) -> List[AircraftRecord]:
+        """
+        Return the records inside a geofence; the rest are only noted as last seen.
+        
+        Aircraft outside every fence or above its ceiling get no track and no
+        detection. A tracked aircraft leaving the fences is dropped back to last
+        seen, unless it is in the middle of a go-around.
+        """
+        started = time.perf_counter()
+        contains = self.geofences.contains
+        untracked = self.untracked
+        inside = []
+        for record in records:
+            hex_id = record.hex_id
+            if contains(record.lat, record.lon, record.altitude) or hex_id in self.active_go_arounds:
+                inside.append(record)
+                if hex_id in untracked:
+                    del untracked[hex_id]
+                continue
+            untracked[hex_id] = current_time
+            untracked.move_to_end(hex_id)
+            aircraft = self.aircraft.pop(hex_id, None)
+            if aircraft is not None:
+                self.tracks.release(aircraft.path)
+        
+        self.geofence_skipped = len(records) - len(inside)
+        self.geofence_skipped_total += self.geofence_skipped
+        self.geofence_filter_time = time.perf_counter() - started
+        return inside
+    
+    def detect_go_arounds(self, updated_aircraft: List[Aircraft]):
+        """Detect go-arounds for aircraft with a new fix and update active events."""
+        detections = self.detector.detect_batch(updated_aircraft)
+        
+        for aircraft in updated_aircraft:
+            # Events are timed by the fix itself, not by when we polled it
+            track = aircraft.path
+            fix_time = track.timestamp[track.slot(-1)]
+            self.handle_detection(aircraft, detections.get(aircraft.hex_id), fix_time)
+    
+    def cleanup_aircraft(self, current_time: float):
+        """
+        Drop aircraft without a new fix for STALE_AIRCRAFT_AGE seconds, and untracked ones not seen for as long.
+        
+        Tracked aircraft are kept in last-fix order and untracked ones in
+        last-sighting order, so this pops stale entries off the front and stops
+        at the first fresh one. An aircraft still in the feed with stale data
+        (parked, or an MLAT dropout) is dropped too, and counted as seen until
+        it goes; a go-around still in progress on it is finished as of its last fix.
+        """
+        cutoff = current_time - STALE_AIRCRAFT_AGE
+        aircraft_table = self.aircraft
+        while aircraft_table:
+            hex_id, aircraft = next(iter(aircraft_table.items()))
+            if aircraft.last_fix >= cutoff:
+                break
+            del aircraft_table[hex_id]
+            if hex_id in self.active_go_arounds:
+                logger.info(f"No new position from {aircraft.callsign} ({hex_id}) during a go-around")
+                self.finish_go_around(aircraft, aircraft.path.last('timestamp') or aircraft.last_fix)
+            self.tracks.release(aircraft.path)
+            if aircraft.last_update >= cutoff:
+                self.untracked[hex_id] = aircraft.last_update  # Stale data, but still in the feed
+        
+        untracked = self.untracked
+        while untracked:
+            hex_id, last_seen = next(iter(untracked.items()))
+            if last_seen >= cutoff:
+                break
+            del untracked[hex_id]
+    
+    def handle_detection(self, aircraft: Aircraft, detection: Optional[GoAroundDetection], event_time: float):
+        """Start, update or finish a go-around event from the detection result for a new fix."""
+        hex_id = aircraft.hex_id
+        
+        if detection is not None and detection.is_go_around:
+            if hex_id not in self.active_go_arounds:
+                # New go-around detected; match where it started against the runway index
+                track = aircraft.path
+                runway = (
+                    self.runways.match(track.last('lat'), track.last('lon'), track_course(track))
+                    if self.runways is not None else None
+                )
+                self.active_go_arounds[hex_id] = {
+                    'aircraft': aircraft,
+                    'detection': detection,
+                    'start_time': event_time,
+                    'min_altitude': detection.min_altitude,
+                    'max_climb_rate': detection.climb_rate,
+                    'runway': runway
+                }
+                self.go_arounds_detected_today += 1
+                self.go_arounds_detected_total += 1
+                
+                at = f" at {runway.airport} runway {runway.runway}" if runway is not None else ''
+                logger.info(f"Go-around detected: {aircraft.callsign} ({hex_id}){at} - {detection.trigger_reason}")
+            else:
+                # Update existing go-around
+                go_around_data = self.active_go_arounds[hex_id]
+                go_around_data['detection'] = detection
+                go_around_data['max_climb_rate'] = max(
+                    go_around_data['max_climb_rate'],
+                    detection.climb_rate
+                )
+        elif hex_id in self.active_go_arounds:
+            self.finish_go_around(aircraft, event_time)
+    
+    def finish_go_around(self, aircraft: Aircraft, event_time: float):
+        """End the aircraft's active go-around, logging it if it lasted long enough."""
+        hex_id = aircraft.hex_id
+        go_around_data = self.active_go_arounds.pop(hex_id)
+        duration = int(event_time - go_around_data['start_time'])
+        track = aircraft.path
+        runway = go_around_data['runway']
+        
+        # Log the completed go-around
+        if duration > 10:  # Only log if it lasted more than 10 seconds
+            log_entry = GoAroundLog(
+                timestamp=datetime.fromtimestamp(event_time),
+                hex_id=hex_id,
+                callsign=aircraft.callsign,
+                lat=track.last('lat'),
+                lon=track.last('lon'),
+                min_altitude=go_around_data['min_altitude'],
+                max_climb_rate=go_around_data['max_climb_rate'],
+                duration=duration,
+                confidence=go_around_data['detection'].confidence,
+                tar1090_url=f"{self.public_url}/?icao={hex_id}",
+                type=aircraft.type,
+                airport=runway.airport if runway is not None else None,
+                runway=runway.runway if runway is not None else None
+            )
+            self.log_go_around(log_entry)
+            logger.info(f"Go-around completed: {aircraft.callsign} ({hex_id}) - Duration: {duration}s")
+    
+    def next_interval(self) -> float:
+        """
+        Poll period until the next tick.
+        
+        Fast while a go-around is in progress or low aircraft are inside a
+        geofence (count_low_aircraft()), idle while nothing is tracked.
+        """
+        if self.fast_interval and (self.low_aircraft or self.active_go_arounds):
+            return self.fast_interval
+        if self.idle_interval and not self.aircraft:
+            return self.idle_interval
+        return self.update_interval
+    
+    def run(self):
+        """Main monitoring loop, polling on fixed-rate ticks."""
+        self.running = True
+        logger.info(f"Starting TAR1090 monitor for {', '.join(source.url for source in self.sources)}")
+        self.publish_api_snapshot()
+        self.scheduler.start()
+        
+        while self.running:
+            try:
+                self.profiler.before_poll()
+                try:
+                    started = time.perf_counter()
+                    self.fetch_aircraft_data()
+                    published = time.perf_counter()
+                    self.publish_api_snapshot()
+                    finished = time.perf_counter()
+                finally:
+                    self.profiler.after_poll()
+                self.metrics.observe(publish=finished - published)
+                self.metrics.observe_poll(finished - started)
+                self.maybe_archive()
+                self.poll_interval = self.next_interval()
+                self.scheduler.wait(self.poll_interval)
+            except KeyboardInterrupt:
+                logger.info("Monitoring stopped by user")
+                self.running = False
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                self.scheduler.wait(self.update_interval)
+    
+    def get_status(self) -> dict:
+        """Get current monitoring status."""
+        return {
+            'running': self.running,
+            'server_url': self.server_url,
+            'total_aircraft': len(self.aircraft) + len(self.untracked),
+            'tracked_aircraft': len(self.aircraft),
+            'path_points': sum(len(aircraft.path) for aircraft in self.aircraft.values()),
+            'tracks': {
+                'retention_s': self.track_retention,
+                **self.tracks.stats(),
+                'evictions': self.track_evictions,
+                'rejections': self.track_rejections
+            },
+            'active_go_arounds': len(self.active_go_arounds),
+            'potential_go_arounds': sum(
+                1 for a in self.aircraft.values()
+                if (altitude := a.path.last('altitude')) and altitude < 2000
+            ),
+            'detected_today': self.go_arounds_detected_today,
+            'detected_total': self.go_arounds_detected_total,
+            'events_logged': self.events_logged,
+            'total_requests': self.total_requests,
+            'failed_requests': self.failed_requests,
+            'unchanged_polls': self.unchanged_polls,
+            'stale_positions_skipped': self.stale_positions_skipped,
+            'last_update': self.last_update.isoformat() if self.last_update else None,
+            'poll_latency_ms': round(self.last_poll_latency * 1000, 1) if self.last_poll_latency is not None else None,
+            'json_backend': JSON_BACKEND,
+            'geofence': self.get_geofence_status(),
+            'scheduler': {'interval': self.poll_interval, **self.scheduler.get_status()},
+            'event_writer': self.event_writer.get_status(),
+            'archive': self.events.archive.get_status(),
+            'stream': self.stream.get_status(),
+            'sources': [source.get_status() for source in self.sources]
+        }
+    
+    def get_geofence_status(self) -> Optional[dict]:
+        """Pre-filter counters, or None when no geofences are configured."""
+        if self.geofences is None:
+            return None
+        return {
+            'fences': [fence.name for fence in self.geofences.fences],
+            'untracked_aircraft': len(self.untracked),
+            'skipped_last_poll': self.geofence_skipped,
+            'skipped_total': self.geofence_skipped_total,
+            'filter_ms': round(self.geofence_filter_time * 1000, 2),
+            'cpu_saved_ms_last_poll': round(self.geofence_saved * 1000, 2) if self.geofence_saved is not None else None,
+            'cpu_saved_s_total': round(self.geofence_saved_total, 3)
+        }
+    
+    def get_go_around_data(self) -> dict:
+        """Get current go-around data for API."""
+        go_arounds = []
+        potential_go_arounds = []
+        
+        for hex_id, go_around_data in self.active_go_arounds.items():
+            aircraft = go_around_data['aircraft']
+            detection = go_around_data['detection']
+            runway = go_around_data['runway']
+            track = aircraft.path
+            
+            if track:
+                recent = track.view(20)
+                go_arounds.append({
+                    'hex_id': hex_id,
+                    'callsign': aircraft.callsign,
+                    'current_lat': recent.lat[-1],
+                    'current_lon': recent.lon[-1],
+                    'current_alt': optional_float(recent.altitude[-1]),
+                    'vert_rate': optional_float(recent.vert_rate[-1]),
+                    'speed': optional_float(recent.speed[-1]),
+                    'min_altitude': detection.min_altitude,
+                    'max_climb_rate': go_around_data['max_climb_rate'],
+                    'confidence': detection.confidence,
+                    # Receiver clock on both sides, like the event times
+                    'duration': int(max(0, self.receiver_time - go_around_data['start_time'])),
+                    'trigger_reason': detection.trigger_reason,
+                    'airport': runway.airport if runway is not None else None,
+                    'runway': runway.runway if runway is not None else None,
+                    'tar1090_url': f"{self.public_url}/?icao={hex_id}",
+                    'recent_path': [{'lat': lat, 'lon': lon} for lat, lon in zip(recent.lat, recent.lon)]
+                })
+        
+        # Find potential go-arounds (low altitude aircraft)
+        for hex_id, aircraft in self.aircraft.items():
+            track = aircraft.path
+            if hex_id not in self.active_go_arounds and track:
+                slot = track.slot(-1)
+                altitude = optional_float(track.altitude[slot])
+                if altitude and altitude < 2000:
+                    potential_go_arounds.append({
+                        'hex_id': hex_id,
+                        'callsign': aircraft.callsign,
+                        'current_lat': track.lat[slot],
+                        'current_lon': track.lon[slot],
+                        'current_alt': altitude,
+                        'vert_rate': optional_float(track.vert_rate[slot]),
+                        'speed': optional_float(track.speed[slot])
+                    })
+        
+        status = self.get_status()
+        return {
+            **status,
+            'go_arounds': go_arounds,
+            'potential_go_arounds_list': potential_go_arounds
+        }
+    
+    def publish_api_snapshot(self) -> ApiSnapshot:
+        """
+        Serialize the current go-around data once and make it the response for every client.
+        
+        The difference from the previous snapshot is journaled for ?since=
+        requests and pushed to stream clients as a delta event.
+        """
+        self.api_seq += 1
+        data = {'seq': self.api_seq, **self.get_go_around_data()}
+        body = json_dumps(data)
+        status = {key: value for key, value in data.items() if key not in DELTA_LISTS}
+        entries = {name: {entry['hex_id']: entry for entry in data[name]} for name in DELTA_LISTS}
+        
+        previous = self.api_snapshot
+        journal = ()
+        delta = None
+        if previous is not None:
+            delta = {**status, **{name: diff_entries(previous.entries[name], entries[name]) for name in DELTA_LISTS}}
+            journal = previous.journal[-(API_JOURNAL_SIZE - 1):] + ((self.api_seq, delta),)
+        
+        snapshot = ApiSnapshot(
+            self.api_seq, hashlib.blake2b(body, digest_size=12).hexdigest(), body,
+            status, entries, journal, {}
+        )
+        self.api_snapshot = snapshot
+        
+        if delta is not None and self.stream.clients:
+            self.stream.publish(snapshot.seq, sse_frame('delta', snapshot.seq, json_dumps(delta)))
+        return snapshot
+    
+    def get_metrics(self) -> str:
+        """Prometheus text exposition: poll timing histograms plus gauges from the last published status."""
+        status = self.api_snapshot.status
+        lines = self.metrics.render()
+        values = [
+            ('goaround_tracked_aircraft', 'gauge', 'Aircraft with a position track.', status['tracked_aircraft']),
+            ('goaround_seen_aircraft', 'gauge', 'Aircraft in the feed, tracked or not.', status['total_aircraft']),
+            ('goaround_path_points', 'gauge', 'Positions held across all tracks.', status['path_points']),
+            ('goaround_track_points_allocated', 'gauge', 'Track slots allocated to tracked aircraft.',
+             status['tracks']['points_allocated']),
+            ('goaround_track_point_budget', 'gauge', 'Most track slots that may be allocated.',
+             status['tracks']['point_budget']),
+            ('goaround_track_evictions_total', 'counter', 'Aircraft evicted to stay within the point budget.',
+             status['tracks']['evictions']),
+            ('goaround_active_go_arounds', 'gauge', 'Go-arounds in progress.', status['active_go_arounds']),
+            ('goaround_process_resident_memory_bytes', 'gauge', 'Resident set size of the process.', process_rss()),
+            ('goaround_polls_total', 'counter', 'Snapshots processed.', status['total_requests']),
+            ('goaround_failed_polls_total', 'counter', 'Polls where every source failed.', status['failed_requests']),
+            ('goaround_unchanged_polls_total', 'counter', 'Polls with no new data.', status['unchanged_polls']),
+            ('goaround_go_arounds_detected_total', 'counter', 'Go-arounds detected since start.', status['detected_total']),
+            ('goaround_events_logged_total', 'counter', 'Go-around events stored since start.', status['events_logged']),
+            ('goaround_event_queue_depth', 'gauge', 'Events waiting for the background writer.',
+             status['event_writer']['queued']),
+            ('goaround_events_written_total', 'counter', 'Events committed by the background writer.',
+             status['event_writer']['written']),
+            ('goaround_events_dropped_total', 'counter', 'Events dropped on a full queue or failed write.',
+             status['event_writer']['dropped']),
+        ]
+        scheduler = status['scheduler']
+        values += [
+            ('goaround_poll_interval_seconds', 'gauge', 'Current poll period.', scheduler['interval']),
+            ('goaround_poll_overruns_total', 'counter', 'Polls that ran past the next tick.', scheduler['overruns']),
+            ('goaround_poll_skipped_ticks_total', 'counter', 'Ticks skipped after overruns.', scheduler['skipped_ticks']),
+        ]
+        if status['geofence'] is not None:
+            values.append(('goaround_geofence_skipped_total', 'counter', 'Aircraft fixes skipped by the geofence pre-filter.',
+                           status['geofence']['skipped_total']))
+        for name, kind, description, value in values:
+            if value is not None:
+                lines += [f'# HELP {name} {description}', f'# TYPE {name} {kind}', f'{name} {value}']
+        return '\n'.join(lines) + '\n'
+    
+    def get_changes_since(self, since: int) -> bytes:
+        """
+        Serialized changes from poll ``since`` to the latest snapshot.
+        
+        Answers ``{"seq": ..., "resync": true}`` when ``since`` is older than
+        the journal or from before a restart; the client should then fetch
+        the full /api/go_arounds.
+        """
+        snapshot = self.api_snapshot
+        cached = snapshot.changes_cache.get(since)
+        if cached is not None:
+            return cached
+        
+        oldest = snapshot.journal[0][0] - 1 if snapshot.journal else snapshot.seq
+        if since < oldest or since > snapshot.seq:
+            body = json_dumps({'seq': snapshot.seq, 'since': since, 'resync': True})
+        else:
+            deltas = [delta for seq, delta in snapshot.journal if seq > since]
+            body = json_dumps({
+                **snapshot.status,
+                'since': since,
+                'resync': False,
+                **{name: merge_deltas(deltas, name) for name in DELTA_LISTS}
+            })
+        if len(snapshot.changes_cache) < API_JOURNAL_SIZE:
+            snapshot.changes_cache[since] = body
+        return body
+    
+    def get_history(self, query: Optional[HistoryQuery] = None) -> dict:
+        """
+        Get one page of go-around history from the event store.
+        
+        The first page (no cursor) also carries summary totals over every
+        matching event.
+        """
+        query = query if query is not None else HistoryQuery()
+        events, next_cursor = self.events.query(query)
+        history = {'events': events, 'next_cursor': next_cursor}
+        if query.after is None:
+            history['summary'] = self.events.summary(query, self.clock())
+        return history
+    
+    def get_stats(self, start: Optional[float] = None, end: Optional[float] = None) -> dict:
+        """Go-around rollups over the local days from start to end (epoch seconds; None is open)."""
+        first_day = datetime.fromtimestamp(start).strftime('%Y-%m-%d') if start is not None else None
+        last_day = datetime.fromtimestamp(end).strftime('%Y-%m-%d') if end is not None else None
+        return self.rollups.stats(first_day, last_day)
+
+
+class ReplayClock:
+    """Injectable clock that follows the timestamps of replayed snapshots."""
+    
+    def __init__(self, now: float = 0.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def natural_sort_key(name: str) -> list:
+    """Sort key that orders embedded numbers numerically (aircraft_9 before aircraft_10)."""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+def load_json_bytes(raw: bytes) -> dict:
+    """Decode JSON that may be gzip-compressed (readsb writes gzipped traces with a .json name)."""
+    if raw[:2] == b'\x1f\x8b':
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def iter_replay_files(source: Path) -> Iterator[Tuple[str, Callable[[], bytes]]]:
+    """Yield (name, reader) for every JSON file in a directory or tarball, in natural name order."""
+    def is_json(name: str) -> bool:
+        return name.endswith('.json') or name.endswith('.json.gz')
+    
+    if source.is_dir():
+        paths = [p for p in source.rglob('*') if p.is_file() and is_json(p.name)]
+        for path in sorted(paths, key=lambda p: natural_sort_key(str(p.relative_to(source)))):
+            yield str(path.relative_to(source)), path.read_bytes
+    else:
+        with tarfile.open(source) as tar:
+            members = [m for m in tar.getmembers() if m.isfile() and is_json(m.name)]
+            for member in sorted(members, key=lambda m: natural_sort_key(m.name)):
+                yield member.name, lambda member=member: tar.extractfile(member).read()
+
+
+def trace_snapshots(traces: List[dict], interval: float) -> Iterator[Tuple[float, dict]]:
+    """
+    Resample readsb/tar1090 trace files into aircraft.json-shaped snapshots.
+    
+    Trace points are ``[dt, lat, lon, alt, gs, track, flags, vert_rate,
+    details, source, alt_geom, geom_rate, ...]`` relative to the file's
+    ``timestamp``. Each snapshot covers ``interval`` seconds and carries the
+    newest fresh point per aircraft, with ``seen_pos`` set to its age.
+    """
+    points = []
+    for trace in traces:
+        hex_id = trace.get('icao')
+        base = trace.get('timestamp', 0)
+        callsign = None
+        for point in trace.get('trace', []):
+            if not hex_id or len(point) < 8 or point[1] is None or point[2] is None:
+                continue
+            if point[6] and point[6] & 1:  # Stale position
+                continue
+            details = point[8] if len(point) > 8 and isinstance(point[8], dict) else None
+            if details and details.get('flight'):
+                callsign = details['flight']
+            record = {
+                'hex': hex_id,
+                'lat': point[1],
+                'lon': point[2],
+                'alt_baro': point[3],
+                'gs': point[4],
+                'baro_rate': point[7],
+                'vert_rate': point[11] if len(point) > 11 else None,
+                't': trace.get('t')
+            }
+            if callsign:
+                record['flight'] = callsign
+            points.append((base + point[0], record))
+    
+    if not points:
+        return
+    points.sort(key=lambda p: p[0])
+    
+    index = 0
+    bucket_end = points[0][0]
+    while index < len(points):
+        latest = {}
+        while index < len(points) and points[index][0] <= bucket_end:
+            timestamp, record = points[index]
+            latest[record['hex']] = (timestamp, record)
+            index += 1
+        if latest:
+            aircraft = [dict(record, seen_pos=bucket_end - timestamp) for timestamp, record in latest.values()]
+            yield bucket_end, {'now': bucket_end, 'aircraft': aircraft}
+        if index < len(points):
+            # Skip empty buckets during gaps in coverage
+            bucket_end += interval * max(1, math.ceil((points[index][0] - bucket_end) / interval))
+
+
+def iter_replay_snapshots(source: Path, interval: float) -> Iterator[Tuple[float, dict]]:
+    """
+    Yield (timestamp, aircraft.json dict) from recorded data.
+    
+    ``source`` is a directory or tarball of timestamped aircraft.json
+    snapshots, tar1090 ``globe_history`` trace files, or both. Snapshots are
+    replayed in file-name order and timed by their ``now`` field (or an epoch
+    number in the name); traces are resampled one day directory at a time.
+    """
+    traces = []
+    trace_group = None
+    last_timestamp = None
+    
+    for name, read in iter_replay_files(source):
+        try:
+            data = load_json_bytes(read())
+        except (ValueError, OSError) as e:
+            logger.warning(f"Skipping unreadable replay file {name}: {e}")
+            continue
+        
+        if 'trace' in data:
+            # globe_history/YYYY/MM/DD/traces/xx/trace_full_<hex>.json - group by day
+            group = name.split('/traces/')[0] if '/traces/' in name else os.path.dirname(name)
+            if group != trace_group and traces:
+                yield from trace_snapshots(traces, interval)
+                traces = []
+            trace_group = group
+            traces.append(data)
+            continue
+        
+        if 'aircraft' not in data and 'ac' not in data:
+            continue
+        
+        timestamp = data.get('now')
+        if timestamp is None:
+            epochs = [int(n) for n in re.findall(r'\d{9,13}', os.path.basename(name))]
+            if epochs:
+                timestamp = epochs[-1] / 1000 if epochs[-1] > 1e11 else epochs[-1]
+            else:
+                timestamp = (last_timestamp or 0) + interval
+        last_timestamp = float(timestamp)
+        yield last_timestamp, data
+    
+    if traces:
+        yield from trace_snapshots(traces, interval)
+
+
+def run_replay(monitor: 'TAR1090Monitor', clock: ReplayClock, source: Path, interval: float) -> dict:
+    """Push recorded snapshots through the monitor as fast as possible and summarize the run."""
+    snapshots = 0
+    skipped = 0
+    first_timestamp = None
+    started = time.perf_counter()
+    
+    for timestamp, data in iter_replay_snapshots(source, interval):
+        if timestamp < clock.now:
+            # Detection assumes time only moves forward
+            skipped += 1
+            continue
+        clock.now = timestamp
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        monitor.process_snapshot(extract_snapshot(data))
+        snapshots += 1
+    monitor.event_writer.flush()
+    
+    elapsed = time.perf_counter() - started
+    return {
+        'snapshots': snapshots,
+        'skipped_out_of_order': skipped,
+        'replayed_seconds': (clock.now - first_timestamp) if first_timestamp is not None else 0,
+        'wall_seconds': round(elapsed, 3),
+        'snapshots_per_second': round(snapshots / elapsed, 1) if elapsed > 0 else None,
+        'go_arounds_detected': monitor.go_arounds_detected_total,
+        'events_logged': monitor.events_logged,
+        'events_file': str(monitor.events.path)
+    }
+
+
+def run_archive(data_dir: Path, months: int, repartition: bool) -> dict:
+    """Archive months older than ``months`` (0 skips) and vacuum, then optionally repartition the archive."""
+    store = EventStore(data_dir / "go_arounds.db", archive=EventArchive(data_dir / "archive"))
+    summary = {}
+    if months:
+        conn = store.connection()
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        size = store.path.stat().st_size
+        summary['archived'] = store.rotate(month_start(time.time(), months - 1))
+        conn.execute('VACUUM')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        summary['database_bytes'] = {'before': size, 'after': store.path.stat().st_size}
+    if repartition:
+        summary['repartitioned'] = store.archive.repartition()
+    return {**summary, 'archive': store.archive.get_status()}
+
+
+def create_flask_app(monitor: TAR1090Monitor, admin_token: Optional[str] = None) -> Flask:
+    """Create Flask application for web interface; admin endpoints exist only with an ``admin_token``."""
+    app = Flask(__name__)
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
+    
+    def admin_denied():
+        """
+        A 404 response if no admin token is configured, a 403 unless the request carries it
+        as ``Authorization: Bearer <token>`` (never in the URL, which ends up in access logs).
+        """
+        if not admin_token:
+            return jsonify({'error': 'not found'}), 404
+        header = request.headers.get('Authorization', '')
+        given = header[7:] if header.startswith('Bearer ') else ''
+        if given and hmac.compare_digest(given.encode(), admin_token.encode()):
+            return None
+        return jsonify({'error': 'admin token required'}), 403
+    
+    @app.route('/')
+    def index():
+        """Main map view."""
+        return Response(MAP_HTML_TEMPLATE, content_type='text/html')
+    
+    @app.route('/history')
+    def history():
         """Historical go-arounds view."""
         return Response(HISTORY_HTML_TEMPLATE, content_type='text/html')
     
     @app.route('/api/go_arounds')
     def api_go_arounds():
-        """API endpoint for current go-around data."""
-        return jsonify(monitor.get_go_around_data())
+        """API endpoint for current go-around data, served from the per-poll snapshot."""
+        since = request.args.get('since', type=int)
+        if since is not None:
+            # Only what changed since the client's last seq (or a resync signal)
+            return Response(monitor.get_changes_since(since), mimetype='application/json',
+                            headers={'Cache-Control': 'no-cache'})
+        
+        snapshot = monitor.api_snapshot
+        response = Response(snapshot.body, mimetype='application/json')
+        response.set_etag(snapshot.etag)
+        response.headers['X-Snapshot-Seq'] = str(snapshot.seq)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+    
+    @app.route('/api/stream')
+    def api_stream():
+        """Server-sent events: a full snapshot on connect, then one delta per poll."""
+        def generate():
+            client = monitor.stream.subscribe()
+            try:
+                yield b'retry: 5000\n\n'
+                seq = None
+                while True:
+                    if seq is None:
+                        # Subscribed first, so deltas newer than this snapshot are already queued
+                        snapshot = monitor.api_snapshot
+                        seq = snapshot.seq
+                        yield sse_frame('snapshot', seq, snapshot.body)
+                    try:
+                        item = client.get(timeout=SSE_HEARTBEAT)
+                    except queue.Empty:
+                        yield b': heartbeat\n\n'
+                        continue
+                    if item is STREAM_RESYNC:
+                        seq = None
+                        continue
+                    item_seq, frame = item
+                    if item_seq <= seq:
+                        continue  # Already contained in the snapshot
+                    if item_seq != seq + 1:
+                        seq = None  # Missed a delta; start over from a snapshot
+                        continue
+                    seq = item_seq
+                    yield frame
+            finally:
+                monitor.stream.unsubscribe(client)
+        
+        return Response(generate(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # Tell nginx not to buffer the stream
+        })
     
     @app.route('/api/go_around_history')
     def api_history():
         """API endpoint for historical go-around data."""
-        return jsonify(monitor.get_history())
+        try:
+            query = HistoryQuery.from_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(monitor.get_history(query))
+    
+    @app.route('/api/go_around_stats')
+    def api_stats():
+        """Go-around counts and climb rates by day, hour, airline and type; ?from=&to= bound the days."""
+        try:
+            start = parse_time(request.args['from']) if request.args.get('from') else None
+            end = parse_time(request.args['to']) if request.args.get('to') else None
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(monitor.get_stats(start, end))
+    
+    @app.route('/api/go_around_history.csv')
+    def api_history_csv():
+        """All go-arounds as a CSV download."""
+        return Response(
+            monitor.events.iter_csv(), mimetype='text/csv',
+            headers={'Content-Disposition': 'attachment; filename=go_around_detections.csv'}
+        )
+    
+    @app.route('/metrics')
+    def metrics():
+        """Prometheus metrics."""
+        return Response(monitor.get_metrics(), mimetype='text/plain; version=0.0.4')
+    
+    @app.route('/api/admin/profile', methods=['POST'])
+    def api_admin_profile():
+        """Profile the next N polls: ?polls=N&mode=cprofile|sample&memory=0|1."""
+        denied = admin_denied()
+        if denied:
+            return denied
+        try:
+            name = monitor.profiler.request(
+                request.values.get('polls', 10, type=int),
+                request.values.get('mode', 'cprofile'),
+                request.values.get('memory', '1') != '0'
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except RuntimeError as e:
+            return jsonify({'error': str(e)}), 409
+        return jsonify({'profile': name, **monitor.profiler.get_status()}), 202
+    
+    @app.route('/api/admin/profiles')
+    def api_admin_profiles():
+        """Profiler state and the reports available for download."""
+        denied = admin_denied()
+        if denied:
+            return denied
+        return jsonify({**monitor.profiler.get_status(), 'files': monitor.profiler.files()})
+    
+    @app.route('/api/admin/profiles/<name>')
+    def api_admin_profile_file(name):
+        """Download one profile report."""
+        denied = admin_denied()
+        if denied:
+            return denied
+        return send_from_directory(monitor.profiler.directory, name, as_attachment=True)
     
     @app.route('/api/health')
     def api_health():
-        """Health check endpoint."""
-        status = monitor.get_status()
+        """Health check endpoint, answered from the last published read model."""
+        status = monitor.api_snapshot.status
         is_healthy = status['running'] and status.get('last_update') is not None
         
         return jsonify({
@@ -1268,7 +4600,19 @@ def main():
     parser.add_argument(
         '--server',
         default=os.environ.get('TAR1090_URL', 'http://localhost:8080'),
-        help='TAR1090 server URL'
+        help='TAR1090 server URL (comma separated to merge several receivers)'
+    )
+    parser.add_argument(
+        '--source-timeout',
+        type=float,
+        default=float(os.environ['SOURCE_TIMEOUT']) if os.environ.get('SOURCE_TIMEOUT') else None,
+        help='Per-source fetch deadline in seconds (default: 80%% of the update interval)'
+    )
+    parser.add_argument(
+        '--feed-format',
+        choices=sorted(FEED_DECODERS),
+        default=os.environ.get('FEED_FORMAT', 'json'),
+        help='Feed to poll: aircraft.json, aircraft.binCraft or aircraft.binCraft.zst'
     )
     parser.add_argument(
         '--interval',
@@ -1276,6 +4620,30 @@ def main():
         default=int(os.environ.get('UPDATE_INTERVAL', '5')),
         help='Update interval in seconds'
     )
+    parser.add_argument(
+        '--fast-interval',
+        type=float,
+        default=float(os.environ['FAST_UPDATE_INTERVAL']) if os.environ.get('FAST_UPDATE_INTERVAL') else None,
+        help='Poll interval while aircraft below the low-altitude threshold are tracked inside a geofence (seconds)'
+    )
+    parser.add_argument(
+        '--idle-interval',
+        type=float,
+        default=float(os.environ['IDLE_UPDATE_INTERVAL']) if os.environ.get('IDLE_UPDATE_INTERVAL') else None,
+        help='Poll interval while no aircraft are tracked (seconds)'
+    )
+    parser.add_argument(
+        '--track-retention',
+        type=float,
+        default=float(os.environ['TRACK_RETENTION']) if os.environ.get('TRACK_RETENTION') else None,
+        help='Seconds of position history kept per aircraft (default: detection window + 30)'
+    )
+    parser.add_argument(
+        '--track-point-budget',
+        type=int,
+        default=int(os.environ.get('TRACK_POINT_BUDGET', str(TRACK_POINT_BUDGET))),
+        help='Most track positions held across all aircraft'
+    )
     parser.add_argument(
         '--web',
         action='store_true',
@@ -1288,6 +4656,115 @@ def main():
         default=int(os.environ.get('WEB_PORT', '8889')),
         help='Web interface port'
     )
+    parser.add_argument(
+        '--detector',
+        choices=sorted(DETECTOR_MODES),
+        default=os.environ.get('DETECTOR_MODE', 'batch'),
+        help='Detector implementation (batch scores all aircraft per poll with NumPy)'
+    )
+    parser.add_argument(
+        '--low-altitude',
+        type=float,
+        default=float(os.environ.get('LOW_ALTITUDE_THRESHOLD', '2000')),
+        help='Altitude below which an approach counts as low (ft)'
+    )
+    parser.add_argument(
+        '--min-climb-rate',
+        type=float,
+        default=float(os.environ.get('MIN_CLIMB_RATE', '1000')),
+        help='Minimum climb rate for a go-around (ft/min)'
+    )
+    parser.add_argument(
+        '--rapid-climb-rate',
+        type=float,
+        default=float(os.environ.get('RAPID_CLIMB_RATE', '1500')),
+        help='Rapid climb indicator (ft/min)'
+    )
+    parser.add_argument(
+        '--altitude-recovery',
+        type=float,
+        default=float(os.environ.get('ALTITUDE_RECOVERY', '500')),
+        help='Required altitude gain from the recent minimum (ft)'
+    )
+    parser.add_argument(
+        '--time-window',
+        type=int,
+        default=int(os.environ.get('TIME_WINDOW', '120')),
+        help='Detection lookback window (seconds)'
+    )
+    parser.add_argument(
+        '--confidence-threshold',
+        type=float,
+        default=float(os.environ.get('CONFIDENCE_THRESHOLD', '0.6')),
+        help='Confidence score at which a go-around is reported'
+    )
+    parser.add_argument(
+        '--data-dir',
+        default=os.environ.get('DATA_DIR', str(DEFAULT_DATA_DIR)),
+        help='Directory for go-around logs'
+    )
+    parser.add_argument(
+        '--runways',
+        default=os.environ.get('RUNWAYS_FILE'),
+        help='OurAirports-style runways.csv for matching go-arounds to runways (default: DATA_DIR/runways.csv if present)'
+    )
+    parser.add_argument(
+        '--geofences',
+        default=os.environ.get('GEOFENCES'),
+        help='Only track aircraft inside these fences: NAME:LAT,LON,RADIUS_NM[,CEILING_FT];...'
+    )
+    parser.add_argument(
+        '--profile-polls',
+        type=int,
+        default=int(os.environ.get('PROFILE_POLLS', '0')),
+        help='Profile the first N polls into DATA_DIR/profiles'
+    )
+    parser.add_argument(
+        '--profile-mode',
+        choices=PROFILE_MODES,
+        default=os.environ.get('PROFILE_MODE', 'cprofile'),
+        help='Profiler used for --profile-polls'
+    )
+    parser.add_argument(
+        '--event-flush-interval',
+        type=float,
+        default=float(os.environ.get('EVENT_FLUSH_INTERVAL', str(EVENT_FLUSH_INTERVAL))),
+        help='Seconds the event writer batches events before committing'
+    )
+    parser.add_argument(
+        '--event-sync',
+        choices=EVENT_SYNC_MODES,
+        default=os.environ.get('EVENT_SYNC', 'normal'),
+        help='SQLite synchronous level for events (full fsyncs every commit)'
+    )
+    parser.add_argument(
+        '--event-queue-size',
+        type=int,
+        default=int(os.environ.get('EVENT_QUEUE_SIZE', str(EVENT_QUEUE_SIZE))),
+        help='Events queued for writing before new ones are dropped'
+    )
+    parser.add_argument(
+        '--archive-months',
+        type=int,
+        default=int(os.environ.get('ARCHIVE_MONTHS', str(ARCHIVE_MONTHS))),
+        help='Months of events kept in the database, counting the current one; older months are '
+             'moved to compressed monthly archive files (0 keeps everything in the database)'
+    )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Archive months older than --archive-months, vacuum the database and exit (stop the tracker first)'
+    )
+    parser.add_argument(
+        '--repartition',
+        action='store_true',
+        help='Rewrite the archive one file per month, merging duplicate and misfiled events, and exit'
+    )
+    parser.add_argument(
+        '--replay',
+        metavar='PATH',
+        help='Replay a directory or tarball of recorded aircraft.json snapshots / trace files and exit'
+    )
     parser.add_argument(
         '--test',
         action='store_true',
@@ -1295,10 +4772,75 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.feed_format == 'bincraft-zst' and zstandard is None:
+        parser.error('--feed-format bincraft-zst needs the zstandard package')
+    if args.archive_months < 0:
+        parser.error('--archive-months must not be negative')
+    
+    if args.compact or args.repartition:
+        if args.compact and not args.archive_months:
+            parser.error('--compact needs --archive-months of at least 1')
+        summary = run_archive(Path(args.data_dir), args.archive_months if args.compact else 0, args.repartition)
+        print(json.dumps(summary, indent=2))
+        return
     
     # Create monitor
     public_url = os.environ.get('PUBLIC_TAR1090_URL', args.server)
-    monitor = TAR1090Monitor(args.server, args.interval, public_url)
+    detector = DETECTOR_MODES[args.detector](
+        low_altitude_threshold=args.low_altitude,
+        min_climb_rate=args.min_climb_rate,
+        rapid_climb_rate=args.rapid_climb_rate,
+        altitude_recovery=args.altitude_recovery,
+        time_window=args.time_window,
+        confidence_threshold=args.confidence_threshold
+    )
+    
+    runways = None
+    runways_file = Path(args.runways) if args.runways else Path(args.data_dir) / 'runways.csv'
+    if args.runways or runways_file.exists():
+        try:
+            runways = RunwayIndex.from_csv(runways_file)
+        except OSError as e:
+            parser.error(f"cannot read runways file: {e}")
+        logger.info(f"Loaded {len(runways)} runway ends from {runways_file}")
+    
+    geofences = None
+    if args.geofences:
+        try:
+            geofences = Geofences.parse(args.geofences)
+        except ValueError as e:
+            parser.error(f"--geofences: {e}")
+    if args.fast_interval and geofences is None:
+        logger.warning('--fast-interval without --geofences only applies while a go-around is in progress')
+    
+    if args.replay:
+        # Replay recorded data on its own clock; each run logs to its own directory
+        clock = ReplayClock()
+        run_dir = Path(args.data_dir) / 'replay' / datetime.now().strftime('%Y%m%d-%H%M%S')
+        monitor = TAR1090Monitor(
+            args.server, args.interval, public_url, detector=detector, data_dir=run_dir, clock=clock,
+            runways=runways, geofences=geofences, track_retention=args.track_retention,
+            track_point_budget=args.track_point_budget, event_flush_interval=args.event_flush_interval,
+            event_queue_size=args.event_queue_size, event_sync=args.event_sync
+        )
+        print(f"Replaying {args.replay}...")
+        summary = run_replay(monitor, clock, Path(args.replay), args.interval)
+        print(json.dumps(summary, indent=2))
+        return
+    
+    monitor = TAR1090Monitor(
+        args.server, args.interval, public_url, detector=detector, data_dir=Path(args.data_dir),
+        source_timeout=args.source_timeout, feed_format=args.feed_format, runways=runways,
+        geofences=geofences, fast_interval=args.fast_interval, idle_interval=args.idle_interval,
+        track_retention=args.track_retention, track_point_budget=args.track_point_budget,
+        event_flush_interval=args.event_flush_interval, event_queue_size=args.event_queue_size,
+        event_sync=args.event_sync, archive_months=args.archive_months
+    )
+    if args.profile_polls:
+        try:
+            monitor.profiler.request(args.profile_polls, args.profile_mode)
+        except ValueError as e:
+            parser.error(f"--profile-polls: {e}")
     
     if args.test:
         print(f"Testing connection to {args.server}...")
@@ -1311,16 +4853,21 @@ def main():
             sys.exit(1)
         return
     
+    def handle_sigterm(signum, frame):
+        logger.info("SIGTERM received, writing queued events")
+        monitor.stop()
+        sys.exit(0)
+    
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
     if args.web:
         # Run with web interface
-        import threading
-        
         # Start monitoring in background thread
         monitor_thread = threading.Thread(target=monitor.run, daemon=True)
         monitor_thread.start()
         
         # Create and run Flask app
-        app = create_flask_app(monitor)
+        app = create_flask_app(monitor, admin_token=os.environ.get('ADMIN_TOKEN'))
         print(f"Starting web interface on http://0.0.0.0:{args.web_port}")
         print(f"Monitoring TAR1090 at {args.server}")
         app.run(host='0.0.0.0', port=args.web_port, debug=False)
@@ -1330,6 +4877,7 @@ def main():
             monitor.run()
         except KeyboardInterrupt:
             print("\nStopping monitor...")
+    monitor.stop()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..'))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'benchmarks'))
+
+from traffic import TrafficGenerator  # noqa: E402
+
+
+@pytest.fixture
+def synthetic_feed():
+    """Fast synthetic traffic: short-lived profiles keep aircraft joining and leaving every poll."""
+    return TrafficGenerator(300, weights=(20, 70, 10))
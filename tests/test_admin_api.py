@@ -0,0 +1,56 @@
+"""The profiling endpoints under /api/admin/ only answer requests carrying the configured token."""
+
+import pytest
+
+from go_around_tracker import ReplayClock, TAR1090Monitor, create_flask_app
+
+ADMIN_ROUTES = [
+    ('post', '/api/admin/profile?polls=5'),
+    ('get', '/api/admin/profiles'),
+    ('get', '/api/admin/profiles/report.txt'),
+]
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = TAR1090Monitor('http://test', data_dir=tmp_path, clock=ReplayClock(5000.0))
+    (monitor.profiler.directory / 'report.txt').parent.mkdir(parents=True, exist_ok=True)
+    (monitor.profiler.directory / 'report.txt').write_text('profile')
+    yield monitor
+    monitor.stop()
+
+
+@pytest.mark.parametrize('method, path', ADMIN_ROUTES)
+def test_admin_routes_are_disabled_without_a_configured_token(monitor, method, path):
+    client = create_flask_app(monitor).test_client()
+    assert getattr(client, method)(path).status_code == 404
+    assert getattr(client, method)(path, headers={'Authorization': 'Bearer '}).status_code == 404
+    assert monitor.profiler.get_status()['pending'] is None
+
+
+@pytest.mark.parametrize('method, path', ADMIN_ROUTES)
+@pytest.mark.parametrize('headers', [
+    {},
+    {'Authorization': 'Bearer wrong'},
+    {'Authorization': 'Bearer '},
+    {'Authorization': 'secret'},
+])
+def test_admin_routes_refuse_a_missing_or_wrong_token(monitor, method, path, headers):
+    client = create_flask_app(monitor, admin_token='secret').test_client()
+    assert getattr(client, method)(path, headers=headers).status_code == 403
+    assert monitor.profiler.get_status()['pending'] is None
+
+
+@pytest.mark.parametrize('method, path', ADMIN_ROUTES)
+def test_token_in_the_query_string_is_not_accepted(monitor, method, path):
+    client = create_flask_app(monitor, admin_token='secret').test_client()
+    separator = '&' if '?' in path else '?'
+    assert getattr(client, method)(f"{path}{separator}token=secret").status_code == 403
+
+
+def test_bearer_token_grants_access(monitor):
+    client = create_flask_app(monitor, admin_token='secret').test_client()
+    headers = {'Authorization': 'Bearer secret'}
+    assert client.post('/api/admin/profile?polls=5', headers=headers).status_code == 202
+    assert client.get('/api/admin/profiles', headers=headers).status_code == 200
+    assert client.get('/api/admin/profiles/report.txt', headers=headers).data == b'profile'
@@ -0,0 +1,216 @@
+"""The incremental and batch detectors must agree with the scalar GoAroundDetector."""
+
+import math
+import random
+
+import pytest
+
+import go_around_tracker as tracker
+from go_around_tracker import (
+    Aircraft, BatchGoAroundDetector, GoAroundDetector, IncrementalGoAroundDetector, Track
+)
+
+NAN = math.nan
+
+
+def feed(points, detectors, capacity=120):
+    """
+    Append (timestamp, altitude, vert_rate) points to one aircraft per detector
+    and yield each detector's result after every point.
+    """
+    fleet = [Aircraft(hex_id='abc123', callsign='TST1', path=Track(capacity)) for _ in detectors]
+    for timestamp, altitude, vert_rate in points:
+        results = []
+        for detector, aircraft in zip(detectors, fleet):
+            aircraft.path.append(lat=0.0, lon=0.0, timestamp=timestamp, altitude=altitude,
+                                 speed=140.0, vert_rate=vert_rate)
+            detector.observe(aircraft)
+            results.append(detector.detect_go_around(aircraft))
+        yield results
+
+
+def assert_agree(points, capacity=120, **settings):
+    detectors = (GoAroundDetector(**settings), IncrementalGoAroundDetector(**settings))
+    for step, (scalar, incremental) in enumerate(feed(points, detectors, capacity)):
+        assert incremental == scalar, f"disagree after point {step}: {points[step]}"
+
+
+def approach_and_go_around(start=1000.0, interval=5.0, low=800.0):
+    """Descend to ``low`` then climb away: a go-around the scalar detector reports."""
+    points = []
+    altitude = low + 12 * 125
+    for step in range(12):
+        points.append((start + step * interval, altitude, -750.0))
+        altitude -= 125
+    for step in range(12, 24):
+        altitude += 150
+        points.append((start + step * interval, altitude, 1800.0))
+    return points
+
+
+def test_go_around_detected_by_both():
+    points = approach_and_go_around()
+    detectors = (GoAroundDetector(), IncrementalGoAroundDetector())
+    results = list(feed(points, detectors))
+    assert any(scalar.is_go_around for scalar, _ in results)
+    assert all(scalar == incremental for scalar, incremental in results)
+
+
+def test_window_expiry():
+    # A low minimum early on leaves the 120 s window while the aircraft keeps flying
+    points = [(1000.0 + step * 5, 500.0 if step < 3 else 3000.0 + step * 10, 1500.0 if step % 7 else -900.0)
+              for step in range(80)]
+    assert_agree(points)
+
+
+def test_window_expiry_across_gap():
+    # A long reception gap empties the window at once
+    points = approach_and_go_around()[:14] + approach_and_go_around(start=1400.0)
+    assert_agree(points)
+
+
+def test_short_window():
+    assert_agree(approach_and_go_around(), time_window=12)
+
+
+def test_equal_minima_keeps_oldest():
+    points = [(1000.0 + step * 5, alt, rate) for step, (alt, rate) in enumerate([
+        (1500, -700), (1000, -700), (1200, -600), (1000, -800), (1000, 300), (1600, 1600), (2100, 1700)
+    ])]
+    assert_agree(points)
+    detectors = (GoAroundDetector(), IncrementalGoAroundDetector())
+    *_, (scalar, incremental) = feed(points, detectors)
+    assert scalar.min_altitude == incremental.min_altitude == 1000
+
+
+@pytest.mark.parametrize('missing', ['altitude', 'vert_rate', 'both'])
+def test_nan_values(missing):
+    points = []
+    for step, (timestamp, altitude, vert_rate) in enumerate(approach_and_go_around()):
+        if step % 4 == 2:
+            if missing in ('altitude', 'both'):
+                altitude = NAN
+            if missing in ('vert_rate', 'both'):
+                vert_rate = NAN
+        points.append((timestamp, altitude, vert_rate))
+    # Missing values at the newest point too
+    points.append((points[-1][0] + 5, NAN, NAN))
+    points.append((points[-1][0] + 5, 3000.0, 1900.0))
+    assert_agree(points)
+
+
+def test_none_values_stored_as_nan():
+    points = [(1000.0 + step * 5, None if step == 3 else 1500.0 - step * 50, None if step == 5 else -800.0)
+              for step in range(10)]
+    assert_agree(points)
+
+
+def test_short_track():
+    points = approach_and_go_around()[:2]
+    detectors = (GoAroundDetector(), IncrementalGoAroundDetector())
+    for scalar, incremental in feed(points, detectors):
+        assert scalar == incremental
+        assert not scalar.is_go_around
+        assert scalar.trigger_reason == 'Insufficient data'
+
+
+def test_ring_buffer_wraparound():
+    # Capacity below the window's point count: the buffer, not time, limits the window
+    assert_agree(approach_and_go_around() + approach_and_go_around(start=1120.0), capacity=10)
+
+
+def test_random_tracks():
+    rng = random.Random(7)
+    for _ in range(200):
+        timestamp = 1000.0
+        altitude = rng.uniform(300, 4000)
+        points = []
+        for _ in range(rng.randint(1, 60)):
+            timestamp += rng.choice((1.0, 5.0, 5.0, 5.0, 30.0, 130.0))
+            vert_rate = rng.choice((rng.uniform(-1500, 2500), NAN, -800.0, 1600.0))
+            altitude = max(0.0, altitude + (vert_rate if vert_rate == vert_rate else 0) / 12)
+            points.append((timestamp, rng.choice((round(altitude / 25) * 25,) * 5 + (NAN,)), vert_rate))
+        assert_agree(points, capacity=rng.choice((10, 31, 120)))
+
+
+# Confidence terms: low altitude 0.3, climb 0.2 or 0.4, recovery 0.3, transition 0.2
+SCORES = sorted({round(low + climb + recovery + transition, 10)
+                 for low in (0, 0.3) for climb in (0, 0.2, 0.4) for recovery in (0, 0.3) for transition in (0, 0.2)})
+
+
+def mixed_fleet(detector, count=300, seed=11):
+    """Aircraft covering every combination of triggers, fed through ``detector.observe``."""
+    rng = random.Random(seed)
+    fleet = []
+    for index in range(count):
+        aircraft = Aircraft(hex_id=f"{index:06x}", callsign=f"TST{index}", path=Track(rng.choice((10, 31, 120))))
+        low = rng.choice((600.0, 1900.0, 2100.0, 5000.0))
+        timestamp = 1000.0
+        altitude = low + 1500
+        descent = rng.randint(0, 20)
+        for step in range(rng.randint(1, 40)):
+            timestamp += rng.choice((5.0, 5.0, 5.0, 1.0, 70.0))
+            if step < descent:
+                vert_rate = rng.choice((-750.0, -400.0))
+            else:
+                vert_rate = rng.choice((999.0, 1000.0, 1499.0, 1500.0, 2000.0, 300.0, NAN))
+            if vert_rate == vert_rate:
+                altitude = max(low, altitude + vert_rate / 12)
+            aircraft.path.append(lat=0.0, lon=0.0, timestamp=timestamp,
+                                 altitude=NAN if rng.random() < 0.05 else round(altitude / 25) * 25,
+                                 speed=140.0, vert_rate=vert_rate)
+            detector.observe(aircraft)
+        fleet.append(aircraft)
+    return fleet
+
+
+@pytest.mark.skipif(tracker.np is None, reason='numpy not installed')
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_batch_matches_scalar(seed):
+    batch = BatchGoAroundDetector()
+    fleet = mixed_fleet(batch, seed=seed)
+    expected = GoAroundDetector().detect_batch(fleet)
+    assert expected, 'fleet should contain go-arounds'
+    assert len(expected) < len(fleet), 'fleet should contain aircraft below the threshold'
+    assert batch.detect_batch(fleet) == expected
+
+
+@pytest.mark.skipif(tracker.np is None, reason='numpy not installed')
+@pytest.mark.parametrize('score', [score for score in SCORES if score > 0])
+@pytest.mark.parametrize('offset', [-1e-9, 0.0, 1e-9])
+def test_batch_threshold_boundaries(score, offset):
+    # Thresholds just above, at and just below every reachable score
+    settings = {'confidence_threshold': score + offset}
+    batch = BatchGoAroundDetector(**settings)
+    fleet = mixed_fleet(batch, count=600)
+    expected = GoAroundDetector(**settings).detect_batch(fleet)
+    assert batch.detect_batch(fleet) == expected
+    everything = GoAroundDetector(confidence_threshold=0).detect_batch(fleet).values()
+    # Reported confidence is capped at 1.0
+    assert min(score, 1.0) in {round(detection.confidence, 10) for detection in everything}, f"fleet never scores {score}"
+
+
+@pytest.mark.skipif(tracker.np is None, reason='numpy not installed')
+@pytest.mark.parametrize('climb_seconds', [55.0, 59.9, 60.0, 60.1, 65.0])
+@pytest.mark.parametrize('recovery', [499.0, 500.0, 501.0])
+def test_batch_recovery_boundaries(climb_seconds, recovery):
+    # Recovery scores only when it is at least altitude_recovery within 60 s of the minimum
+    batch = BatchGoAroundDetector()
+    aircraft = Aircraft(hex_id='abc123', callsign='TST1')
+    points = [(1000.0, 1500.0, -800.0), (1005.0, 1300.0, -800.0), (1010.0, 1100.0, -800.0),
+              (1015.0, 1000.0, -600.0), (1015.0 + climb_seconds / 2, 1000.0 + recovery / 2, 1600.0),
+              (1015.0 + climb_seconds, 1000.0 + recovery, 1600.0)]
+    for timestamp, altitude, vert_rate in points:
+        aircraft.path.append(lat=0.0, lon=0.0, timestamp=timestamp, altitude=altitude, speed=140.0,
+                             vert_rate=vert_rate)
+        batch.observe(aircraft)
+    for threshold in SCORES:
+        batch.confidence_threshold = threshold
+        assert batch.detect_batch([aircraft]) == GoAroundDetector(confidence_threshold=threshold).detect_batch([aircraft])
+
+
+def test_batch_without_numpy_matches_scalar(monkeypatch):
+    monkeypatch.setattr(tracker, 'np', None)
+    batch = BatchGoAroundDetector()
+    fleet = mixed_fleet(batch, count=100)
+    assert batch.detect_batch(fleet) == GoAroundDetector().detect_batch(fleet)
@@ -0,0 +1,118 @@
+"""Archived months: summaries over archive partitions and crash-safe partition writes."""
+
+import os
+import sqlite3
+import stat
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from go_around_tracker import EventArchive, EventStore, GoAroundLog, HistoryQuery
+
+NOW = datetime(2026, 6, 15, 12).timestamp()
+
+
+def event(ts, hex_id='abc123', callsign='BAW12', type='A320', altitude=900.0):
+    return GoAroundLog(datetime.fromtimestamp(ts), hex_id, callsign, 51.5, -0.4, altitude, 1800.0,
+                       60, 0.9, 'http://test', type)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EventStore(tmp_path / 'events.db', archive=EventArchive(tmp_path / 'archive'))
+    store.add_many([event(datetime(2026, 1, day, 9).timestamp(), type='A320' if day % 2 else 'B738')
+                    for day in range(1, 29)])
+    store.add_many([event(datetime(2026, 2, day, 9).timestamp(), altitude=700.0) for day in range(1, 11)])
+    store.add_many([event(NOW - 3600, type='B738'), event(NOW - 3 * 86400)])
+    assert store.rotate(datetime(2026, 3, 1).timestamp()) == 38
+    yield store
+    store.close()
+
+
+def expected(rows, now):
+    altitudes = [row[5] for row in rows if row[5] is not None]
+    return {
+        'total': len(rows),
+        'last_24h': sum(row[0] >= now - 86400 for row in rows),
+        'last_7d': sum(row[0] >= now - 7 * 86400 for row in rows),
+        'avg_min_altitude': round(sum(altitudes) / len(altitudes)) if altitudes else None
+    }
+
+
+@pytest.mark.parametrize('query', [
+    HistoryQuery(type='A320'),
+    HistoryQuery(type='B738', start=datetime(2026, 1, 10).timestamp()),
+    HistoryQuery(callsign='BAW', end=datetime(2026, 2, 5).timestamp()),
+    HistoryQuery(max_altitude=800.0),
+    HistoryQuery(start=datetime(2026, 1, 20).timestamp(), end=datetime(2026, 2, 3).timestamp()),
+])
+def test_summary_matches_a_full_scan(store, query):
+    rows = [row for partition in store.archive.overlapping(None, None) for row in store.archive.read(partition)]
+    rows += store.connection().execute('SELECT ts, hex_id, callsign, lat, lon, min_altitude, max_climb_rate,'
+                                       ' duration, confidence, tar1090_url, type, airport, runway, id'
+                                       ' FROM go_arounds').fetchall()
+    assert store.summary(query, NOW) == expected([row for row in rows if query.matches(row)], NOW)
+
+
+def test_filtered_summary_does_not_rescan_the_archive_after_writes(store, monkeypatch):
+    query = HistoryQuery(type='A320')
+    first = store.summary(query, NOW)
+    reads = []
+    read = store.archive.read
+    monkeypatch.setattr(store.archive, 'read', lambda *args, **kwargs: reads.append(args) or read(*args, **kwargs))
+    for minute in range(3):
+        store.add(event(NOW + minute * 60, type='B738'))  # Bumps the revision
+        assert store.summary(query, NOW + 3600) == first
+    # A different range still covering whole partitions reuses the same totals
+    store.summary(HistoryQuery(type='A320', start=datetime(2025, 12, 1).timestamp()), NOW)
+    assert reads == []
+
+
+def test_recent_archived_events_age_out_of_the_window(tmp_path):
+    store = EventStore(tmp_path / 'events.db', archive=EventArchive(tmp_path / 'archive'))
+    store.add_many([event(NOW - 3 * 86400), event(NOW - 2 * 3600)])
+    store.rotate(NOW)
+    query = HistoryQuery(type='A320')
+    assert store.summary(query, NOW) == {'total': 2, 'last_24h': 1, 'last_7d': 2, 'avg_min_altitude': 900}
+    assert store.summary(query, NOW + 2 * 86400) == {'total': 2, 'last_24h': 0, 'last_7d': 2,
+                                                     'avg_min_altitude': 900}
+    assert store.summary(query, NOW + 6 * 86400) == {'total': 2, 'last_24h': 0, 'last_7d': 1,
+                                                     'avg_min_altitude': 900}
+    store.close()
+
+
+def test_rewritten_partition_drops_its_cached_totals(store):
+    query = HistoryQuery(type='A320')
+    before = store.summary(query, NOW)['total']
+    store.add(event(datetime(2026, 1, 30, 9).timestamp()))
+    store.rotate(datetime(2026, 3, 1).timestamp())  # Merges into the existing January partition
+    assert store.summary(query, NOW)['total'] == before + 1
+
+
+def test_rotate_syncs_the_archive_before_deleting_rows(tmp_path, monkeypatch):
+    store = EventStore(tmp_path / 'events.db', archive=EventArchive(tmp_path / 'archive'))
+    store.add_many([event(datetime(2026, 1, day, 9).timestamp()) for day in range(1, 4)])
+    steps = []
+    fsync, replace = os.fsync, os.replace
+
+    def record_fsync(fd):
+        steps.append('sync directory' if stat.S_ISDIR(os.fstat(fd).st_mode) else 'sync file')
+        fsync(fd)
+
+    def record_replace(source, target):
+        conn = sqlite3.connect(tmp_path / 'events.db')
+        assert conn.execute('SELECT COUNT(*) FROM go_arounds').fetchone()[0] == 3  # Nothing deleted yet
+        conn.close()
+        steps.append(f"replace {Path(target).name}")
+        replace(source, target)
+
+    monkeypatch.setattr(os, 'fsync', record_fsync)
+    monkeypatch.setattr(os, 'replace', record_replace)
+    assert store.rotate(datetime(2026, 2, 1).timestamp()) == 3
+    assert steps == [
+        'sync file', 'replace 2026-01.jsonl.gz', 'sync directory',
+        'sync file', 'replace manifest.json', 'sync directory'
+    ]
+    assert store.connection().execute('SELECT COUNT(*) FROM go_arounds').fetchone()[0] == 0
+    store.close()
@@ -0,0 +1,76 @@
+"""binCraft and aircraft.json decoders must agree on the same readsb snapshot."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+import go_around_tracker as tracker
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def assert_same_records(expected, actual):
+    assert [record.hex_id for record in actual] == [record.hex_id for record in expected]
+    for left, right in zip(expected, actual):
+        for field, a, b in zip(tracker.AircraftRecord._fields, left, right):
+            if isinstance(a, float) and isinstance(b, float):
+                assert math.isclose(a, b, abs_tol=1e-6), (left.hex_id, field, a, b)
+            else:
+                assert a == b, (left.hex_id, field, a, b)
+
+
+@pytest.fixture(scope='module')
+def json_snapshot():
+    return tracker.JSONFeedDecoder().decode((FIXTURES / 'aircraft.json').read_bytes())
+
+
+def test_bincraft_matches_json(json_snapshot):
+    snapshot = tracker.BinCraftFeedDecoder().decode((FIXTURES / 'aircraft.binCraft').read_bytes())
+    assert math.isclose(snapshot.now, json_snapshot.now, abs_tol=1e-3)
+    assert_same_records(json_snapshot.aircraft, snapshot.aircraft)
+
+
+@pytest.mark.skipif(tracker.zstandard is None, reason='zstandard not installed')
+def test_compressed_bincraft_matches_json(json_snapshot):
+    snapshot = tracker.BinCraftFeedDecoder(compressed=True).decode((FIXTURES / 'aircraft.binCraft.zst').read_bytes())
+    assert_same_records(json_snapshot.aircraft, snapshot.aircraft)
+
+
+def test_ground_aircraft_with_nav_altitude_source():
+    raw = (FIXTURES / 'aircraft.binCraft').read_bytes()
+    stride = tracker.BINCRAFT_HEADER.unpack_from(raw)[2]
+    airground = {
+        raw[offset:offset + 3][::-1].hex(): raw[offset + 68] for offset in range(stride, len(raw), stride)
+    }
+    assert airground['400f01'] == 0x41, 'fixture must pair AG_GROUND with a nav altitude source'
+    records = {record.hex_id: record for record in tracker.BinCraftFeedDecoder().decode(raw).aircraft}
+    assert records['400f01'].altitude is None
+
+
+def test_records_without_position_are_dropped(json_snapshot):
+    hex_ids = {record.hex_id for record in json_snapshot.aircraft}
+    assert '43c1d2' not in hex_ids
+    assert '~2b0b01' in hex_ids
+
+
+@pytest.mark.parametrize('cut', [1, 40, 111])
+def test_truncated_record_is_rejected(cut):
+    raw = (FIXTURES / 'aircraft.binCraft').read_bytes()
+    with pytest.raises(ValueError, match='truncated'):
+        tracker.BinCraftFeedDecoder().decode(raw[:-cut])
+
+
+def test_truncated_header_is_rejected():
+    with pytest.raises(ValueError):
+        tracker.BinCraftFeedDecoder().decode(b'\x00' * 8)
+
+
+@pytest.mark.skipif(tracker.zstandard is None, reason='zstandard not installed')
+@pytest.mark.parametrize('payload', [
+    b'this is not a zstd frame',
+    (FIXTURES / 'aircraft.binCraft.zst').read_bytes()[:-20],
+])
+def test_corrupt_or_truncated_zstd_is_rejected(payload):
+    with pytest.raises(ValueError):
+        tracker.BinCraftFeedDecoder(compressed=True).decode(payload)
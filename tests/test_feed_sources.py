@@ -0,0 +1,159 @@
+"""Per-source fetch deadlines and concurrent polling of several receivers."""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import go_around_tracker as tracker
+from go_around_tracker import FeedSource, JSONFeedDecoder, TAR1090Monitor
+
+SNAPSHOT = {'now': 1000.0, 'aircraft': [{'hex': 'abc123', 'lat': 51.5, 'lon': -0.4, 'alt_baro': 1500}]}
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        body = json.dumps({**SNAPSHOT, 'now': SNAPSHOT['now'] + self.server.requests}).encode()
+        self.send_response(200)
+        if self.server.mode == 'gzip':
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.server.mode == 'trickle':
+            # Each byte arrives well within the socket timeout, the whole body does not
+            for byte in body:
+                self.wfile.write(bytes([byte]))
+                self.wfile.flush()
+                time.sleep(0.05)
+        else:
+            self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_factory():
+    servers = []
+    
+    def start(mode='ok'):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+        server.daemon_threads = True
+        server.mode = mode
+        server.requests = 0
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.mark.parametrize('mode', ['ok', 'gzip'])
+def test_fetch_decodes_snapshot(server_factory, mode):
+    _, url = server_factory(mode)
+    snapshot = FeedSource(url, timeout=2).fetch()
+    assert snapshot.now == SNAPSHOT['now'] + 1
+    assert [record.hex_id for record in snapshot.aircraft] == ['abc123']
+
+
+def test_trickling_response_hits_overall_deadline(server_factory):
+    _, url = server_factory('trickle')
+    source = FeedSource(url, timeout=0.5)
+    started = time.perf_counter()
+    assert source.fetch() is None
+    assert time.perf_counter() - started < 1.5
+    assert 'within' in source.last_error
+
+
+def test_busy_source_is_not_polled_again(server_factory, tmp_path):
+    slow_server, slow_url = server_factory()
+    _, fast_url = server_factory()
+    monitor = TAR1090Monitor(f"{slow_url},{fast_url}", update_interval=1, source_timeout=0.3, data_dir=tmp_path)
+    try:
+        slow, fast = monitor.sources
+        # Stuck after the download, where the request timeout no longer applies
+        release = threading.Event()
+        decode = slow.decoder.decode
+        slow.decoder.decode = lambda raw: (release.wait(10), decode(raw))[1]
+        for _ in range(3):
+            assert monitor.fetch_aircraft_data()
+        assert slow_server.requests == 1
+        assert slow.deadline_misses == 1 and slow.busy_skips == 2
+        assert fast.requests == 3 and fast.failures == 0
+        
+        # Once the stuck fetch finishes the source is polled again
+        release.set()
+        monitor.pending_fetches[slow].result(timeout=5)
+        monitor.fetch_aircraft_data()
+        assert slow_server.requests == 2
+    finally:
+        monitor.stop()
+
+
+class GarbageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        body = b'\x28\xb5\x2f\xfd garbage after a zstd magic number'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def garbage_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GarbageHandler)
+    server.daemon_threads = True
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.skipif(tracker.zstandard is None, reason='zstandard not installed')
+def test_undecodable_source_fails_alone_and_backs_off(server_factory, garbage_server, tmp_path):
+    bad_server, bad_url = garbage_server
+    good_server, good_url = server_factory()
+    monitor = TAR1090Monitor(f"{bad_url},{good_url}", update_interval=1, source_timeout=2,
+                             data_dir=tmp_path, feed_format='bincraft-zst')
+    try:
+        bad, good = monitor.sources
+        good.decoder = JSONFeedDecoder()
+        assert monitor.fetch_aircraft_data()
+        assert 'abc123' in monitor.aircraft
+        assert bad.failures == 1 and 'zstd' in bad.last_error
+        assert good.failures == 0
+        
+        # Backing off: the next poll leaves the bad source alone
+        assert monitor.fetch_aircraft_data()
+        assert bad_server.requests == 1 and bad.backoff_skips == 1
+        assert good_server.requests == 2
+        
+        bad.retry_at = 0.0  # Backoff over
+        monitor.fetch_aircraft_data()
+        assert bad_server.requests == 2 and bad.consecutive_failures == 2
+        assert bad.retry_at - time.monotonic() > 1.5  # Doubled
+    finally:
+        monitor.stop()
+
+
+@pytest.mark.skipif(tracker.zstandard is None, reason='zstandard not installed')
+def test_single_undecodable_source_counts_as_failed(garbage_server, tmp_path):
+    _, url = garbage_server
+    monitor = TAR1090Monitor(url, data_dir=tmp_path, feed_format='bincraft-zst')
+    try:
+        assert not monitor.fetch_aircraft_data()
+        assert monitor.sources[0].failures == 1
+        assert monitor.failed_requests == 1
+    finally:
+        monitor.stop()
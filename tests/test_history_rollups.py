@@ -0,0 +1,106 @@
+"""Rollups count committed events only, and running day totals agree with merged day tables."""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from go_around_tracker import (
+    EventStore, EventWriter, GoAroundLog, HistoryRollups, ReplayClock, TAR1090Monitor, create_flask_app
+)
+
+START = datetime(2026, 3, 1, 6)
+
+
+def event(moment, callsign='BAW12', type='A320', climb=1800.0):
+    return GoAroundLog(moment, 'abc123', callsign, 51.5, -0.4, 900.0, climb, 60, 0.9, 'http://test', type)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EventStore(tmp_path / 'events.db')
+    yield store
+    store.close()
+
+
+def test_events_count_once_committed(store):
+    rollups = HistoryRollups()
+    writer = EventWriter(store, flush_interval=60, on_written=rollups.add_many)
+    writer.submit(event(START))
+    assert rollups.stats()['total']['count'] == 0  # Still queued
+    writer.flush()
+    assert rollups.stats()['total']['count'] == 1
+    writer.close()
+    writer.submit(event(START + timedelta(hours=1)))  # Written directly after close
+    assert rollups.stats()['total']['count'] == 2
+
+
+def test_failed_batches_are_not_counted(store, monkeypatch):
+    rollups = HistoryRollups()
+    writer = EventWriter(store, on_written=rollups.add_many)
+
+    def fail(log_entries):
+        raise sqlite3.OperationalError('disk I/O error')
+
+    monkeypatch.setattr(store, 'add_many', fail)
+    writer.write([event(START)], attempts=1)
+    assert writer.dropped == 1
+    assert rollups.stats()['total']['count'] == 0
+    writer.close()
+
+
+def merged_total(rollups, first_day, last_day):
+    """Range totals the slow way: merge every day's table."""
+    cell = [0, 0, 0, None]
+    for day in rollups.day_keys:
+        if (first_day is None or day >= first_day) and (last_day is None or day <= last_day):
+            count, climbs, climb_sum, climb_max = rollups.days[day]['day'][day]
+            cell = [cell[0] + count, cell[1] + climbs, cell[2] + climb_sum,
+                    climb_max if cell[3] is None or (climb_max is not None and climb_max > cell[3]) else cell[3]]
+    return HistoryRollups.cell_stats(cell)
+
+
+def test_running_totals_match_merged_days(store):
+    rng = random.Random(7)
+    entries = [
+        event(START + timedelta(days=rng.randrange(40), hours=rng.randrange(18)),
+              callsign=rng.choice(['BAW12', 'EZY34', 'GABCD', None]),
+              climb=rng.choice([None, 1200.0, 2500.0, 3100.0]))
+        for _ in range(300)
+    ]
+    store.add_many(entries[:150])
+    rollups = HistoryRollups()
+    rollups.rebuild(store)
+    # Later events land on new days before, between and after the rebuilt ones, and on old days
+    for entry in entries[150:]:
+        rollups.add_many([entry])
+    rollups.add_many([event(START - timedelta(days=3), climb=None)])
+
+    days = rollups.day_keys
+    assert rollups.stats()['total'] == merged_total(rollups, None, None)
+    assert rollups.stats()['total']['count'] == 301
+    for _ in range(50):
+        first_day, last_day = sorted(rng.sample(days, 2))
+        assert rollups.stats(first_day, last_day)['total'] == merged_total(rollups, first_day, last_day)
+    assert rollups.stats('2026-01-01', '2026-01-31')['total'] == {
+        'count': 0, 'mean_climb_rate': None, 'max_climb_rate': None
+    }
+    assert rollups.stats(days[-1], None)['total'] == merged_total(rollups, days[-1], None)
+
+
+@pytest.mark.parametrize('path', ['/api/go_around_stats', '/api/go_around_history'])
+@pytest.mark.parametrize('value', ['1e20', '-1e20', 'inf', '-inf', 'nan', '0001-01-01', 'tomorrow'])
+def test_out_of_range_times_are_bad_requests(tmp_path, path, value):
+    monitor = TAR1090Monitor('http://test', data_dir=tmp_path, clock=ReplayClock(5000.0))
+    try:
+        client = create_flask_app(monitor).test_client()
+        for name in ('from', 'to'):
+            response = client.get(path, query_string={name: value})
+            assert response.status_code in (200, 400), (name, response.status_code)
+            if value != '0001-01-01':
+                assert response.status_code == 400
+        assert client.get('/api/go_around_stats', query_string={'from': '2026-03-01', 'to': '1772323200'}
+                          ).status_code == 200
+    finally:
+        monitor.stop()
@@ -0,0 +1,95 @@
+"""Fix timestamps from seen_pos, stale-fix skipping and go-around durations on the receiver clock."""
+
+import pytest
+
+import go_around_tracker as tracker
+from go_around_tracker import AircraftRecord, ReplayClock, Snapshot, TAR1090Monitor
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = TAR1090Monitor('http://test', data_dir=tmp_path, clock=ReplayClock(5000.0))
+    yield monitor
+    monitor.stop()
+
+
+def record(seen_pos, lat=51.5, lon=-0.4, altitude=1500.0):
+    return AircraftRecord('abc123', 'TST1', lat, lon, altitude, -700.0, 140.0, 'A320', 'A3', seen_pos)
+
+
+def test_repeated_fix_with_rounding_jitter_is_skipped(monitor):
+    monitor.ingest_snapshot(Snapshot(1000.0, [record(0.3)]), 5000.0)
+    # Same fix one poll later: readsb's 0.1 s rounding makes it look 0.1 s newer
+    assert monitor.ingest_snapshot(Snapshot(1005.0, [record(5.2)]), 5005.0) == []
+    assert monitor.stale_positions_skipped == 1
+    assert len(monitor.aircraft['abc123'].path) == 1
+
+
+def test_unchanged_position_is_skipped(monitor):
+    monitor.ingest_snapshot(Snapshot(1000.0, [record(0.3)]), 5000.0)
+    assert monitor.ingest_snapshot(Snapshot(1005.0, [record(0.2)]), 5005.0) == []
+    assert monitor.stale_positions_skipped == 1
+
+
+def test_new_fix_is_appended_at_its_receiver_time(monitor):
+    monitor.ingest_snapshot(Snapshot(1000.0, [record(0.3)]), 5000.0)
+    updated = monitor.ingest_snapshot(Snapshot(1005.0, [record(0.5, lat=51.51)]), 5005.0)
+    assert updated == [monitor.aircraft['abc123']]
+    assert monitor.aircraft['abc123'].path.last('timestamp') == pytest.approx(1004.5)
+
+
+def test_active_duration_uses_receiver_clock(monitor):
+    monitor.ingest_snapshot(Snapshot(1000.0, [record(0.0)]), 5000.0)
+    aircraft = monitor.aircraft['abc123']
+    detection = tracker.GoAroundDetection(True, 0.9, 800.0, 1500.0, 1800.0, 'test')
+    monitor.handle_detection(aircraft, detection, 1000.0)
+    # The local clock runs an hour ahead of the receiver; only receiver time may count
+    monitor.clock.now = 8600.0
+    monitor.ingest_snapshot(Snapshot(1042.0, [record(0.0, lat=51.52)]), 8600.0)
+    active = {entry['hex_id']: entry for entry in monitor.get_go_around_data()['go_arounds']}
+    assert active['abc123']['duration'] == 42
+
+
+def test_go_around_without_new_fixes_is_finished(monitor):
+    monitor.process_snapshot(Snapshot(1000.0, [record(0.0)]))
+    aircraft = monitor.aircraft['abc123']
+    detection = tracker.GoAroundDetection(True, 0.9, 800.0, 1500.0, 1800.0, 'test')
+    monitor.handle_detection(aircraft, detection, 980.0)
+    # Still in aircraft.json every poll, but with the same stale position (an MLAT dropout)
+    for step in range(1, 15):
+        monitor.clock.now = 5000.0 + step * 5
+        monitor.process_snapshot(Snapshot(1000.0 + step * 5, [record(step * 5.0)]))
+    assert 'abc123' not in monitor.active_go_arounds
+    assert 'abc123' not in monitor.aircraft
+    assert monitor.events_logged == 1
+    # Dropped from tracking but still counted as seen while it stays in the feed
+    assert 'abc123' in monitor.untracked
+    assert monitor.get_status()['total_aircraft'] == 1
+
+
+def test_aircraft_with_new_fixes_is_kept(monitor):
+    for step in range(15):
+        monitor.clock.now = 5000.0 + step * 5
+        monitor.process_snapshot(Snapshot(1000.0 + step * 5, [record(0.0, lat=51.5 + step * 0.01)]))
+    assert 'abc123' in monitor.aircraft
+
+
+def test_aircraft_evicted_for_the_point_budget_are_still_counted(tmp_path):
+    # Room for five tracks of ten points
+    monitor = TAR1090Monitor('http://test', data_dir=tmp_path, clock=ReplayClock(5000.0),
+                             track_retention=9, track_point_budget=50)
+    try:
+        first = [record(0.0)._replace(hex_id=f"a{n:05x}") for n in range(8)]
+        monitor.process_snapshot(Snapshot(1000.0, first))
+        assert len(monitor.aircraft) == 5 and monitor.track_rejections == 3
+        assert monitor.get_status()['total_aircraft'] == 8
+        
+        # Eight more: the five tracked ones make room for them, and are still counted
+        monitor.clock.now = 5005.0
+        second = [record(0.0)._replace(hex_id=f"b{n:05x}") for n in range(8)]
+        monitor.process_snapshot(Snapshot(1005.0, second))
+        assert monitor.track_evictions == 5
+        assert set(monitor.aircraft) == {f"b{n:05x}" for n in range(5)}
+        assert monitor.get_status()['total_aircraft'] == 16
+    finally:
+        monitor.stop()
@@ -0,0 +1,74 @@
+"""Adaptive poll interval: fast only for low aircraft inside a geofence, fetch deadlines fit the fast tick."""
+
+import pytest
+
+from go_around_tracker import AircraftRecord, Geofences, ReplayClock, Snapshot, TAR1090Monitor
+
+FENCES = 'EGLL:51.47,-0.46,10,5000'
+
+
+def record(hex_id, lat=51.47, lon=-0.40, altitude=1500.0, seen_pos=0.0):
+    return AircraftRecord(hex_id, 'TST1', lat, lon, altitude, -700.0, 140.0, 'A320', 'A3', seen_pos)
+
+
+def make_monitor(tmp_path, geofences=FENCES, **kwargs):
+    return TAR1090Monitor('http://test', update_interval=5, fast_interval=1, idle_interval=30, data_dir=tmp_path,
+                          clock=ReplayClock(5000.0), geofences=Geofences.parse(geofences) if geofences else None,
+                          **kwargs)
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = make_monitor(tmp_path)
+    yield monitor
+    monitor.stop()
+
+
+def test_fetch_deadline_fits_the_fast_interval(tmp_path):
+    monitor = make_monitor(tmp_path)
+    try:
+        assert monitor.sources[0].timeout == pytest.approx(0.8)
+    finally:
+        monitor.stop()
+    monitor = make_monitor(tmp_path, source_timeout=0.5)
+    try:
+        assert monitor.sources[0].timeout == 0.5
+    finally:
+        monitor.stop()
+
+
+def test_low_aircraft_inside_a_fence_selects_the_fast_interval(monitor):
+    monitor.clock.now = 5000.0
+    monitor.process_snapshot(Snapshot(1000.0, [record('abc123')]))
+    assert monitor.low_aircraft == 1
+    assert monitor.next_interval() == 1
+
+
+def test_high_aircraft_selects_the_normal_interval(monitor):
+    monitor.process_snapshot(Snapshot(1000.0, [record('abc123', altitude=4000.0)]))
+    assert monitor.low_aircraft == 0
+    assert monitor.next_interval() == 5
+
+
+def test_skipped_fix_keeps_the_fast_interval(monitor):
+    monitor.process_snapshot(Snapshot(1000.0, [record('abc123', seen_pos=0.0)]))
+    monitor.clock.now = 5005.0
+    # Same fix again: no new position this poll, but the aircraft is still low in the fence
+    monitor.process_snapshot(Snapshot(1005.0, [record('abc123', seen_pos=5.0)]))
+    assert monitor.stale_positions_skipped == 1
+    assert monitor.next_interval() == 1
+
+
+def test_without_geofences_low_aircraft_do_not_select_the_fast_interval(tmp_path):
+    monitor = make_monitor(tmp_path, geofences=None)
+    try:
+        monitor.process_snapshot(Snapshot(1000.0, [record('abc123', lat=40.0, lon=-74.0)]))
+        assert 'abc123' in monitor.aircraft
+        assert monitor.low_aircraft == 0
+        assert monitor.next_interval() == 5
+    finally:
+        monitor.stop()
+
+
+def test_empty_sky_selects_the_idle_interval(monitor):
+    assert monitor.next_interval() == 30
@@ -0,0 +1,89 @@
+"""Concurrent API readers against a fast synthetic feed: every answer must come from a published read model."""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from go_around_tracker import ReplayClock, TAR1090Monitor, create_flask_app, extract_snapshot
+
+STRESS_SECONDS = 2
+READERS = 4
+PATHS = (
+    '/api/go_arounds', '/api/go_arounds?since={seq}', '/api/health',
+    '/api/go_around_history?limit=20', '/api/go_around_stats'
+)
+
+
+@pytest.fixture
+def quiet_logs():
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def test_readers_never_see_errors_while_the_feed_runs(synthetic_feed, tmp_path, quiet_logs):
+    clock = ReplayClock(synthetic_feed.now)
+    monitor = TAR1090Monitor('http://stress', data_dir=tmp_path, clock=clock)
+    monitor.running = True
+    app = create_flask_app(monitor)
+    stop = threading.Event()
+    published = threading.Event()  # Set once the feed thread has published its first poll
+    polls = []
+    results: Counter = Counter()
+    failures = []
+    
+    def feed():
+        # No sleep between polls
+        while not stop.is_set():
+            data = synthetic_feed.step()
+            clock.now = synthetic_feed.now
+            monitor.process_snapshot(extract_snapshot(data))
+            monitor.publish_api_snapshot()
+            published.set()
+            polls.append(clock.now)
+    
+    def reader():
+        client = app.test_client()
+        last_seq = 0
+        index = 0
+        while not stop.is_set():
+            path = PATHS[index % len(PATHS)].format(seq=last_seq)
+            index += 1
+            before_first_poll = not published.is_set()
+            try:
+                response = client.get(path)
+            except Exception as e:
+                failures.append(f"{path}: {type(e).__name__}: {e}")
+                continue
+            status = response.status_code
+            results[status] += 1
+            if status == 503 and path == '/api/health' and before_first_poll:
+                continue  # Nothing polled yet: unhealthy is the right answer
+            if status not in (200, 304):
+                failures.append(f"{path}: HTTP {status}")
+                continue
+            if status == 304:
+                continue
+            data = json.loads(response.data)
+            seq = data.get('seq')
+            if seq is not None and path.startswith('/api/go_arounds'):
+                if seq < last_seq:
+                    failures.append(f"{path}: seq went backwards {last_seq} -> {seq}")
+                last_seq = seq
+    
+    threads = [threading.Thread(target=feed)] + [threading.Thread(target=reader) for _ in range(READERS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(STRESS_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join(10)
+    monitor.stop()
+    
+    assert len(polls) >= 5, 'feed thread barely ran'
+    assert sum(results.values()) >= 50, dict(results)
+    assert not failures, Counter(failures).most_common(5)